@@ -1,5 +1,6 @@
 # 2 File of python learning Python02.py
 import time
+from term_render import animate, wipe
 time.sleep(2)
 print("    /___________|")
 print("   /            |")
@@ -10,7 +11,7 @@ print("/_______________|")
 time.sleep(3)
 print("\n\n\n")
 # AI taking programer job
-print(""" 
+ai_art = """ 
           Me
       ⠀⣠⣶⣶⣦⡀
 ⠀⠀⠀⠀⠀⠀⢰⣿⣿⣿⣿⣿⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
@@ -24,4 +25,5 @@ print("""
 ⠀⠀⠀⠀⢿⣿⣿⡇⢻⣿⣿⣿⣷⣶⣿⣿⣿⣿⣿⣷⠀⠀⠀⠀
 ⠀⠀⠀⠀⢸⣿⣿⣇⢸⣿⣿⡟⠙⠛⠻⣿⣿⣿⣿⡇⠀⠀⠀⠀
 ⣴⣿⣿⣿⣿⣿⣿⣿⣠⣿⣿⡇⠀⠀⠀⠉⠛⣽⣿⣇⣀⣀⣀⠀
-⠙⠻⠿⠿⠿⠿⠿⠟⠿⠿⠿⠇⠀⠀⠀⠀⠀⠻⠿⠿⠛⠛⠛⠃ """)
\ No newline at end of file
+⠙⠻⠿⠿⠿⠿⠿⠟⠿⠿⠿⠇⠀⠀⠀⠀⠀⠻⠿⠿⠛⠛⠛⠃ """
+animate(wipe(ai_art))
\ No newline at end of file
@@ -1,6 +1,7 @@
 # My 3th file of Python03.py
 # Variables & Data Types
 import time
+from text_transform import TextTransformer
 time.sleep(0.1)
 print("Variables & Data Types\n")
 
@@ -18,6 +19,10 @@ print(Perplexity.title(),"\n\n")
 print(Meme.replace("instagrameee","instagram"),type(Meme),"\n")
 print(Meme.title(),type(Meme),"\n")
 
+# Both at once: every replace rule and the casing in a single pass
+fix_and_title = TextTransformer({"instagrameee": "instagram", "culture": "kulture"}, case="title")
+print(fix_and_title.transform(Meme),"\n")
+
 
 Str_Num = "5003"
 Num = 384
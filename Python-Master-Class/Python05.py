@@ -30,3 +30,11 @@ print(round(5.6)) #rounding the number like 5.6 to 6
 print(floor(30.6)) #Grab the lowest number like this 30.6 to 30
 print(ceil(30.2)) #this is gonna be opposite like from floor it gonna be round the number up 30.2 to 31
 print(sqrt(36)) #this is find out square root like 36 come 6
+
+# The same functions over a whole list at once, from math_kernels.py
+import math_kernels
+numbers = [30.6, 30.2, -7, 36]
+print(math_kernels.floor(numbers)) #[30, 30, -7, 36] as floats
+print(math_kernels.ceil(numbers))
+print(math_kernels.abs(numbers))
+print(math_kernels.sqrt(numbers, policy="mask")) #-7 has no real square root, so it is masked out
\ No newline at end of file
@@ -2,9 +2,13 @@
 # Getting input from user
 import time
 from math import *
+import math_kernels
 
 time.sleep(0.5)
 age = int(input("Enter Your Age : "))
 name = str(input("Enter Your Name : "))
-print("\nYour Age Square root is : ",sqrt(age))
+try:
+    print("\nYour Age Square root is : ",math_kernels.sqrt(age, policy="raise"))
+except math_kernels.MathDomainError:
+    print("\nA negative age has no real square root")
 print(f"And Bye the way Nice to Meet you {name}")
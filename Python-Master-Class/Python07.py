@@ -2,11 +2,12 @@
 # Building a Basic Calculator
 import time
 from math import *
+from expression_engine import ExpressionError, evaluate
 
 num_1 = int(input("Enter Your 1st Number : "))
 num_2 = int(input("Enter Your 2th Number : "))
-choice = input("What Your want type +,*,%,- : ")
-error = "Error Bro You have Only these options +,*,%,- try again"
+choice = input("What Your want type +,*,/,%,- : ")
+error = "Error Bro You have Only these options +,*,/,%,- try again"
 
 if(choice == '+'):
     print("Your Sum : ",num_1 + num_2)
@@ -14,12 +15,25 @@ if(choice == '+'):
 elif(choice == '*'):
     print("Multiples : ",num_1 * num_2)
 
+elif(choice == '/'):
+    try:
+        print("Your Division : ",evaluate("a / b", a=num_1, b=num_2))
+    except ExpressionError as e:
+        print(e)
+
 elif(choice == '%'):
-    print("Your Remainder : ",num_1 % num_2)
+    try:
+        print("Your Remainder : ",evaluate("a % b", a=num_1, b=num_2))
+    except ExpressionError as e:
+        print(e)
 
 
 elif(choice == '-'):
     print(": ",num_1 - num_2)
 
 else:
-    print(error.title)
\ No newline at end of file
+    # Anything else is treated as a full expression, e.g. (a + b) * 2 / a
+    try:
+        print("Your Answer : ",evaluate(choice, a=num_1, b=num_2))
+    except ExpressionError:
+        print(error.title())
\ No newline at end of file
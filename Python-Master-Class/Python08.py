@@ -3,6 +3,7 @@
 import time
 from math import *
 import subprocess
+from indexed_list import IndexedList
 import os
 
 time.sleep(0.2)
@@ -25,7 +26,7 @@ time.sleep(0.2)
 # print(list_[0],"\n",list_[1],"\n",list_[2])
 print("\n\n")
 
-_list2 = [1,2,3,4,5,6,7,8,9,10]
+_list2 = IndexedList([1,2,3,4,5,6,7,8,9,10])
 _list = ["Mohlu","Monu","Noni","khusu","gatik","pawan"]
 p = _list[5] = "pawan gand maro"
 print(_list)
@@ -35,7 +36,7 @@ _list2.append("Tum-Sub-Ki-MAA-Ka-Bhosda")
 _list2.insert(2,"land")
 _list2.remove("land")
 t = _list2.index("Mohlu")
-print(_list2,'\n',f"index is {t}")
+print(list(_list2),'\n',f"index is {t}")
 
 copy_list = _list2.copy()
-print(copy_list)
\ No newline at end of file
+print(list(copy_list))
\ No newline at end of file
@@ -4,11 +4,13 @@ import time
 from math import *
 import subprocess
 import os 
+from memo_cache import memoize
 time.sleep(0.1)
 info = "\n\nReturn Statement in Python\n\n"
 print(info.title())
 
 
+@memoize(maxsize=1024)
 def number(num):
     return num*num*num
 print(number(2))
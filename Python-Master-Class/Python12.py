@@ -3,6 +3,7 @@
 import time
 import subprocess
 import os
+from threshold_rules import DRIVING_RULES
 time.sleep(0.2)
 info = "\n\nIf Statements in Python code Python12.py\n\n"
 print(info.title())
@@ -10,24 +11,5 @@ print(info.title())
 time.sleep(0.01)
 age = int(input("Enter Your Age : "))
 
-condi = 18
-condi2 = 17
-condi3 = 16
-condi4 = 14
-
-
-
-if(age >= condi):
-    print("\n\nYou can drive\n\n")
-
-elif(age == condi2):
-    print("\n\nWait 1year fucking teenager\n\n")
-
-elif(age > condi3):
-    print("\n\nYou cant not drive fucking kid\n\n")
-
-elif(age < 14):
-    print("\n\nAre you mentel kid\n\n")
-
-else:
-    print("\n\nEror enter Rigth Value again\n\n")
\ No newline at end of file
+# Ranges are [low, high): 0-13, 14-16, 17, 18+; anything else is invalid
+print(DRIVING_RULES.classify(age))
\ No newline at end of file
@@ -3,11 +3,13 @@
 import subprocess
 import os
 import time
+from memo_cache import memoize
 info = "If Statements & Comparisons"
 time.sleep(0.1)
 print(info.title())
 
 
+@memoize(maxsize=1024)
 def number(num1,num2,num3):
     if(num1 >= num2 and num1 >= num3):
         h = f"Your 1st Number is bigger : {num1}"
@@ -3,6 +3,7 @@
 import time
 import os
 import subprocess
+from columnar import ColumnTable
 time.sleep(0.06)
 info = "\n\nDictionaries in Python14.py File\n\n"
 print(info.title())
@@ -26,5 +27,7 @@ user_friend = {
     "location": ["gurugram","ch","ch","ch","ch","ch"]
 }
 
-for name, locatio in user_friend.items():
-    print("\n\n",f"Name : {name}","     ",f"Location : {locatio}")
\ No newline at end of file
+friends = ColumnTable.from_dict(user_friend)
+
+for friend in friends.rows():
+    print("\n\n",f"Name : {friend['name']}","     ",f"Location : {friend['location']}")
\ No newline at end of file
@@ -5,25 +5,23 @@ import subprocess
 from math import *
 import time
 import random
+from guess_engine import CORRECT, HINTS, GuessGame
 info = "Building a Guessing Game In Python16.py"
 time.sleep(0.1)
 print("\n\n",info.title(),"\n\n")
 
 guess_name = "Yogesh"
-guess = ""
 guess_limit = 6
-guess_count = 0
-out_of_guess = False
+game = GuessGame(guess_name, guess_limit)
 
-while(guess_name != guess and not(out_of_guess)):
-    if(guess_count < guess_limit):
-        guess = input("Enter Your Guess : ")
-        guess_count += 1
-    else:
-        out_of_guess = True
+while not game.over:
+    guess = input("Enter Your Guess : ")
+    result = game.guess(guess)
+    if result != CORRECT:
+        print(HINTS[result], f"(alphabetically), {game.remaining} guesses left")
 
-if out_of_guess == True:
-    print("You Lose")
+if game.won:
+    print("You win")
 
 else:
-    print("You win")
\ No newline at end of file
+    print("You Lose")
\ No newline at end of file
@@ -5,17 +5,29 @@ import random
 import os
 import subprocess
 from math import *
+from memo_cache import memoize
+from power_engine import PowerLimitError, iter_digits, power
 info = ("Exponent Function in Python18.py File")
 time.sleep(0.2)
 print("\n\n",info.title(),"\n\n")
 
 
-def raise_to_power(num1,num2):
-    c =  num1**num2
+# Huge results stay cached, so keep only a few of them
+@memoize(maxsize=32)
+def raise_to_power(num1,num2,mod=None):
+    c = power(num1, num2, mod)
     return c
 
 ask_num1 = int((input("Enter Your Number One : ")))
 ask_num2 = int((input("Enter Your Number You Want to Raise to Power : ")))
+ask_mod = input("Enter Mod (leave empty for none) : ").strip()
 
-con = raise_to_power(ask_num1,ask_num2)
-print(f"Your Value is : {con} ")
\ No newline at end of file
+try:
+    con = raise_to_power(ask_num1,ask_num2,int(ask_mod) if ask_mod else None)
+    # Big results are printed in chunks instead of one giant string
+    print("Your Value is : ", end="")
+    for digits in iter_digits(con):
+        print(digits, end="")
+    print()
+except (PowerLimitError, ValueError) as e:
+    print(e)
\ No newline at end of file
@@ -1,12 +1,13 @@
 # This Is My 19th Python19.py File
 # Try\Except
 import time
+from numeric_input import AGE, NumericInputError, parse_value
 info = '"Try and Except In Python19.py File"'
 time.sleep(0.2)
 print("\n\n",info.title(),"\n\n")
 try:
    
-   Age = int(input("Enter Your Age: "))
+   Age = parse_value(input("Enter Your Age: "), AGE)
    print(f"Your Age {Age}")
-except:
-   print("INVALID INPUT")
\ No newline at end of file
+except NumericInputError as error:
+   print(f"INVALID INPUT : {error}")
\ No newline at end of file
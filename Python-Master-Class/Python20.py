@@ -1,29 +1,35 @@
 # This Is My 20th Python20.py File
 # Reading Files
 import time
+from pathlib import Path
+from file_io import AppendBuffer, MappedTextFile, iter_lines, write_text
+from text_index import TextIndex
 info = "Reading Files From Python20.txt"
 time.sleep(0.2)
 print('\n\n',info.title(),"\n\n")
 
+# Works from any folder and on Linux/Mac/Windows
+python20txt_ = Path(__file__).with_name("Python20.txt")
 
 
 # reading file
 
-python20txt_ =  open("Python-Master-Class/Python20.txt", "r") 
-
-file = python20txt_.readlines()
+file = list(iter_lines(python20txt_, keepends=True))
 print(file)
 # To print line by line 
-for textfile in python20txt_.readlines():
+for textfile in iter_lines(python20txt_):
     print(textfile)
 
+# jump straight to one line without reading the rest
+with MappedTextFile(python20txt_) as mapped:
+    print(mapped[0])
+
 
 
 
 # write file 
 
-txt_file = open("Python-Master-Class\Python20.txt", "w")
-text_file = txt_file.write('''Hello My Name is Yogesh And I am 16 Year Old Boy.
+text_file = write_text(python20txt_, '''Hello My Name is Yogesh And I am 16 Year Old Boy.
 \nI like Coding My Fav Machine Language is Python.
 \nAnd i Know Little Bit HTML, AND CSS.I just Drop this Line from Python code\n''')
 
@@ -31,10 +37,12 @@ print(text_file)
 
 
 # append file
-txt_file = open("Python-Master-Class\Python20.txt", "a")
-text_file = txt_file.write("\n\nI Just Drop This Line From Python Code.")
-print(text_file)
+with AppendBuffer(python20txt_) as txt_file:
+    txt_file.append("\n\nI Just Drop This Line From Python Code.")
 
-txt_file.close()
-python20txt_.close()
 
+# count words without reading the file again and again
+with TextIndex(":memory:") as index:
+    index.add([python20txt_])
+    for word, count in index.word_frequencies(5):
+        print(f"{word} : {count}")
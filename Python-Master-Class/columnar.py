@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Columnar Record Store for the Python14 friend dictionary
+A struct-of-arrays table like user_friend: ints and floats live in typed
+array columns, strings are dictionary-encoded into integer codes. Supports
+row iteration, filter/project/group-by and hash indexes on chosen columns.
+Filters run on zero-copy NumPy views of the columns when NumPy is installed.
+"""
+
+import operator
+import sys
+import time
+import argparse
+from array import array
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+# Third-party imports with graceful fallbacks
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+_OPERATORS: Dict[str, Callable] = {
+    "==": operator.eq, "!=": operator.ne, "<": operator.lt,
+    "<=": operator.le, ">": operator.gt, ">=": operator.ge,
+}
+_AGGREGATES = ("count", "sum", "mean", "min", "max")
+
+
+class Column:
+    """One typed column: array('q'), array('d') or dictionary-encoded strings"""
+
+    __slots__ = ("kind", "data", "values", "_codes", "_shared")
+
+    def __init__(self, kind: str):
+        if kind not in ("int", "float", "str"):
+            raise ValueError(f"Unknown column kind {kind!r}")
+        self.kind = kind
+        self.data = array({"int": "q", "float": "d", "str": "I"}[kind])
+        self.values: List[Any] = []  # distinct strings, indexed by code
+        self._codes: Dict[Any, int] = {}
+        self._shared = False
+
+    @classmethod
+    def from_values(cls, values: Sequence[Any], kind: Optional[str] = None) -> "Column":
+        column = cls(kind or infer_kind(values))
+        column.extend(values)
+        return column
+
+    def append(self, value):
+        if self.kind == "str":
+            code = self._codes.get(value)
+            if code is None:
+                if self._shared:
+                    # Dictionary borrowed from the column this one was taken from
+                    self.values = list(self.values)
+                    self._codes = dict(self._codes)
+                    self._shared = False
+                code = self._codes[value] = len(self.values)
+                self.values.append(value)
+            self.data.append(code)
+        else:
+            self.data.append(value)
+
+    def extend(self, values: Iterable[Any]):
+        if self.kind == "str":
+            for value in values:
+                self.append(value)
+        else:
+            self.data.extend(values)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, index: int):
+        if self.kind == "str":
+            return self.values[self.data[index]]
+        return self.data[index]
+
+    def __iter__(self) -> Iterator[Any]:
+        if self.kind == "str":
+            values = self.values
+            return (values[code] for code in self.data)
+        return iter(self.data)
+
+    def take(self, indices: Sequence[int]) -> "Column":
+        """New column holding the given rows"""
+        result = Column(self.kind)
+        if self.kind == "str":
+            # Share the dictionary; both sides copy it before adding a code
+            result.values = self.values
+            result._codes = self._codes
+            result._shared = self._shared = True
+        if NUMPY_AVAILABLE and isinstance(indices, np.ndarray):
+            result.data.frombytes(self.view()[indices].tobytes())
+        else:
+            data = self.data
+            result.data.extend([data[i] for i in indices])
+        return result
+
+    def view(self):
+        """Zero-copy NumPy view of the stored numbers or codes"""
+        return np.frombuffer(self.data, dtype={"q": np.int64, "d": np.float64, "I": np.uint32}[self.data.typecode])
+
+    def matching_rows(self, op: str, value) -> Sequence[int]:
+        """Row numbers where `row op value` holds"""
+        compare = _OPERATORS[op]
+        if self.kind == "str":
+            if op in ("==", "!="):
+                code = self._codes.get(value)
+                if code is None:
+                    return range(len(self)) if op == "!=" else []
+                target = code
+                data = self.data
+            else:
+                # Ordering compares decoded strings, evaluated once per distinct value
+                accepted = {code for code, text in enumerate(self.values) if compare(text, value)}
+                if NUMPY_AVAILABLE:
+                    return np.flatnonzero(np.isin(self.view(), list(accepted)))
+                return [i for i, code in enumerate(self.data) if code in accepted]
+        else:
+            target = value
+            data = self.data
+        if NUMPY_AVAILABLE:
+            return np.flatnonzero(compare(self.view(), target))
+        return [i for i, item in enumerate(data) if compare(item, target)]
+
+    def memory_usage(self) -> int:
+        total = sys.getsizeof(self.data)
+        if self.kind == "str":
+            total += sys.getsizeof(self.values) + sum(sys.getsizeof(v) for v in self.values)
+            total += sys.getsizeof(self._codes)
+        return total
+
+
+def infer_kind(values: Iterable[Any]) -> str:
+    """int, float or str for a column of Python values"""
+    kind = "int"
+    for value in values:
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return "str"
+        if isinstance(value, float):
+            kind = "float"
+    return kind
+
+
+class ColumnTable:
+    """Table stored column by column, with optional hash indexes"""
+
+    def __init__(self, columns: Optional[Mapping[str, Column]] = None):
+        self.columns: Dict[str, Column] = dict(columns or {})
+        lengths = {len(column) for column in self.columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same length")
+        self._indexes: Dict[str, Dict[Any, array]] = {}
+
+    # Construction
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Sequence[Any]]) -> "ColumnTable":
+        """Build from a dict of parallel lists, like user_friend"""
+        return cls({name: Column.from_values(values) for name, values in data.items()})
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Mapping[str, Any]]) -> "ColumnTable":
+        """Build from a list of dicts"""
+        rows = list(rows)
+        if not rows:
+            return cls()
+        names = list(rows[0])
+        return cls.from_dict({name: [row[name] for row in rows] for name in names})
+
+    def append(self, row: Mapping[str, Any]):
+        """Add one row, keeping any hash indexes up to date"""
+        position = len(self)
+        for name, column in self.columns.items():
+            column.append(row[name])
+        for name, index in self._indexes.items():
+            index.setdefault(row[name], array("I")).append(position)
+
+    # Shape and rows
+    @property
+    def names(self) -> List[str]:
+        return list(self.columns)
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """One row as a dict"""
+        return {name: column[index] for name, column in self.columns.items()}
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        """Every row as a dict"""
+        names = self.names
+        for values in zip(*self.columns.values()):
+            yield dict(zip(names, values))
+
+    def tuples(self) -> Iterator[Tuple]:
+        """Every row as a tuple in column order (cheaper than rows())"""
+        return zip(*self.columns.values())
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return self.rows()
+
+    # Relational operations
+    def take(self, indices: Sequence[int]) -> "ColumnTable":
+        """New table with only the given rows"""
+        return ColumnTable({name: column.take(indices) for name, column in self.columns.items()})
+
+    def filter(self, column: str, op: str = "==", value: Any = None) -> "ColumnTable":
+        """Rows where `column op value`, served from a hash index for == when present"""
+        if op == "==" and column in self._indexes:
+            return self.take(self._indexes[column].get(value, array("I")))
+        return self.take(self.columns[column].matching_rows(op, value))
+
+    def where(self, predicate: Callable[[Dict[str, Any]], bool]) -> "ColumnTable":
+        """Rows for which predicate(row dict) is true (row at a time)"""
+        return self.take([i for i, row in enumerate(self.rows()) if predicate(row)])
+
+    def project(self, *names: str) -> "ColumnTable":
+        """Only the named columns, sharing their storage (treat as read-only)"""
+        return ColumnTable({name: self.columns[name] for name in names})
+
+    def group_by(self, key: str, column: Optional[str] = None,
+                 aggregates: Sequence[str] = ("count",)) -> Dict[Any, Dict[str, float]]:
+        """key value -> {aggregate: result} over column"""
+        for aggregate in aggregates:
+            if aggregate not in _AGGREGATES:
+                raise ValueError(f"Unknown aggregate {aggregate!r}, use one of {_AGGREGATES}")
+            if aggregate != "count" and not column:
+                raise ValueError(f"Aggregate {aggregate!r} needs a column")
+        groups: Dict[Any, List] = {}
+        keys = self.columns[key]
+        values = self.columns[column] if column else keys
+        for group_key, value in zip(keys, values):
+            state = groups.get(group_key)
+            if state is None:
+                groups[group_key] = [1, value, value, value]
+            else:
+                state[0] += 1
+                if column:
+                    state[1] += value
+                    if value < state[2]:
+                        state[2] = value
+                    if value > state[3]:
+                        state[3] = value
+        result = {}
+        for group_key, (count, total, low, high) in groups.items():
+            summary = {}
+            for aggregate in aggregates:
+                if aggregate == "count":
+                    summary["count"] = count
+                elif aggregate == "sum":
+                    summary["sum"] = total
+                elif aggregate == "mean":
+                    summary["mean"] = total / count
+                elif aggregate == "min":
+                    summary["min"] = low
+                else:
+                    summary["max"] = high
+            result[group_key] = summary
+        return result
+
+    # Indexes
+    def create_index(self, column: str):
+        """Hash index value -> row numbers, used by filter(column, "==", value)"""
+        index: Dict[Any, array] = {}
+        for position, value in enumerate(self.columns[column]):
+            rows = index.get(value)
+            if rows is None:
+                index[value] = rows = array("I")
+            rows.append(position)
+        self._indexes[column] = index
+
+    def lookup(self, column: str, value: Any) -> List[Dict[str, Any]]:
+        """Rows whose column equals value, as dicts"""
+        if column not in self._indexes:
+            self.create_index(column)
+        return [self.row(i) for i in self._indexes[column].get(value, ())]
+
+    def memory_usage(self) -> int:
+        """Approximate bytes held by the columns (indexes excluded)"""
+        return sum(column.memory_usage() for column in self.columns.values())
+
+    def __repr__(self) -> str:
+        return f"ColumnTable({len(self):,} rows x {self.names})"
+
+
+def benchmark(rows: int = 1_000_000):
+    """Compare memory and scan speed with a list of dicts"""
+    import random
+    import tracemalloc
+    random.seed(9)
+    cities = ["gurugram", "ch", "delhi", "mumbai", "pune"]
+    data = {
+        "name": [f"friend{i}" for i in range(rows)],
+        "Age": [random.randint(10, 60) for _ in range(rows)],
+        "location": [random.choice(cities) for _ in range(rows)],
+    }
+
+    tracemalloc.start()
+    records = [{"name": n, "Age": a, "location": l}
+               for n, a, l in zip(data["name"], data["Age"], data["location"])]
+    list_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    tracemalloc.start()
+    table = ColumnTable.from_dict(data)
+    table_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"{rows:,} rows  list-of-dicts {list_bytes / rows:6.1f} B/row   "
+          f"columnar {table_bytes / rows:6.1f} B/row")
+
+    start = time.perf_counter()
+    adults = [r for r in records if r["Age"] >= 18]
+    list_filter = time.perf_counter() - start
+    start = time.perf_counter()
+    table_adults = table.filter("Age", ">=", 18)
+    table_filter = time.perf_counter() - start
+    assert len(adults) == len(table_adults)
+    print(f"filter Age >= 18      list {list_filter:.3f}s   columnar {table_filter:.3f}s")
+
+    start = time.perf_counter()
+    total = sum(r["Age"] for r in records)
+    list_scan = time.perf_counter() - start
+    start = time.perf_counter()
+    column_total = int(table.columns["Age"].view().sum()) if NUMPY_AVAILABLE else sum(table.columns["Age"])
+    table_scan = time.perf_counter() - start
+    assert total == column_total
+    print(f"sum(Age)              list {list_scan:.3f}s   columnar {table_scan:.3f}s")
+
+    start = time.perf_counter()
+    in_ch = [r for r in records if r["location"] == "ch"]
+    list_eq = time.perf_counter() - start
+    start = time.perf_counter()
+    table_ch = table.filter("location", "==", "ch")
+    table_eq = time.perf_counter() - start
+    assert len(in_ch) == len(table_ch)
+    print(f"location == 'ch'      list {list_eq:.3f}s   columnar {table_eq:.3f}s")
+
+    start = time.perf_counter()
+    table.group_by("location", "Age", ("count", "mean"))
+    print(f"group_by location     columnar {time.perf_counter() - start:.3f}s")
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Columnar record store")
+    parser.add_argument("--benchmark", type=int, default=1_000_000, metavar="ROWS")
+    args = parser.parse_args()
+    benchmark(args.benchmark)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+Container Benchmark Suite for the list, tuple, dict and set lessons
+Runs the operations Python08 (list), Python09 (tuple), Python14 (dict) and
+Python-Test/2/Python04 (set) demo at 10^3 to 10^7 elements, next to array,
+__slots__ and columnar alternatives. Time comes from timeit, memory from
+tracemalloc and sys.getsizeof; results go out as JSON and as a table.
+"""
+
+import bisect
+import json
+import platform
+import sys
+import time
+import timeit
+import tracemalloc
+import argparse
+from array import array
+from collections import namedtuple
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from columnar import ColumnTable
+from indexed_list import IndexedList
+
+# The set lesson's engine lives in Python-Test/2; it joins the set group
+# when that folder is on PYTHONPATH
+try:
+    from compact_set import CompactIntSet
+    COMPACT_SET_AVAILABLE = True
+except ImportError:
+    COMPACT_SET_AVAILABLE = False
+
+GROUPS = ("list", "tuple", "dict", "set", "records")
+COMPACT_SET_HINT = "run with PYTHONPATH=../Python-Test/2 (from Python-Master-Class) to include it"
+
+
+@dataclass
+class TimeResult:
+    group: str
+    container: str
+    operation: str
+    size: int
+    seconds: float  # best time for one operation
+    loops: int
+
+
+@dataclass
+class MemoryResult:
+    group: str
+    container: str
+    size: int
+    traced_bytes: int   # everything allocated while building (deep)
+    shallow_bytes: int  # sys.getsizeof of the container object itself
+
+
+# Record types for the tuple/dict lessons' name/age/location data
+RecordTuple = namedtuple("RecordTuple", "name age location")
+
+
+class RecordSlots:
+    __slots__ = ("name", "age", "location")
+
+    def __init__(self, name, age, location):
+        self.name = name
+        self.age = age
+        self.location = location
+
+
+class RecordPlain:
+    def __init__(self, name, age, location):
+        self.name = name
+        self.age = age
+        self.location = location
+
+
+class SortedArrayMap:
+    """Array-backed int -> int map: sorted keys plus parallel values, bisect lookups"""
+
+    def __init__(self, items):
+        pairs = sorted(items)
+        self.keys = array("q", (k for k, _ in pairs))
+        self.values = array("q", (v for _, v in pairs))
+
+    def get(self, key, default=None):
+        index = bisect.bisect_left(self.keys, key)
+        if index < len(self.keys) and self.keys[index] == key:
+            return self.values[index]
+        return default
+
+    def __contains__(self, key) -> bool:
+        return self.get(key) is not None
+
+
+# Each case: container name -> builder(n); operations: name -> factory(container, n) -> callable
+def _list_cases() -> Tuple[Dict[str, Callable], Dict[str, Callable]]:
+    builders = {
+        "list": lambda n: list(range(n)),
+        "array('q')": lambda n: array("q", range(n)),
+        "IndexedList": lambda n: IndexedList(range(n)),
+    }
+
+    def insert_remove(seq, n):
+        def run():
+            seq.insert(n // 2, -1)
+            seq.remove(-1)
+        return run
+
+    def extend_trim(seq, n):
+        extra = list(range(1000))
+
+        def run():
+            seq.extend(extra)
+            for _ in range(1000):
+                seq.pop()
+        return run
+
+    operations = {
+        "index(last)": lambda seq, n: lambda: seq.index(n - 1),
+        "in (miss)": lambda seq, n: lambda: -5 in seq,
+        "append+pop": lambda seq, n: lambda: (seq.append(7), seq.pop()),
+        "insert+remove mid": insert_remove,
+        "extend 1k+trim": extend_trim,
+        "slice [1:5]": lambda seq, n: lambda: seq[1:5],
+        "copy": lambda seq, n: (lambda: seq[:]) if isinstance(seq, array) else seq.copy,
+    }
+    return builders, operations
+
+
+def _tuple_cases():
+    builders = {
+        "tuple": lambda n: tuple(range(n)),
+        "list": lambda n: list(range(n)),
+        "array('q')": lambda n: array("q", range(n)),
+    }
+    operations = {
+        "index(last)": lambda seq, n: lambda: seq.index(n - 1),
+        "in (miss)": lambda seq, n: lambda: -5 in seq,
+        "item [n//2]": lambda seq, n: lambda: seq[n // 2],
+        "iterate": lambda seq, n: lambda: sum(seq),
+        "hash": lambda seq, n: (lambda: hash(seq)) if isinstance(seq, tuple) else None,
+    }
+    return builders, operations
+
+
+def _dict_cases():
+    builders = {
+        "dict": lambda n: {i: i for i in range(n)},
+        "SortedArrayMap": lambda n: SortedArrayMap((i, i) for i in range(n)),
+    }
+
+    def insert_delete(mapping, n):
+        if not isinstance(mapping, dict):
+            return None
+
+        def run():
+            mapping[-1] = 1
+            del mapping[-1]
+        return run
+
+    operations = {
+        "get (hit)": lambda m, n: lambda: m.get(n // 2),
+        "get (miss)": lambda m, n: lambda: m.get(-5),
+        "in (hit)": lambda m, n: lambda: (n // 3) in m,
+        "insert+delete": insert_delete,
+        "copy": lambda m, n: m.copy if isinstance(m, dict) else None,
+        "items()": lambda m, n: (lambda: sum(1 for _ in m.items())) if isinstance(m, dict) else None,
+    }
+    return builders, operations
+
+
+def _set_cases():
+    builders = {
+        "set": lambda n: set(range(0, 2 * n, 2)),
+        "frozenset": lambda n: frozenset(range(0, 2 * n, 2)),
+    }
+    if COMPACT_SET_AVAILABLE:
+        builders["CompactIntSet"] = lambda n: CompactIntSet(range(0, 2 * n, 2))
+    else:
+        print(f"  set: CompactIntSet skipped, compact_set is not importable; {COMPACT_SET_HINT}",
+              file=sys.stderr)
+    others: Dict[Tuple[type, int], Any] = {}
+
+    def other(container, n):
+        # A same-kind operand overlapping half of the container
+        key = (type(container), n)
+        if key not in others:
+            others[key] = type(container)(range(n, 3 * n, 2))
+        return others[key]
+
+    def add_discard(s, n):
+        if isinstance(s, frozenset):
+            return None
+
+        def run():
+            s.add(1)  # odd, so never already present
+            s.discard(1)
+        return run
+
+    operations = {
+        "in (hit)": lambda s, n: lambda: (n // 2) * 2 in s,
+        "in (miss)": lambda s, n: lambda: 1 in s,
+        "add+discard": add_discard,
+        "union": lambda s, n: (lambda o: lambda: s | o)(other(s, n)),
+        "intersection": lambda s, n: (lambda o: lambda: s & o)(other(s, n)),
+        "difference": lambda s, n: (lambda o: lambda: s - o)(other(s, n)),
+    }
+    return builders, operations
+
+
+def _records_cases():
+    locations = ("gurugram", "ch", "delhi")
+
+    def rows(n):
+        return ((f"friend{i}", 10 + i % 50, locations[i % 3]) for i in range(n))
+
+    builders = {
+        "list[tuple]": lambda n: list(rows(n)),
+        "list[namedtuple]": lambda n: [RecordTuple(*row) for row in rows(n)],
+        "list[__slots__]": lambda n: [RecordSlots(*row) for row in rows(n)],
+        "list[object]": lambda n: [RecordPlain(*row) for row in rows(n)],
+        "list[dict]": lambda n: [dict(zip(RecordTuple._fields, row)) for row in rows(n)],
+        "dict of lists": lambda n: {field: list(column) for field, column
+                                    in zip(RecordTuple._fields, zip(*rows(n)))},
+        "ColumnTable": lambda n: ColumnTable.from_dict({field: list(column) for field, column
+                                                        in zip(RecordTuple._fields, zip(*rows(n)))}),
+    }
+
+    def total_age(records, n):
+        if isinstance(records, ColumnTable):
+            return lambda: sum(records.columns["age"])
+        if isinstance(records, dict):
+            return lambda: sum(records["age"])
+        sample = records[0]
+        if isinstance(sample, dict):
+            return lambda: sum(r["age"] for r in records)
+        if isinstance(sample, tuple) and not hasattr(sample, "_fields"):
+            return lambda: sum(r[1] for r in records)
+        return lambda: sum(r.age for r in records)
+
+    return builders, {"sum(age)": total_age}
+
+
+_CASES = {"list": _list_cases, "tuple": _tuple_cases, "dict": _dict_cases,
+          "set": _set_cases, "records": _records_cases}
+
+
+def _measure_memory(builder: Callable, n: int):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    container = builder(n)
+    traced = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return container, traced, sys.getsizeof(container)
+
+
+def _time_operation(func: Callable, repeat: int, min_time: float) -> Tuple[float, int]:
+    timer = timeit.Timer(func)
+    loops = 1
+    while True:
+        elapsed = timer.timeit(loops)
+        if elapsed >= min_time or loops >= 1_000_000:
+            break
+        loops *= 10 if elapsed < min_time / 10 else 2
+    best = min([elapsed] + timer.repeat(repeat - 1, loops))
+    return best / loops, loops
+
+
+def run_suite(groups=GROUPS, sizes=(10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6), repeat: int = 3,
+              min_time: float = 0.05, verbose: bool = True):
+    """Time every operation and measure every container; return (times, memory)"""
+    times: List[TimeResult] = []
+    memory: List[MemoryResult] = []
+    for group in groups:
+        builders, operations = _CASES[group]()
+        for builder in builders.values():
+            builder(10)  # keep one-time lazy imports and tables out of the memory numbers
+        for size in sizes:
+            for name, builder in builders.items():
+                container, traced, shallow = _measure_memory(builder, size)
+                memory.append(MemoryResult(group, name, size, traced, shallow))
+                for operation, factory in operations.items():
+                    func = factory(container, size)
+                    if func is None:
+                        continue
+                    seconds, loops = _time_operation(func, repeat, min_time)
+                    times.append(TimeResult(group, name, operation, size, seconds, loops))
+                del container
+            if verbose:
+                print(f"  {group} 10^{len(str(size)) - 1} done", file=sys.stderr)
+    return times, memory
+
+
+def _format_seconds(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+
+def _format_bytes(count: int) -> str:
+    for unit, scale in (("GiB", 1 << 30), ("MiB", 1 << 20), ("KiB", 1 << 10)):
+        if count >= scale:
+            return f"{count / scale:.3g} {unit}"
+    return f"{count} B"
+
+
+def format_table(times: List[TimeResult], memory: List[MemoryResult]) -> str:
+    """One block per group and size: operations x containers, then memory"""
+    lines = []
+    keys = []
+    for result in memory:
+        if (result.group, result.size) not in keys:
+            keys.append((result.group, result.size))
+    for group, size in keys:
+        containers = [m.container for m in memory if m.group == group and m.size == size]
+        width = max(12, *(len(c) for c in containers)) + 2
+        lines.append(f"\n{group} @ {size:,} elements")
+        lines.append(" " * 20 + "".join(f"{c:>{width}}" for c in containers))
+        cells: Dict[str, Dict[str, str]] = {}
+        for result in times:
+            if result.group == group and result.size == size:
+                cells.setdefault(result.operation, {})[result.container] = _format_seconds(result.seconds)
+        for operation, row in cells.items():
+            lines.append(f"{operation:<20}" + "".join(f"{row.get(c, '-'):>{width}}" for c in containers))
+        for label, attribute in (("memory (traced)", "traced_bytes"), ("getsizeof", "shallow_bytes")):
+            row = {m.container: _format_bytes(getattr(m, attribute)) for m in memory
+                   if m.group == group and m.size == size}
+            lines.append(f"{label:<20}" + "".join(f"{row[c]:>{width}}" for c in containers))
+    return "\n".join(lines)
+
+
+def benchmark(max_exp: int = 6, groups=GROUPS, json_path: Optional[str] = None, repeat: int = 3):
+    """Run the suite from 10^3 to 10^max_exp, print the table, optionally write JSON
+
+    json_path may contain {stamp} (the start time) to keep one file per run.
+    """
+    sizes = tuple(10 ** exp for exp in range(3, max_exp + 1))
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    start = time.perf_counter()
+    times, memory = run_suite(groups, sizes, repeat)
+    print(format_table(times, memory))
+    print(f"\nsuite finished in {time.perf_counter() - start:.1f}s")
+    if json_path:
+        json_path = json_path.format(stamp=stamp)
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump({"started": stamp, "python": sys.version.split()[0],
+                       "platform": platform.platform(), "machine": platform.machine(),
+                       "repeat": repeat, "sizes": sizes,
+                       "times": [asdict(t) for t in times],
+                       "memory": [asdict(m) for m in memory]}, f, indent=2)
+        print(f"results written to {json_path}")
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Memory and speed benchmarks for the container lessons")
+    parser.add_argument("--max-exp", type=int, default=6, choices=range(3, 8),
+                        help="Largest size as a power of ten (7 needs several GiB for records)")
+    parser.add_argument("--group", action="append", choices=GROUPS, help="Only these groups")
+    parser.add_argument("--json", metavar="PATH",
+                        help="Also write the results as JSON ({stamp} in PATH is the start time)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    benchmark(args.max_exp, tuple(args.group or GROUPS), args.json, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
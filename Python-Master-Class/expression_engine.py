@@ -0,0 +1,461 @@
+#!/usr/bin/env python3
+"""
+Expression Engine for the Python07 calculator
+Tokenizes and parses arithmetic expressions into an AST, compiles them into
+cached evaluators (no eval), and runs one formula over whole columns of data.
+"""
+
+import math
+import operator
+import re
+import time
+import argparse
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Mapping, Sequence, Tuple, Union
+
+# Third-party imports with graceful fallbacks
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+class ExpressionError(ValueError):
+    """Raised for expressions that cannot be tokenized, parsed or evaluated"""
+
+
+# Parsing, compiling and evaluating all recurse over the AST
+_TOO_DEEP = "Expression is too deeply nested"
+
+
+# Tokens
+@dataclass(frozen=True)
+class Token:
+    """A single lexical token with its source position"""
+    kind: str
+    value: str
+    pos: int
+
+
+_TOKEN_RE = re.compile(r"""
+    (?P<ws>\s+)
+  | (?P<number>(?:\d+\.\d*|\.\d+|\d+)(?:[eE][+-]?\d+)?)
+  | (?P<name>[A-Za-z_][A-Za-z_0-9]*)
+  | (?P<op>\*\*|//|[-+*/%(),])
+""", re.VERBOSE)
+
+
+def tokenize(text: str) -> List[Token]:
+    """Split an expression into tokens"""
+    tokens = []
+    pos = 0
+    while pos < len(text):
+        match = _TOKEN_RE.match(text, pos)
+        if match is None:
+            raise ExpressionError(f"Unexpected character {text[pos]!r} at position {pos}")
+        kind = match.lastgroup
+        if kind != "ws":
+            tokens.append(Token(kind, match.group(), pos))
+        pos = match.end()
+    tokens.append(Token("end", "", pos))
+    return tokens
+
+
+# AST nodes
+@dataclass(frozen=True)
+class Num:
+    value: Union[int, float]
+
+
+@dataclass(frozen=True)
+class Var:
+    name: str
+
+
+@dataclass(frozen=True)
+class UnaryOp:
+    op: str
+    operand: Any
+
+
+@dataclass(frozen=True)
+class BinOp:
+    op: str
+    left: Any
+    right: Any
+
+
+@dataclass(frozen=True)
+class Call:
+    func: str
+    args: Tuple[Any, ...]
+
+
+# Binding powers: (left, right). ** is right-associative and binds tighter
+# than unary minus on its left, so -2**2 == -4 like Python.
+_BINARY_POWER = {
+    "+": (10, 11), "-": (10, 11),
+    "*": (20, 21), "/": (20, 21), "//": (20, 21), "%": (20, 21),
+    "**": (41, 40),
+}
+_UNARY_POWER = 30
+
+
+class Parser:
+    """Pratt parser turning tokens into an AST"""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens = tokenize(text)
+        self.index = 0
+
+    def _peek(self) -> Token:
+        return self.tokens[self.index]
+
+    def _next(self) -> Token:
+        token = self.tokens[self.index]
+        self.index += 1
+        return token
+
+    def _expect(self, value: str) -> Token:
+        token = self._next()
+        if token.value != value:
+            raise ExpressionError(f"Expected {value!r} at position {token.pos}, got {token.value or 'end'!r}")
+        return token
+
+    def parse(self):
+        """Parse the whole expression"""
+        node = self._expression(0)
+        token = self._peek()
+        if token.kind != "end":
+            raise ExpressionError(f"Unexpected {token.value!r} at position {token.pos}")
+        return node
+
+    def _expression(self, min_power: int):
+        left = self._prefix()
+        while True:
+            token = self._peek()
+            if token.kind != "op" or token.value not in _BINARY_POWER:
+                return left
+            left_power, right_power = _BINARY_POWER[token.value]
+            if left_power < min_power:
+                return left
+            self._next()
+            left = BinOp(token.value, left, self._expression(right_power))
+
+    def _prefix(self):
+        token = self._next()
+        if token.kind == "number":
+            text = token.value
+            is_float = any(ch in text for ch in ".eE")
+            return Num(float(text) if is_float else int(text))
+        if token.kind == "name":
+            if self._peek().value == "(":
+                return self._call(token)
+            return Var(token.value)
+        if token.value in ("+", "-"):
+            return UnaryOp(token.value, self._expression(_UNARY_POWER))
+        if token.value == "(":
+            node = self._expression(0)
+            self._expect(")")
+            return node
+        raise ExpressionError(f"Unexpected {token.value or 'end'!r} at position {token.pos}")
+
+    def _call(self, name: Token):
+        if name.value not in FUNCTIONS:
+            raise ExpressionError(f"Unknown function {name.value!r} at position {name.pos}")
+        self._expect("(")
+        args = []
+        if self._peek().value != ")":
+            args.append(self._expression(0))
+            while self._peek().value == ",":
+                self._next()
+                args.append(self._expression(0))
+        self._expect(")")
+        return Call(name.value, tuple(args))
+
+
+def parse(text: str):
+    """Parse an expression string into an AST"""
+    try:
+        return Parser(text).parse()
+    except RecursionError:
+        raise ExpressionError(_TOO_DEEP) from None
+
+
+MAX_POWER_BITS = 1 << 16  # ** refuses integer results bigger than this
+_INT64_LIMIT = 2.0 ** 63
+# What evaluation itself can raise; all of it is reported as ExpressionError
+_EVALUATION_ERRORS = (ArithmeticError, ValueError, TypeError)
+
+
+def _power(base, exp, mod=None):
+    """pow() that refuses integer results too big to compute in reasonable time"""
+    if mod is None and isinstance(base, int) and isinstance(exp, int) and exp > 0:
+        if (abs(base).bit_length() - 1) * exp > MAX_POWER_BITS:
+            raise ExpressionError(f"Result of {base} ** {exp} is too large")
+    return pow(base, exp) if mod is None else pow(base, exp, mod)
+
+
+# Operator tables for scalar and column evaluation
+_SCALAR_BINARY: Dict[str, Callable] = {
+    "+": operator.add, "-": operator.sub, "*": operator.mul,
+    "/": operator.truediv, "//": operator.floordiv, "%": operator.mod,
+    "**": _power,
+}
+_SCALAR_UNARY: Dict[str, Callable] = {"+": operator.pos, "-": operator.neg}
+
+FUNCTIONS: Dict[str, Callable] = {
+    "abs": abs, "min": min, "max": max, "round": round, "pow": _power,
+    "sqrt": math.sqrt, "floor": math.floor, "ceil": math.ceil,
+}
+
+if NUMPY_AVAILABLE:
+    _COLUMN_BINARY: Dict[str, Callable] = {
+        "+": np.add, "-": np.subtract, "*": np.multiply,
+        "/": np.true_divide, "//": np.floor_divide, "%": np.remainder,
+        "**": np.power,
+    }
+    _COLUMN_FUNCTIONS: Dict[str, Callable] = {
+        "abs": np.abs, "min": np.minimum, "max": np.maximum, "round": np.round,
+        "sqrt": np.sqrt, "floor": np.floor, "ceil": np.ceil,
+    }
+
+
+def variables(node) -> List[str]:
+    """Return the variable names used by an AST, in first-use order"""
+    names: Dict[str, None] = {}
+
+    def walk(n):
+        if isinstance(n, Var):
+            names.setdefault(n.name)
+        elif isinstance(n, UnaryOp):
+            walk(n.operand)
+        elif isinstance(n, BinOp):
+            walk(n.left)
+            walk(n.right)
+        elif isinstance(n, Call):
+            for arg in n.args:
+                walk(arg)
+
+    walk(node)
+    return list(names)
+
+
+def _compile_node(node) -> Callable[[Mapping[str, Any]], Any]:
+    """Turn an AST node into a closure taking a variable mapping"""
+    if isinstance(node, Num):
+        value = node.value
+        return lambda env: value
+    if isinstance(node, Var):
+        name = node.name
+
+        def load(env):
+            try:
+                return env[name]
+            except KeyError:
+                raise ExpressionError(f"Missing value for variable {name!r}") from None
+        return load
+    if isinstance(node, UnaryOp):
+        func = _SCALAR_UNARY[node.op]
+        operand = _compile_node(node.operand)
+        return lambda env: func(operand(env))
+    if isinstance(node, BinOp):
+        func = _SCALAR_BINARY[node.op]
+        left = _compile_node(node.left)
+        right = _compile_node(node.right)
+        return lambda env: func(left(env), right(env))
+    if isinstance(node, Call):
+        func = FUNCTIONS[node.func]
+        args = [_compile_node(arg) for arg in node.args]
+        return lambda env: func(*[arg(env) for arg in args])
+    raise ExpressionError(f"Unknown node {node!r}")
+
+
+def _column_binary(op: str, left, right):
+    """One binary operator over columns, raising where the scalar path would"""
+    if op in ("/", "//", "%") and np.any(np.asarray(right) == 0):
+        raise ZeroDivisionError("division by zero")
+    is_int = np.result_type(left, right).kind in "iu"
+    if op == "**" and is_int and np.any(np.asarray(right) < 0):
+        # Python gives a float for a negative integer exponent, NumPy refuses
+        left = np.asarray(left, dtype=np.float64)
+        is_int = False
+    result = _COLUMN_BINARY[op](left, right)
+    if is_int and op in ("+", "-", "*", "**"):
+        # NumPy integers wrap silently; redo the operation in floats to spot it
+        approx = _COLUMN_BINARY[op](np.asarray(left, dtype=np.float64), np.asarray(right, dtype=np.float64))
+        if np.any(np.abs(approx) >= _INT64_LIMIT):
+            raise OverflowError("integer overflow")
+    return result
+
+
+def _evaluate_columns(node, columns: Mapping[str, Any]):
+    """Evaluate an AST once over NumPy columns"""
+    if isinstance(node, Num):
+        return node.value
+    if isinstance(node, Var):
+        try:
+            return columns[node.name]
+        except KeyError:
+            raise ExpressionError(f"Missing column for variable {node.name!r}") from None
+    if isinstance(node, UnaryOp):
+        operand = _evaluate_columns(node.operand, columns)
+        return -operand if node.op == "-" else operand
+    if isinstance(node, BinOp):
+        left = _evaluate_columns(node.left, columns)
+        right = _evaluate_columns(node.right, columns)
+        return _column_binary(node.op, left, right)
+    if isinstance(node, Call):
+        args = [_evaluate_columns(arg, columns) for arg in node.args]
+        if node.func == "pow":
+            if len(args) not in (2, 3):
+                raise TypeError(f"pow expected 2 or 3 arguments, got {len(args)}")
+            result = _column_binary("**", args[0], args[1])
+            return result if len(args) == 2 else _column_binary("%", result, args[2])
+        if node.func in ("min", "max") and len(args) > 2:
+            result = args[0]
+            for arg in args[1:]:
+                result = _COLUMN_FUNCTIONS[node.func](result, arg)
+            return result
+        return _COLUMN_FUNCTIONS[node.func](*args)
+    raise ExpressionError(f"Unknown node {node!r}")
+
+
+class CompiledExpression:
+    """A parsed and compiled expression, reusable over many inputs"""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.ast = parse(text)
+        try:
+            self.variables = variables(self.ast)
+            self._func = _compile_node(self.ast)
+        except RecursionError:
+            raise ExpressionError(_TOO_DEEP) from None
+
+    def __repr__(self):
+        return f"CompiledExpression({self.text!r})"
+
+    def __call__(self, env: Mapping[str, Any] = None, **values):
+        """Evaluate for a single set of variable values"""
+        if env is None:
+            env = values
+        elif values:
+            env = {**env, **values}
+        try:
+            return self._func(env)
+        except ExpressionError:
+            raise
+        except _EVALUATION_ERRORS as e:
+            raise self._failure(e) from None
+        except RecursionError:
+            raise ExpressionError(_TOO_DEEP) from None
+
+    def _failure(self, error: Exception) -> ExpressionError:
+        if isinstance(error, ZeroDivisionError):
+            return ExpressionError(f"Division by zero in {self.text!r}")
+        return ExpressionError(f"Cannot evaluate {self.text!r}: {error}")
+
+    def evaluate_columns(self, columns: Mapping[str, Sequence], use_numpy: bool = None):
+        """Evaluate over equal-length columns, one result per row"""
+        try:
+            return self._evaluate_columns(columns, use_numpy)
+        except ExpressionError:
+            raise
+        except _EVALUATION_ERRORS as e:
+            raise self._failure(e) from None
+        except RecursionError:
+            raise ExpressionError(_TOO_DEEP) from None
+
+    def _evaluate_columns(self, columns: Mapping[str, Sequence], use_numpy: bool = None):
+        if use_numpy is None:
+            use_numpy = NUMPY_AVAILABLE
+        if use_numpy and not NUMPY_AVAILABLE:
+            raise ExpressionError("NumPy is not available for column evaluation")
+
+        if use_numpy:
+            arrays = {name: np.asarray(columns[name]) for name in self.variables if name in columns}
+            # Same failures as the scalar path: no silent inf, nan or overflow
+            with np.errstate(divide="raise", invalid="raise", over="raise"):
+                result = _evaluate_columns(self.ast, arrays)
+            length = _column_length(columns, self.variables)
+            return np.broadcast_to(result, (length,)) if np.ndim(result) == 0 else result
+
+        names = self.variables
+        missing = [name for name in names if name not in columns]
+        if missing:
+            raise ExpressionError(f"Missing column for variable {missing[0]!r}")
+        func = self._func
+        if not names:
+            return [func({})] * _column_length(columns, names)
+        return [func(dict(zip(names, row))) for row in zip(*(columns[name] for name in names))]
+
+
+def _column_length(columns: Mapping[str, Sequence], names: List[str]) -> int:
+    lengths = {len(columns[name]) for name in names if name in columns}
+    if len(lengths) > 1:
+        raise ExpressionError("Columns must all have the same length")
+    if lengths:
+        return lengths.pop()
+    return len(next(iter(columns.values()))) if columns else 1
+
+
+@lru_cache(maxsize=256)
+def compile_expression(text: str) -> CompiledExpression:
+    """Compile an expression, reusing the cached result for repeated text"""
+    return CompiledExpression(text)
+
+
+def evaluate(text: str, **values):
+    """Compile (cached) and evaluate an expression in one call"""
+    return compile_expression(text)(values)
+
+
+def benchmark(rows: int = 1_000_000, expression: str = "(a + b) * 2 - a / (b + 1) % 7"):
+    """Compare row-by-row and column evaluation of one expression"""
+    compiled = compile_expression(expression)
+    a = list(range(rows))
+    b = list(range(rows, 0, -1))
+    columns = {"a": a, "b": b}
+
+    start = time.perf_counter()
+    compiled.evaluate_columns(columns, use_numpy=False)
+    python_seconds = time.perf_counter() - start
+    print(f"python rows : {rows:>10,} in {python_seconds:.3f}s")
+
+    if NUMPY_AVAILABLE:
+        arrays = {"a": np.asarray(a, dtype=np.float64), "b": np.asarray(b, dtype=np.float64)}
+        start = time.perf_counter()
+        compiled.evaluate_columns(arrays, use_numpy=True)
+        numpy_seconds = time.perf_counter() - start
+        print(f"numpy rows  : {rows:>10,} in {numpy_seconds:.3f}s "
+              f"({python_seconds / max(numpy_seconds, 1e-9):.0f}x)")
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Safe arithmetic expression engine")
+    parser.add_argument("expression", nargs="?", help="Expression to evaluate, e.g. '2 * (x + 1)'")
+    parser.add_argument("--var", action="append", default=[], metavar="NAME=VALUE",
+                        help="Variable value (repeatable)")
+    parser.add_argument("--benchmark", type=int, metavar="ROWS", help="Run the column benchmark")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.benchmark)
+        return
+    if not args.expression:
+        parser.error("an expression or --benchmark is required")
+
+    values = {}
+    for item in args.var:
+        name, _, raw = item.partition("=")
+        values[name.strip()] = float(raw) if any(ch in raw for ch in ".eE") else int(raw)
+    print(evaluate(args.expression, **values))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+File I/O helpers for the Python20 lesson
+Streaming line iteration, an mmap-backed random-access line reader, atomic
+writes (temp file + fsync + rename) and a batched append buffer. Reading and
+rewriting go line by line, so memory stays constant for any file size.
+"""
+
+import mmap
+import os
+import tempfile
+import time
+import argparse
+from array import array
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator, Optional, Union
+
+PathLike = Union[str, os.PathLike]
+APPEND_BUFFER_BYTES = 64 * 1024
+
+
+def iter_lines(path: PathLike, encoding: str = "utf-8", keepends: bool = False) -> Iterator[str]:
+    """Yield the lines of a text file one at a time"""
+    with open(path, "r", encoding=encoding, newline="") as f:
+        for line in f:
+            yield line if keepends else line.rstrip("\r\n")
+
+
+@contextmanager
+def atomic_write(path: PathLike, encoding: Optional[str] = "utf-8", binary: bool = False):
+    """Open a temp file next to path; it replaces path only if the block succeeds"""
+    path = Path(path)
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        mode = "wb" if binary else "w"
+        with open(fd, mode, encoding=None if binary else encoding, newline=None if binary else "") as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        if path.exists():
+            os.chmod(temp_name, path.stat().st_mode & 0o777)
+        os.replace(temp_name, path)
+    except BaseException:
+        if os.path.exists(temp_name):
+            os.remove(temp_name)
+        raise
+
+
+def write_text(path: PathLike, text: str, encoding: str = "utf-8") -> int:
+    """Atomically replace a file's contents, return characters written"""
+    with atomic_write(path, encoding) as f:
+        return f.write(text)
+
+
+def rewrite_lines(path: PathLike, transform: Callable[[str], Optional[str]],
+                  encoding: str = "utf-8") -> int:
+    """Stream every line through transform into an atomic rewrite
+
+    transform gets each line with its ending and returns the replacement, or
+    None to drop the line. Returns the number of lines written.
+    """
+    written = 0
+    with atomic_write(path, encoding) as out:
+        for line in iter_lines(path, encoding, keepends=True):
+            result = transform(line)
+            if result is not None:
+                out.write(result)
+                written += 1
+    return written
+
+
+class AppendBuffer:
+    """One buffered append handle that flushes in batches"""
+
+    def __init__(self, path: PathLike, encoding: str = "utf-8",
+                 flush_bytes: int = APPEND_BUFFER_BYTES, fsync: bool = False):
+        self.path = Path(path)
+        self.encoding = encoding
+        self.flush_bytes = flush_bytes
+        self.fsync = fsync
+        self._pending = []
+        self._pending_bytes = 0
+        self._file = open(self.path, "ab")
+
+    def append(self, text: str):
+        """Queue text for the file; written once the batch is full"""
+        data = text.encode(self.encoding)
+        self._pending.append(data)
+        self._pending_bytes += len(data)
+        if self._pending_bytes >= self.flush_bytes:
+            self.flush()
+
+    def flush(self):
+        """Write every queued append with one system call"""
+        if self._pending:
+            self._file.write(b"".join(self._pending))
+            self._pending.clear()
+            self._pending_bytes = 0
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class MappedTextFile:
+    """Random access to lines of a file through mmap and a line-offset index"""
+
+    def __init__(self, path: PathLike, encoding: str = "utf-8"):
+        self.path = Path(path)
+        self.encoding = encoding
+        self._file = open(self.path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        self._offsets = None
+
+    def _index(self) -> array:
+        # Built lazily: 8 bytes per line, never the text itself
+        if self._offsets is None:
+            offsets = array("Q", [0])
+            data = self._data
+            position = data.find(b"\n")
+            while position != -1:
+                offsets.append(position + 1)
+                position = data.find(b"\n", position + 1)
+            if offsets[-1] == len(data) and len(offsets) > 1:
+                offsets.pop()
+            elif not len(data):
+                offsets.pop()
+            self._offsets = offsets
+        return self._offsets
+
+    def __len__(self) -> int:
+        return len(self._index())
+
+    def __getitem__(self, index: int) -> str:
+        offsets = self._index()
+        if index < 0:
+            index += len(offsets)
+        if not 0 <= index < len(offsets):
+            raise IndexError("line index out of range")
+        start = offsets[index]
+        end = offsets[index + 1] if index + 1 < len(offsets) else len(self._data)
+        return self._data[start:end].decode(self.encoding).rstrip("\r\n")
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def close(self):
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def benchmark(megabytes: int = 64, path: str = "file_io_bench.txt"):
+    """Time streaming reads, random access and an atomic rewrite of a large file"""
+    import random
+    import tracemalloc
+    random.seed(5)
+    with AppendBuffer(path) as out:
+        line = 0
+        while out._file.tell() + out._pending_bytes < megabytes * 1024 * 1024:
+            out.append(f"line {line} " + "x" * random.randint(10, 120) + "\n")
+            line += 1
+    try:
+        tracemalloc.start()
+        start = time.perf_counter()
+        count = sum(1 for _ in iter_lines(path))
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"stream   : {count:,} lines in {elapsed:.2f}s, peak {peak / 1024:.0f} KiB")
+
+        with MappedTextFile(path) as mapped:
+            start = time.perf_counter()
+            total = len(mapped)
+            indexed = time.perf_counter() - start
+            start = time.perf_counter()
+            for _ in range(100_000):
+                mapped[random.randrange(total)]
+            print(f"mmap     : index {indexed:.2f}s, 100,000 random lines in {time.perf_counter() - start:.2f}s")
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        rewrite_lines(path, str.upper)
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"rewrite  : {elapsed:.2f}s, peak {peak / 1024:.0f} KiB")
+    finally:
+        os.remove(path)
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Streaming and mmap file helpers")
+    parser.add_argument("path", nargs="?", help="File to print")
+    parser.add_argument("--line", type=int, help="Print only this line number (0-based, via mmap)")
+    parser.add_argument("--benchmark", type=int, metavar="MB", help="Run the benchmark")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.benchmark)
+        return
+    if not args.path:
+        parser.error("a path or --benchmark is required")
+    if args.line is not None:
+        with MappedTextFile(args.path) as mapped:
+            print(mapped[args.line])
+    else:
+        for line in iter_lines(args.path):
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Guessing Game Engine for Python16 (Python-Test/2/guess_game.py carries
+the game part for Python-Test/2/Python07)
+One game object with consistent higher/lower feedback for numbers or words,
+a binary-search solver that wins every game within ceil(log2(n + 1)) guesses
+and a Monte Carlo simulator that plays millions of games per strategy,
+vectorized with NumPy or spread over processes without it.
+"""
+
+import math
+import random
+import time
+import argparse
+from collections import Counter
+from dataclasses import dataclass, field
+from multiprocessing import Pool, cpu_count
+from typing import Any, Dict, List, Optional
+
+# Third-party imports with graceful fallbacks
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+CORRECT = 0
+GO_HIGHER = 1   # the guess was too low
+GO_LOWER = -1   # the guess was too high
+HINTS = {CORRECT: "Correct", GO_HIGHER: "Too Low", GO_LOWER: "Too High"}
+STRATEGIES = ("binary", "random", "linear")
+CHUNK_GAMES = 250_000
+
+
+class GameOverError(RuntimeError):
+    """Raised when guessing after the game has been won or lost"""
+
+
+def feedback(guess, secret) -> int:
+    """CORRECT, GO_HIGHER or GO_LOWER; words compare alphabetically"""
+    if guess == secret:
+        return CORRECT
+    return GO_HIGHER if guess < secret else GO_LOWER
+
+
+def optimal_limit(low: int, high: int) -> int:
+    """Guesses binary search needs in the worst case for [low, high]"""
+    return max(1, math.ceil(math.log2(high - low + 2)))
+
+
+class GuessGame:
+    """One round: a secret, a guess limit and the guesses made so far"""
+
+    def __init__(self, secret, limit: Optional[int] = None,
+                 low: Optional[int] = None, high: Optional[int] = None):
+        if (low is None) != (high is None):
+            raise ValueError("low and high must be given together")
+        if low is not None and not low <= secret <= high:
+            raise ValueError(f"secret must be within [{low}, {high}]")
+        self.secret = secret
+        self.low = low
+        self.high = high
+        self.limit = limit if limit is not None else (optimal_limit(low, high) if low is not None else 6)
+        self.guesses: List[Any] = []
+        self.won = False
+
+    @classmethod
+    def random_number(cls, low: int = 1, high: int = 100, limit: Optional[int] = None,
+                      rng: Optional[random.Random] = None) -> "GuessGame":
+        return cls((rng or random).randint(low, high), limit, low, high)
+
+    @property
+    def remaining(self) -> int:
+        return self.limit - len(self.guesses)
+
+    @property
+    def over(self) -> bool:
+        return self.won or self.remaining <= 0
+
+    def guess(self, value) -> int:
+        """Record a guess and return its feedback"""
+        if self.over:
+            raise GameOverError("The game is over")
+        if self.low is not None and not self.low <= value <= self.high:
+            raise ValueError(f"Guess must be within [{self.low}, {self.high}]")
+        self.guesses.append(value)
+        result = feedback(value, self.secret)
+        self.won = result == CORRECT
+        return result
+
+
+class BinarySearchSolver:
+    """Keeps the interval of secrets still consistent with the feedback"""
+
+    def __init__(self, low: int, high: int):
+        self.low = low
+        self.high = high
+
+    def next_guess(self) -> int:
+        return (self.low + self.high) // 2
+
+    def update(self, guess: int, result: int):
+        if result == GO_HIGHER:
+            self.low = guess + 1
+        elif result == GO_LOWER:
+            self.high = guess - 1
+
+    def play(self, game: GuessGame) -> bool:
+        """Play game to the end, return whether it was won"""
+        while not game.over:
+            guess = self.next_guess()
+            self.update(guess, game.guess(guess))
+        return game.won
+
+
+@dataclass
+class SimulationResult:
+    """Outcome of many simulated games for one strategy and limit"""
+    strategy: str
+    games: int
+    limit: int
+    wins: int = 0
+    distribution: Dict[int, int] = field(default_factory=dict)  # guesses used -> games won
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.games if self.games else 0.0
+
+    @property
+    def mean_guesses(self) -> float:
+        return sum(k * v for k, v in self.distribution.items()) / self.wins if self.wins else 0.0
+
+    def merge(self, other: "SimulationResult"):
+        self.games += other.games
+        self.wins += other.wins
+        for guesses, count in other.distribution.items():
+            self.distribution[guesses] = self.distribution.get(guesses, 0) + count
+
+
+def _strategy_guess(strategy: str, low: int, high: int, rng: random.Random) -> int:
+    if strategy == "binary":
+        return (low + high) // 2
+    if strategy == "random":
+        return rng.randint(low, high)
+    return low
+
+
+def _simulate_python(args) -> SimulationResult:
+    strategy, games, low, high, limit, seed = args
+    rng = random.Random(seed)
+    result = SimulationResult(strategy, games, limit)
+    distribution = Counter()
+    for _ in range(games):
+        secret = rng.randint(low, high)
+        lo, hi = low, high
+        for used in range(1, limit + 1):
+            guess = _strategy_guess(strategy, lo, hi, rng)
+            if guess == secret:
+                distribution[used] += 1
+                break
+            if guess < secret:
+                lo = guess + 1
+            else:
+                hi = guess - 1
+    result.wins = sum(distribution.values())
+    result.distribution = dict(distribution)
+    return result
+
+
+def _simulate_numpy(args) -> SimulationResult:
+    strategy, games, low, high, limit, seed = args
+    rng = np.random.default_rng(seed)
+    secret = rng.integers(low, high + 1, size=games)
+    lo = np.full(games, low, dtype=np.int64)
+    hi = np.full(games, high, dtype=np.int64)
+    solved_at = np.zeros(games, dtype=np.int64)  # 0 = not solved yet
+    for used in range(1, limit + 1):
+        if strategy == "binary":
+            guess = (lo + hi) // 2
+        elif strategy == "random":
+            guess = lo + (rng.random(games) * (hi - lo + 1)).astype(np.int64)
+        else:
+            guess = lo
+        open_games = solved_at == 0
+        solved_at[open_games & (guess == secret)] = used
+        higher = guess < secret
+        lo = np.where(higher, guess + 1, lo)
+        hi = np.where(higher, hi, guess - 1)
+    counts = np.bincount(solved_at, minlength=limit + 1)
+    result = SimulationResult(strategy, games, limit)
+    result.distribution = {used: int(counts[used]) for used in range(1, limit + 1) if counts[used]}
+    result.wins = int(counts[1:].sum())
+    return result
+
+
+def simulate(strategy: str = "binary", games: int = 1_000_000, low: int = 1, high: int = 100,
+             limit: Optional[int] = None, processes: Optional[int] = None,
+             seed: Optional[int] = None, use_numpy: Optional[bool] = None) -> SimulationResult:
+    """Play games with a strategy and report win rate and guess distribution
+
+    NumPy plays a whole chunk of games in lock step; without it the chunks are
+    spread over processes. Results are reproducible for a given seed.
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"strategy must be one of {STRATEGIES}")
+    if high < low:
+        raise ValueError("high must be >= low")
+    limit = limit or optimal_limit(low, high)
+    if use_numpy is None:
+        use_numpy = NUMPY_AVAILABLE
+    runner = _simulate_numpy if use_numpy else _simulate_python
+    base_seed = seed if seed is not None else random.randrange(1 << 32)
+    chunks = [(strategy, min(CHUNK_GAMES, games - start), low, high, limit, base_seed + i)
+              for i, start in enumerate(range(0, games, CHUNK_GAMES))]
+    if processes is None:
+        processes = 1 if use_numpy else min(cpu_count(), len(chunks))
+    total = SimulationResult(strategy, 0, limit)
+    if processes > 1 and len(chunks) > 1:
+        with Pool(processes) as pool:
+            parts = pool.map(runner, chunks)
+    else:
+        parts = map(runner, chunks)
+    for part in parts:
+        total.merge(part)
+    return total
+
+
+def report(result: SimulationResult) -> str:
+    """Readable summary with a small histogram"""
+    lines = [f"{result.strategy:<7} limit {result.limit:>2}  {result.games:>10,} games  "
+             f"win rate {result.win_rate:7.2%}  mean guesses {result.mean_guesses:.2f}"]
+    peak = max(result.distribution.values(), default=1)
+    for used in sorted(result.distribution):
+        count = result.distribution[used]
+        lines.append(f"    {used:>3} {count / result.games:7.2%} {'#' * max(1, round(40 * count / peak))}")
+    return "\n".join(lines)
+
+
+def benchmark(games: int = 1_000_000, low: int = 1, high: int = 100):
+    """Time every strategy at a few limits"""
+    best = optimal_limit(low, high)
+    for strategy in STRATEGIES:
+        for limit in (3, 6, best):
+            start = time.perf_counter()
+            result = simulate(strategy, games, low, high, limit, seed=16)
+            elapsed = time.perf_counter() - start
+            print(f"{report(result).splitlines()[0]}  ({elapsed:.2f}s)")
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Guessing game solver and simulator")
+    parser.add_argument("--strategy", choices=STRATEGIES, default="binary")
+    parser.add_argument("--games", type=int, default=1_000_000)
+    parser.add_argument("--low", type=int, default=1)
+    parser.add_argument("--high", type=int, default=100)
+    parser.add_argument("--limit", type=int)
+    parser.add_argument("--processes", type=int)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--benchmark", action="store_true", help="Time every strategy")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.games, args.low, args.high)
+        return
+    result = simulate(args.strategy, args.games, args.low, args.high, args.limit,
+                      args.processes, args.seed)
+    print(report(result))
+
+
+if __name__ == "__main__":
+    main()
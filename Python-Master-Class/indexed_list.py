@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""
+Value-Indexed List for the Python08 list operations
+A list-compatible sequence stored as a chain of small blocks, with a hash
+index from each value to the blocks holding it. Membership, count, index and
+remove look up the index instead of scanning, and a middle insert only shifts
+one block, so both stay far below O(n) on large lists.
+"""
+
+import time
+import argparse
+from bisect import bisect_right
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+BLOCK_SIZE = 512
+
+
+class IndexedList:
+    """Ordered, sliceable sequence with list semantics and a value index
+
+    Values must be hashable. Blocks hold between 1 and 2 * block_size items;
+    the index maps value -> {block id: occurrences}, so finding a value only
+    searches the blocks that actually contain it.
+    """
+
+    def __init__(self, iterable: Iterable[Any] = (), block_size: int = BLOCK_SIZE):
+        if block_size < 1:
+            raise ValueError("block_size must be positive")
+        self.block_size = block_size
+        self._blocks: List[List[Any]] = []
+        self._ids: List[int] = []
+        self._next_id = 0
+        self._where: Dict[Any, Dict[int, int]] = {}
+        self._size = 0
+        self._offsets: List[int] = []  # start position of every block, rebuilt lazily
+        self._dirty_from = 0
+        self._block_pos: Optional[Dict[int, int]] = None
+        self.extend(iterable)
+
+    # Bookkeeping
+    def _index_add(self, value, block_id: int):
+        blocks = self._where.get(value)
+        if blocks is None:
+            self._where[value] = {block_id: 1}
+        else:
+            blocks[block_id] = blocks.get(block_id, 0) + 1
+
+    def _index_discard(self, value, block_id: int):
+        blocks = self._where[value]
+        if blocks[block_id] == 1:
+            del blocks[block_id]
+            if not blocks:
+                del self._where[value]
+        else:
+            blocks[block_id] -= 1
+
+    def _new_block(self, position: int, items: List[Any]) -> int:
+        block_id = self._next_id
+        self._next_id += 1
+        self._blocks.insert(position, items)
+        self._ids.insert(position, block_id)
+        for value in items:
+            self._index_add(value, block_id)
+        self._block_pos = None
+        self._touch(position)
+        return block_id
+
+    def _touch(self, position: int):
+        """Block offsets from this block on are stale"""
+        if position < self._dirty_from:
+            self._dirty_from = position
+
+    def _fresh_offsets(self) -> List[int]:
+        offsets = self._offsets
+        start = min(self._dirty_from, len(offsets))
+        del offsets[start:]
+        total = offsets[-1] + len(self._blocks[start - 1]) if start else 0
+        for block in self._blocks[start:]:
+            offsets.append(total)
+            total += len(block)
+        self._dirty_from = len(self._blocks)
+        return offsets
+
+    def _positions_of_blocks(self) -> Dict[int, int]:
+        if self._block_pos is None:
+            self._block_pos = {block_id: position for position, block_id in enumerate(self._ids)}
+        return self._block_pos
+
+    def _locate(self, index: int):
+        """(block position, offset in block) for a normalized index"""
+        offsets = self._fresh_offsets()
+        position = bisect_right(offsets, index) - 1
+        return position, index - offsets[position]
+
+    def _normalize(self, index: int) -> int:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("list index out of range")
+        return index
+
+    def _split(self, position: int):
+        block = self._blocks[position]
+        half = len(block) // 2
+        old_id = self._ids[position]
+        moved = block[half:]
+        del block[half:]
+        for value in moved:
+            self._index_discard(value, old_id)
+        self._new_block(position + 1, moved)
+
+    def _drop_if_empty(self, position: int):
+        if not self._blocks[position]:
+            del self._blocks[position]
+            del self._ids[position]
+            self._block_pos = None
+            self._touch(position)
+
+    # Sequence protocol
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Any]:
+        for block in self._blocks:
+            yield from block
+
+    def __reversed__(self) -> Iterator[Any]:
+        for block in reversed(self._blocks):
+            yield from reversed(block)
+
+    def __contains__(self, value) -> bool:
+        return value in self._where
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._size)
+            if step == 1:
+                return IndexedList(self._iter_range(start, stop), self.block_size)
+            return IndexedList(islice(self, start, stop, step) if step > 0
+                               else list(self)[index], self.block_size)
+        position, offset = self._locate(self._normalize(index))
+        return self._blocks[position][offset]
+
+    def _iter_range(self, start: int, stop: int) -> Iterator[Any]:
+        if start >= stop:
+            return
+        position, offset = self._locate(start)
+        remaining = stop - start
+        blocks = self._blocks
+        while remaining:
+            piece = blocks[position][offset:offset + remaining]
+            position += 1
+            yield from piece
+            remaining -= len(piece)
+            offset = 0
+
+    def __setitem__(self, index: int, value):
+        if isinstance(index, slice):
+            raise TypeError("IndexedList does not support slice assignment")
+        position, offset = self._locate(self._normalize(index))
+        block_id = self._ids[position]
+        block = self._blocks[position]
+        self._index_discard(block[offset], block_id)
+        block[offset] = value
+        self._index_add(value, block_id)
+
+    def __delitem__(self, index: int):
+        if isinstance(index, slice):
+            raise TypeError("IndexedList does not support slice deletion")
+        self.pop(index)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (IndexedList, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"IndexedList({list(self)!r})"
+
+    # List methods
+    def append(self, value):
+        if not self._blocks or len(self._blocks[-1]) >= self.block_size:
+            self._new_block(len(self._blocks), [value])
+        else:
+            self._blocks[-1].append(value)
+            self._index_add(value, self._ids[-1])
+        self._size += 1
+
+    def extend(self, iterable: Iterable[Any]):
+        items = iter(iterable)
+        if self._blocks and len(self._blocks[-1]) < self.block_size:
+            room = self.block_size - len(self._blocks[-1])
+            for value in islice(items, room):
+                self.append(value)
+        while True:
+            chunk = list(islice(items, self.block_size))
+            if not chunk:
+                return
+            self._new_block(len(self._blocks), chunk)
+            self._size += len(chunk)
+
+    def insert(self, index: int, value):
+        if index < 0:
+            index = max(0, index + self._size)
+        if index >= self._size:
+            self.append(value)
+            return
+        position, offset = self._locate(index)
+        self._blocks[position].insert(offset, value)
+        self._index_add(value, self._ids[position])
+        self._size += 1
+        self._touch(position + 1)
+        if len(self._blocks[position]) > 2 * self.block_size:
+            self._split(position)
+
+    def pop(self, index: int = -1):
+        if not self._size:
+            raise IndexError("pop from empty list")
+        position, offset = self._locate(self._normalize(index))
+        value = self._blocks[position].pop(offset)
+        self._index_discard(value, self._ids[position])
+        self._size -= 1
+        self._touch(position + 1)
+        self._drop_if_empty(position)
+        return value
+
+    def _first(self, value, start: int = 0, stop: Optional[int] = None):
+        """(block position, offset) of the first occurrence in [start, stop)"""
+        blocks = self._where.get(value)
+        if blocks is not None:
+            stop = self._size if stop is None else stop
+            block_pos = self._positions_of_blocks()
+            offsets = self._fresh_offsets()
+            for position in sorted(block_pos[block_id] for block_id in blocks):
+                block_start = offsets[position]
+                if block_start >= stop:
+                    break
+                block = self._blocks[position]
+                if block_start + len(block) <= start:
+                    continue
+                low = max(0, start - block_start)
+                high = min(len(block), stop - block_start)
+                try:
+                    return position, block.index(value, low, high)
+                except ValueError:
+                    continue
+        return None
+
+    def index(self, value, start: int = 0, stop: Optional[int] = None) -> int:
+        if start < 0:
+            start = max(0, start + self._size)
+        if stop is not None and stop < 0:
+            stop = max(0, stop + self._size)
+        found = self._first(value, start, stop)
+        if found is None:
+            raise ValueError(f"{value!r} is not in list")
+        position, offset = found
+        return self._fresh_offsets()[position] + offset
+
+    def remove(self, value):
+        found = self._first(value)
+        if found is None:
+            raise ValueError("list.remove(x): x not in list")
+        position, offset = found
+        del self._blocks[position][offset]
+        self._index_discard(value, self._ids[position])
+        self._size -= 1
+        self._touch(position + 1)
+        self._drop_if_empty(position)
+
+    def count(self, value) -> int:
+        return sum(self._where.get(value, {}).values())
+
+    def positions(self, value) -> List[int]:
+        """Every index holding value, in order"""
+        blocks = self._where.get(value, {})
+        block_pos = self._positions_of_blocks()
+        offsets = self._fresh_offsets()
+        result = []
+        for position in sorted(block_pos[block_id] for block_id in blocks):
+            base = offsets[position]
+            result.extend(base + i for i, item in enumerate(self._blocks[position]) if item == value)
+        return result
+
+    def copy(self) -> "IndexedList":
+        # Clone blocks and index directly instead of re-hashing every value
+        clone = IndexedList((), self.block_size)
+        clone._blocks = [list(block) for block in self._blocks]
+        clone._ids = list(self._ids)
+        clone._next_id = self._next_id
+        clone._where = {value: dict(blocks) for value, blocks in self._where.items()}
+        clone._size = self._size
+        return clone
+
+    def clear(self):
+        self.__init__((), self.block_size)
+
+
+def benchmark(size: int = 1_000_000, operations: int = 1000):
+    """Time the Python08 operations on list and IndexedList"""
+    import gc
+    import random
+    random.seed(8)
+    values = list(range(size))
+    plain = list(values)
+    indexed = IndexedList(values)
+    targets = [random.randrange(size) for _ in range(operations)]
+    middles = [random.randrange(size) for _ in range(operations)]
+
+    def timed(func):
+        # Like timeit, keep collector passes over the large heap out of the numbers
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            func()
+            return time.perf_counter() - start
+        finally:
+            gc.enable()
+
+    def index_all(seq):
+        return lambda: [seq.index(t) for t in targets]
+
+    def contains_all(seq):
+        return lambda: [t in seq for t in targets]
+
+    def insert_remove(seq):
+        def run():
+            for i, position in enumerate(middles):
+                seq.insert(position, -1 - i)
+            for i in range(len(middles)):
+                seq.remove(-1 - i)
+        return run
+
+    print(f"{size:,} items, {operations:,} operations each")
+    cases = [
+        ("index", index_all),
+        ("in", contains_all),
+        ("insert+remove", insert_remove),
+        ("append", lambda seq: lambda: [seq.append(-1) for _ in range(operations)]),
+        ("slice [1:5]", lambda seq: lambda: [seq[1:5] for _ in range(operations)]),
+        ("extend 10k", lambda seq: lambda: seq.extend(range(10_000))),
+        ("copy", lambda seq: lambda: seq.copy()),
+    ]
+    for name, make in cases:
+        list_time = timed(make(plain))
+        indexed_time = timed(make(indexed))
+        print(f"{name:<14} list {list_time:8.4f}s   IndexedList {indexed_time:8.4f}s")
+    assert indexed == plain
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Value-indexed blocked list")
+    parser.add_argument("--benchmark", type=int, default=1_000_000, metavar="SIZE")
+    parser.add_argument("--operations", type=int, default=1000)
+    args = parser.parse_args()
+    benchmark(args.benchmark, args.operations)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Vectorized Math Kernels behind the Python05/Python06 math demos
+floor, ceil, sqrt, pow, round and abs over whole sequences and buffers.
+NumPy runs each kernel as one ufunc call; without it the math function is
+mapped straight over an array('d'), so neither path pays for a Python-level
+call per element. Both paths return an array('d') (and a bytearray of 1/0
+validity flags under policy="mask"), so results do not depend on the backend.
+Domain errors follow an explicit policy: nan, raise or mask.
+"""
+
+import builtins
+import math
+import time
+import argparse
+from array import array
+from functools import partial
+from numbers import Real
+from typing import Callable, Optional
+
+# Third-party imports with graceful fallbacks
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+POLICIES = ("nan", "raise", "mask")
+
+
+class MathDomainError(ValueError):
+    """Raised under policy="raise" for inputs outside a function's domain"""
+
+
+def _py_pow(base: float, exponent: float) -> float:
+    # Overflow is a range problem, not a domain one; report it like NumPy does
+    try:
+        return math.pow(base, exponent)
+    except OverflowError:
+        if base < 0 and float(exponent).is_integer() and exponent % 2:
+            return -math.inf
+        return math.inf
+
+
+def _finish(result, invalid, policy: str, name: str, inputs, scalar: bool):
+    """Apply the domain-error policy to a computed result"""
+    if NUMPY_AVAILABLE and isinstance(result, np.ndarray):
+        if invalid is not None and invalid.any():
+            if policy == "raise":
+                index = int(np.flatnonzero(invalid)[0])
+                raise MathDomainError(f"{name}: {_input_at(inputs, index)} is outside the domain (index {index})")
+            result[invalid] = np.nan
+        values = array("d")
+        values.frombytes(np.ascontiguousarray(result, dtype=np.float64).tobytes())
+        if policy == "mask":
+            flags = ~invalid if invalid is not None else np.ones(result.shape, dtype=bool)
+            valid = bytearray(flags.astype(np.uint8).tobytes())
+            return (values[0], bool(valid[0])) if scalar else (values, valid)
+        return values[0] if scalar else values
+    # array('d') fallback, invalid is a list of bad indexes
+    if invalid and policy == "raise":
+        index = invalid[0]
+        raise MathDomainError(f"{name}: {_input_at(inputs, index)} is outside the domain (index {index})")
+    if policy == "mask":
+        valid = bytearray([1]) * len(result)
+        for index in invalid:
+            valid[index] = 0
+        return (result[0], bool(valid[0])) if scalar else (result, valid)
+    return result[0] if scalar else result
+
+
+def _input_at(inputs, index: int):
+    values = [item if isinstance(item, Real) else item[index] for item in inputs]
+    values = [value.item() if hasattr(value, "item") else value for value in values]
+    return values[0] if len(values) == 1 else tuple(values)
+
+
+def _prepare(values, policy: str):
+    if policy not in POLICIES:
+        raise ValueError(f"policy must be one of {POLICIES}")
+    scalar = isinstance(values, Real)
+    if scalar:
+        values = [values]
+    return values, scalar
+
+
+def _kernel(name: str, py_func: Callable, np_func: Optional[Callable],
+            np_invalid: Optional[Callable], values, policy: str, use_numpy: Optional[bool],
+            py_valid: Optional[Callable] = None):
+    values, scalar = _prepare(values, policy)
+    if use_numpy is None:
+        use_numpy = NUMPY_AVAILABLE
+    if use_numpy and np_func is not None:
+        data = np.asarray(values, dtype=np.float64)
+        with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+            result = np_func(data)
+            invalid = np_invalid(data) if np_invalid else None
+        return _finish(result, invalid, policy, name, (data,), scalar)
+    # One C-level map over the whole input; only go element by element on errors
+    try:
+        result = array("d", map(py_func, values))
+        clean = py_valid is None or all(map(py_valid, values))
+    except (ValueError, OverflowError):
+        clean = False
+    invalid = []
+    if not clean:
+        result = array("d", bytes(8 * len(values)))
+        for index, value in enumerate(values):
+            try:
+                if py_valid is not None and not py_valid(value):
+                    raise ValueError(value)
+                result[index] = py_func(value)
+            except (ValueError, OverflowError):
+                result[index] = math.nan
+                invalid.append(index)
+    return _finish(result, invalid, policy, name, (values,), scalar)
+
+
+def _not_finite(data):
+    return ~np.isfinite(data)
+
+
+def floor(values, policy: str = "nan", use_numpy: Optional[bool] = None):
+    """Largest integer <= x, as floats; nan and inf are domain errors"""
+    return _kernel("floor", math.floor, np.floor if NUMPY_AVAILABLE else None,
+                   _not_finite, values, policy, use_numpy)
+
+
+def ceil(values, policy: str = "nan", use_numpy: Optional[bool] = None):
+    """Smallest integer >= x, as floats; nan and inf are domain errors"""
+    return _kernel("ceil", math.ceil, np.ceil if NUMPY_AVAILABLE else None,
+                   _not_finite, values, policy, use_numpy)
+
+
+def sqrt(values, policy: str = "nan", use_numpy: Optional[bool] = None):
+    """Square root; negative inputs are domain errors"""
+    return _kernel("sqrt", math.sqrt, np.sqrt if NUMPY_AVAILABLE else None,
+                   lambda data: data < 0, values, policy, use_numpy)
+
+
+def abs(values, policy: str = "nan", use_numpy: Optional[bool] = None):
+    """Absolute value (never a domain error)"""
+    return _kernel("abs", math.fabs, np.abs if NUMPY_AVAILABLE else None,
+                   None, values, policy, use_numpy)
+
+
+def round(values, ndigits: int = 0, policy: str = "nan", use_numpy: Optional[bool] = None):
+    """Round exactly like the builtin; nan and inf are domain errors
+
+    np.round scales by 10**ndigits first, so it only agrees with the builtin
+    for whole numbers (np.round(2.675, 2) is 2.68, round(2.675, 2) is 2.67).
+    Other ndigits always take the builtin map.
+    """
+    np_round = np.round if NUMPY_AVAILABLE and ndigits == 0 else None
+    return _kernel("round", partial(builtins.round, ndigits=ndigits), np_round, _not_finite,
+                   values, policy, use_numpy, py_valid=math.isfinite)
+
+
+def pow(base, exponent, policy: str = "nan", use_numpy: Optional[bool] = None):
+    """base ** exponent elementwise; either side may be a scalar
+
+    A negative base with a fractional exponent and zero to a negative power
+    are domain errors. Overflow gives inf, as in NumPy.
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"policy must be one of {POLICIES}")
+    scalar = isinstance(base, Real) and isinstance(exponent, Real)
+    if use_numpy is None:
+        use_numpy = NUMPY_AVAILABLE
+    if use_numpy:
+        b, e = np.broadcast_arrays(np.atleast_1d(np.asarray(base, dtype=np.float64)),
+                                   np.atleast_1d(np.asarray(exponent, dtype=np.float64)))
+        with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+            result = np.power(b, e)
+            invalid = ((b < 0) & (e != np.floor(e))) | ((b == 0) & (e < 0))
+        return _finish(result, invalid, policy, "pow", (b, e), scalar)
+    if scalar:
+        bases, exponents = [base], [exponent]
+    else:
+        length = len(base) if not isinstance(base, Real) else len(exponent)
+        bases = [base] * length if isinstance(base, Real) else base
+        exponents = [exponent] * length if isinstance(exponent, Real) else exponent
+        if len(bases) != len(exponents):
+            raise ValueError("base and exponent must have the same length")
+    try:
+        result = array("d", map(math.pow, bases, exponents))
+        invalid = []
+    except (ValueError, OverflowError):
+        result = array("d", bytes(8 * len(bases)))
+        invalid = []
+        for index, (b, e) in enumerate(zip(bases, exponents)):
+            try:
+                result[index] = _py_pow(b, e)
+            except ValueError:
+                result[index] = math.nan
+                invalid.append(index)
+    return _finish(result, invalid, policy, "pow", (bases, exponents), scalar)
+
+
+def benchmark(size: int = 1_000_000, repeat: int = 3):
+    """Kernels against list comprehensions over the math module (best of repeat)"""
+    import random
+    random.seed(6)
+    values = [random.uniform(-1000, 1000) for _ in range(size)]
+    positive = [builtins.abs(v) for v in values]
+    buffer = array("d", positive)
+
+    def best(func) -> float:
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    cases = [
+        ("floor", lambda: [math.floor(v) for v in values], lambda u: floor(values, use_numpy=u)),
+        ("ceil", lambda: [math.ceil(v) for v in values], lambda u: ceil(values, use_numpy=u)),
+        ("sqrt", lambda: [math.sqrt(v) for v in positive], lambda u: sqrt(buffer, use_numpy=u)),
+        ("sqrt mixed", lambda: [math.sqrt(v) if v >= 0 else math.nan for v in values],
+         lambda u: sqrt(values, use_numpy=u)),
+        ("pow", lambda: [math.pow(v, 2.5) for v in positive], lambda u: pow(buffer, 2.5, use_numpy=u)),
+        ("round", lambda: [builtins.round(v, 2) for v in values], lambda u: round(values, 2, use_numpy=u)),
+        ("abs", lambda: [builtins.abs(v) for v in values], lambda u: abs(values, use_numpy=u)),
+    ]
+    print(f"{size:,} values        list comp    array map" + ("      numpy" if NUMPY_AVAILABLE else ""))
+    for name, reference, kernel in cases:
+        line = f"{name:<14} {best(reference):10.4f}s  {best(lambda: kernel(False)):10.4f}s"
+        if NUMPY_AVAILABLE:
+            line += f" {best(lambda: kernel(True)):10.4f}s"
+        print(line)
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Vectorized math kernels")
+    parser.add_argument("--benchmark", type=int, default=1_000_000, metavar="SIZE")
+    args = parser.parse_args()
+    benchmark(args.benchmark)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Memoization Layer for the lesson functions (Python11, Python13, Python18)
+A caching decorator with a size-bounded LRU, optional time-to-live, typed
+keys, a thread-safe mode and hit/miss/eviction statistics. An optional
+SQLite file adds a persistent second tier that survives restarts.
+"""
+
+import pickle
+import sqlite3
+import threading
+import time
+import argparse
+from collections import OrderedDict
+from contextlib import nullcontext
+from dataclasses import dataclass, asdict
+from functools import wraps
+from typing import Any, Callable, Optional, Tuple
+
+_KWARGS_MARK = object()
+_MISSING = object()
+
+
+@dataclass
+class CacheStats:
+    """Counters for one memoized function"""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    disk_hits: int = 0
+    currsize: int = 0
+    maxsize: Optional[int] = None
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __str__(self) -> str:
+        return (f"hits {self.hits:,} (disk {self.disk_hits:,})  misses {self.misses:,}  "
+                f"evictions {self.evictions:,}  expired {self.expirations:,}  "
+                f"size {self.currsize:,}/{self.maxsize}  hit rate {self.hit_rate:.1%}")
+
+
+def make_key(args: tuple, kwargs: dict, typed: bool) -> Tuple:
+    """Hashable key for a call, like functools.lru_cache builds"""
+    key = args
+    if kwargs:
+        key += (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+    if typed:
+        key += tuple(type(arg) for arg in args)
+        if kwargs:
+            key += tuple(type(value) for _, value in sorted(kwargs.items()))
+    return key
+
+
+class DiskTier:
+    """Pickled results in a SQLite table, keyed by function and call"""
+
+    def __init__(self, path: str, name: str, ttl: Optional[float] = None):
+        self.name = name
+        self.ttl = ttl
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS memo (func TEXT, key BLOB, value BLOB, "
+                         "expires REAL, PRIMARY KEY (func, key)) WITHOUT ROWID")
+
+    @staticmethod
+    def _encode(key: Tuple) -> bytes:
+        # The kwargs marker is process-local, so store a stable stand-in
+        return pickle.dumps(tuple("\0kwargs" if part is _KWARGS_MARK else part for part in key), protocol=4)
+
+    def get(self, key: Tuple):
+        row = self._db.execute("SELECT value, expires FROM memo WHERE func = ? AND key = ?",
+                               (self.name, self._encode(key))).fetchone()
+        if row is None:
+            return _MISSING
+        if row[1] is not None and row[1] < time.time():
+            self._db.execute("DELETE FROM memo WHERE func = ? AND key = ?", (self.name, self._encode(key)))
+            return _MISSING
+        return pickle.loads(row[0])
+
+    def put(self, key: Tuple, value: Any):
+        expires = time.time() + self.ttl if self.ttl is not None else None
+        self._db.execute("INSERT OR REPLACE INTO memo VALUES (?, ?, ?, ?)",
+                         (self.name, self._encode(key), pickle.dumps(value, protocol=4), expires))
+
+    def clear(self):
+        self._db.execute("DELETE FROM memo WHERE func = ?", (self.name,))
+
+    def close(self):
+        self._db.close()
+
+
+def memoize(maxsize: Optional[int] = 128, ttl: Optional[float] = None, typed: bool = False,
+            thread_safe: bool = True, disk: Optional[str] = None) -> Callable:
+    """Cache a pure function's results
+
+    maxsize bounds the in-memory LRU (None is unbounded, 0 keeps only the
+    disk tier), ttl expires entries after that many seconds, typed caches
+    f(1) and f(1.0) separately and disk names a SQLite file for a persistent
+    second tier. The wrapper gains cache_stats(), cache_clear() and
+    cache_close(). The function itself runs outside the lock, so concurrent
+    misses on the same key may both compute it.
+    """
+    if maxsize is not None and maxsize < 0:
+        raise ValueError("maxsize must be >= 0 or None")
+
+    def decorator(func: Callable) -> Callable:
+        entries: "OrderedDict[Tuple, Tuple[Any, Optional[float]]]" = OrderedDict()
+        stats = CacheStats(maxsize=maxsize)
+        lock = threading.RLock() if thread_safe else nullcontext()
+        tier = DiskTier(disk, f"{func.__module__}.{func.__qualname__}", ttl) if disk else None
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = make_key(args, kwargs, typed)
+            with lock:
+                entry = entries.get(key)
+                if entry is not None:
+                    value, expires = entry
+                    if expires is None or expires > time.monotonic():
+                        entries.move_to_end(key)
+                        stats.hits += 1
+                        return value
+                    del entries[key]
+                    stats.expirations += 1
+                if tier is not None:
+                    value = tier.get(key)
+                    if value is not _MISSING:
+                        stats.hits += 1
+                        stats.disk_hits += 1
+                        _store(key, value)
+                        return value
+                stats.misses += 1
+            value = func(*args, **kwargs)
+            with lock:
+                _store(key, value)
+                if tier is not None:
+                    tier.put(key, value)
+            return value
+
+        def _store(key, value):
+            if maxsize == 0:
+                return
+            entries[key] = (value, time.monotonic() + ttl if ttl is not None else None)
+            entries.move_to_end(key)
+            if maxsize is not None and len(entries) > maxsize:
+                entries.popitem(last=False)
+                stats.evictions += 1
+            stats.currsize = len(entries)
+
+        def cache_stats() -> CacheStats:
+            with lock:
+                stats.currsize = len(entries)
+                return CacheStats(**asdict(stats))
+
+        def cache_clear(disk_too: bool = False):
+            with lock:
+                entries.clear()
+                stats.__init__(maxsize=maxsize)
+                if disk_too and tier is not None:
+                    tier.clear()
+
+        def cache_close():
+            if tier is not None:
+                tier.close()
+
+        wrapper.cache_stats = cache_stats
+        wrapper.cache_clear = cache_clear
+        wrapper.cache_close = cache_close
+        return wrapper
+
+    return decorator
+
+
+def benchmark(queries: int = 200_000, distinct: int = 2000, path: str = "memo_bench.sqlite"):
+    """Repeated-query workload (Zipf-like) with and without the cache"""
+    import os
+    import random
+    from power_engine import power
+    random.seed(45)
+    # Few hot queries, long tail, like a real lookup workload
+    weights = [1 / (rank + 1) for rank in range(distinct)]
+    workload = random.choices([(3 + rank % 50, 2000 + rank) for rank in range(distinct)],
+                              weights, k=queries)
+
+    def raise_to_power(base, exponent):
+        return power(base, exponent)
+
+    start = time.perf_counter()
+    for base, exponent in workload:
+        raise_to_power(base, exponent)
+    plain = time.perf_counter() - start
+    print(f"uncached            {plain:7.2f}s")
+
+    for maxsize in (64, 512, None):
+        cached = memoize(maxsize=maxsize)(raise_to_power)
+        start = time.perf_counter()
+        for base, exponent in workload:
+            cached(base, exponent)
+        print(f"LRU maxsize {str(maxsize):<7} {time.perf_counter() - start:7.2f}s   {cached.cache_stats()}")
+
+    try:
+        warm = memoize(maxsize=64, disk=path)(raise_to_power)
+        for base, exponent in workload:
+            warm(base, exponent)
+        warm.cache_close()
+        # A fresh decorator on the same file stands in for a restarted process
+        restarted = memoize(maxsize=64, disk=path)(raise_to_power)
+        start = time.perf_counter()
+        for base, exponent in workload:
+            restarted(base, exponent)
+        print(f"restart + disk tier {time.perf_counter() - start:7.2f}s   {restarted.cache_stats()}")
+        restarted.cache_close()
+    finally:
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Memoization decorator with LRU, TTL and disk tier")
+    parser.add_argument("--queries", type=int, default=200_000)
+    parser.add_argument("--distinct", type=int, default=2000)
+    args = parser.parse_args()
+    benchmark(args.queries, args.distinct)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""
+Validated Numeric Input for the Python19 try/except lesson
+parse_value checks one typed-in value against an int or float spec with an
+optional range. parse_file and parse_stream do the same for millions of
+lines, chunk by chunk from a memory map or stream. With NumPy, int chunks
+are decoded straight from the bytes; otherwise each chunk is converted with
+one C-level map() and only blocks holding bad rows are re-checked by regex,
+so a bad row never costs an exception of its own. Rejected rows are
+reported per line and can be streamed to a reject file.
+"""
+
+import math
+import mmap
+import operator
+import re
+import sys
+import time
+import argparse
+from array import array
+from dataclasses import dataclass, field
+from itertools import compress, repeat
+from typing import BinaryIO, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+# Third-party imports with graceful fallbacks
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+CHUNK_SIZE = 1 << 17      # keeps the NumPy temporaries of a chunk in cache
+BLOCK_LINES = 128
+MAX_KEPT_REJECTS = 1000
+INT64_MIN = -(1 << 63)
+INT64_MAX = (1 << 63) - 1
+
+# What int() and float() accept from bytes, minus inf and nan
+_DIGITS = rb"\d+(?:_\d+)*"
+_INT_PATTERN = re.compile(rb"\s*[+-]?" + _DIGITS + rb"\s*")
+_FLOAT_PATTERN = re.compile(rb"\s*[+-]?(?:" + _DIGITS + rb"(?:\.(?:" + _DIGITS + rb")?)?|\." + _DIGITS + rb")"
+                            rb"(?:[eE][+-]?" + _DIGITS + rb")?\s*")
+_NEWLINE, _CR, _MINUS, _PLUS, _ZERO, _NINE = b"\n\r-+09"
+
+if NUMPY_AVAILABLE:
+    _POW10 = 10 ** np.arange(19, dtype=np.int64)
+
+
+class NumericInputError(ValueError):
+    """Raised by parse_value for input that does not meet its spec"""
+
+
+class NumericSpec(NamedTuple):
+    """Accepted values: kind is "int" or "float", bounds are inclusive"""
+    kind: str = "int"
+    minimum: Optional[float] = None
+    maximum: Optional[float] = None
+
+    @property
+    def typecode(self) -> str:
+        return "q" if self.kind == "int" else "d"
+
+    @property
+    def bounds(self) -> Tuple[float, float]:
+        """Effective (low, high), including the int64 limits of the value array"""
+        if self.kind == "int":
+            low, high = INT64_MIN, INT64_MAX
+        else:
+            low, high = -math.inf, math.inf
+        if self.minimum is not None:
+            low = max(low, math.ceil(self.minimum) if self.kind == "int" else self.minimum)
+        if self.maximum is not None:
+            high = min(high, math.floor(self.maximum) if self.kind == "int" else self.maximum)
+        return low, high
+
+
+class Reject(NamedTuple):
+    """A row that failed validation, with its 1-based line number"""
+    line: int
+    text: str
+    reason: str
+
+
+@dataclass
+class ParseResult:
+    """Accepted values in input order plus what was rejected
+
+    Only the first MAX_KEPT_REJECTS rejects are kept in memory; the reject
+    file, when given, receives all of them.
+    """
+    values: array
+    rows: int = 0
+    rejected: int = 0
+    rejects: List[Reject] = field(default_factory=list)
+
+    @property
+    def accepted(self) -> int:
+        return len(self.values)
+
+    def report(self, limit: int = 5) -> str:
+        lines = [f"{self.rows:,} rows: {self.accepted:,} accepted, {self.rejected:,} rejected"]
+        lines += [f"  line {r.line}: {r.reason}: {r.text!r}" for r in self.rejects[:limit]]
+        if self.rejected > limit:
+            lines.append(f"  ... {self.rejected - limit:,} more")
+        return "\n".join(lines)
+
+
+AGE = NumericSpec("int", 0, 150)
+ANY_INT = NumericSpec("int")
+
+
+def _check_kind(spec: NumericSpec):
+    if spec.kind not in ("int", "float"):
+        raise ValueError('kind must be "int" or "float"')
+
+
+def _range_reason(value, spec: NumericSpec, low: float, high: float) -> Optional[str]:
+    if spec.kind == "float" and not math.isfinite(value):
+        return "not finite"
+    if spec.minimum is not None and value < spec.minimum:
+        return f"below minimum {spec.minimum:g}"
+    if spec.maximum is not None and value > spec.maximum:
+        return f"above maximum {spec.maximum:g}"
+    if value < low or value > high:
+        return "out of 64-bit range"
+    return None
+
+
+def _format_reason(raw: bytes, spec: NumericSpec) -> str:
+    if not raw.strip():
+        return "empty"
+    return "not an integer" if spec.kind == "int" else "not a number"
+
+
+def parse_value(text: Union[str, bytes], spec: NumericSpec = ANY_INT):
+    """One int or float from text, or NumericInputError saying what is wrong"""
+    _check_kind(spec)
+    raw = text.encode("utf-8", "replace") if isinstance(text, str) else text
+    pattern = _INT_PATTERN if spec.kind == "int" else _FLOAT_PATTERN
+    if pattern.fullmatch(raw) is None:
+        raise NumericInputError(f"{_format_reason(raw, spec)}: {text!r}")
+    value = int(raw) if spec.kind == "int" else float(raw)
+    reason = _range_reason(value, spec, *spec.bounds)
+    if reason:
+        raise NumericInputError(f"{reason}: {text!r}")
+    return value
+
+
+class _Parser:
+    """Chunk-at-a-time conversion shared by parse_file and parse_stream"""
+
+    def __init__(self, spec: NumericSpec, reject_file: Optional[BinaryIO], use_numpy: Optional[bool]):
+        _check_kind(spec)
+        if use_numpy is None:
+            use_numpy = NUMPY_AVAILABLE
+        # Only ints are decoded by NumPy; floats always go through float()
+        self.use_numpy = use_numpy and spec.kind == "int"
+        self.spec = spec
+        self.convert = int if spec.kind == "int" else float
+        self.pattern = _INT_PATTERN if spec.kind == "int" else _FLOAT_PATTERN
+        self.low, self.high = spec.bounds
+        self.result = ParseResult(array(spec.typecode))
+        self.reject_file = reject_file
+
+    def _in_range(self, values) -> bool:
+        if not values:
+            return True
+        if self.spec.kind == "float" and not all(map(math.isfinite, values)):
+            return False
+        return self.low <= min(values) and max(values) <= self.high
+
+    def _try_block(self, lines: List[bytes]) -> bool:
+        # Fast path: the whole block converts and fits the range. float() also
+        # takes inf and nan, but those never pass the finiteness check
+        try:
+            values = array(self.spec.typecode, map(self.convert, lines))
+        except (ValueError, OverflowError):
+            return False
+        if not self._in_range(values):
+            return False
+        self.result.values.extend(values)
+        return True
+
+    def feed(self, chunk: bytes, first_line: int) -> int:
+        """Convert a chunk of whole lines numbered from first_line, return the line count"""
+        if self.use_numpy:
+            return self._feed_numpy(chunk, first_line)
+        lines = chunk.split(b"\n")
+        if lines[-1] == b"":
+            lines.pop()
+        self.result.rows += len(lines)
+        if self._try_block(lines):
+            return len(lines)
+        # Retry block by block, so a few bad rows only slow down their own block
+        for start in range(0, len(lines), BLOCK_LINES):
+            block = lines[start:start + BLOCK_LINES]
+            if not self._try_block(block):
+                self._classify(block, first_line + start)
+        return len(lines)
+
+    def _feed_numpy(self, chunk: bytes, first_line: int) -> int:
+        # Decode every "[+-]digits" line straight from the bytes: a line's
+        # value is the difference of a running sum of digit * 10**place. The
+        # sum may wrap around int64, but each difference is still exact.
+        buf = np.frombuffer(chunk, dtype=np.uint8)
+        ends = np.flatnonzero(buf == _NEWLINE)
+        if len(buf) and buf[-1] != _NEWLINE:
+            ends = np.append(ends, len(buf))
+        count = len(ends)
+        self.result.rows += count
+        if not count:
+            return 0
+        starts = np.zeros(count, dtype=np.intp)
+        starts[1:] = ends[:-1] + 1
+        stops = ends - ((ends > starts) & (buf[np.maximum(ends - 1, 0)] == _CR))
+        lead = buf[np.minimum(starts, len(buf) - 1)]
+        signed = (stops > starts) & ((lead == _MINUS) | (lead == _PLUS))
+        first = starts + signed
+        places = stops - first
+        nondigit = np.zeros(len(buf) + 1, dtype=np.intp)
+        np.cumsum((buf < _ZERO) | (buf > _NINE), out=nondigit[1:])
+        simple = (places >= 1) & (places <= 18) & (nondigit[stops] == nondigit[first])
+
+        line_of = np.cumsum(buf == _NEWLINE) - (buf == _NEWLINE)
+        place = np.clip(stops[line_of] - 1 - np.arange(len(buf)), 0, 18)
+        running = np.zeros(len(buf) + 1, dtype=np.int64)
+        np.cumsum((buf.astype(np.int64) - _ZERO) * _POW10[place], out=running[1:])
+        values = running[stops] - running[first]
+        np.negative(values, out=values, where=signed & (lead == _MINUS))
+
+        # Anything else (spaces, underscores, junk, huge numbers) goes through
+        # the regex one line at a time; valid values land back in place
+        ok = simple.copy()
+        bad = []
+        for index in np.flatnonzero(~simple).tolist():
+            raw = chunk[starts[index]:ends[index]]
+            if self.pattern.fullmatch(raw) is None:
+                bad.append((index, _format_reason(raw, self.spec)))
+                continue
+            value = int(raw)
+            if INT64_MIN <= value <= INT64_MAX:
+                values[index] = value
+                ok[index] = True
+            else:
+                bad.append((index, _range_reason(value, self.spec, self.low, self.high)))
+        misfit = ok & ((values < self.low) | (values > self.high))
+        if misfit.any():
+            ok &= ~misfit
+            bad += [(index, _range_reason(int(values[index]), self.spec, self.low, self.high))
+                    for index in np.flatnonzero(misfit).tolist()]
+            bad.sort()
+        self.result.values.frombytes(values[ok].tobytes())
+        for index, reason in bad:
+            self._reject(first_line + index, chunk[starts[index]:ends[index]], reason)
+        return count
+
+    def _classify(self, lines: List[bytes], first_line: int):
+        result = self.result
+        # Slow path, still without an exception per bad row: plain digit runs
+        # are valid as they are, only the other lines go through the regex
+        matched = list(map(bytes.isdigit, lines))
+        for index in compress(range(len(lines)), map(operator.not_, matched)):
+            matched[index] = self.pattern.fullmatch(lines[index]) is not None
+        positions = list(compress(range(len(lines)), matched))
+        converted = list(map(self.convert, compress(lines, matched)))
+        bad = [(index, _format_reason(lines[index], self.spec))
+               for index in compress(range(len(lines)), map(operator.not_, matched))]
+        if not self._in_range(converted):
+            # range() membership is O(1) for ints; floats compare against the
+            # bounds and need isfinite too, since infinite bounds let inf through
+            if self.spec.kind == "int":
+                fits = list(map(range(self.low, self.high + 1).__contains__, converted))
+            else:
+                fits = list(map(operator.and_, map(math.isfinite, converted),
+                                map(operator.and_, map(operator.le, repeat(self.low), converted),
+                                    map(operator.ge, repeat(self.high), converted))))
+            misfits = list(map(operator.not_, fits))
+            bad += [(index, _range_reason(value, self.spec, self.low, self.high))
+                    for index, value in zip(compress(positions, misfits), compress(converted, misfits))]
+            converted = list(compress(converted, fits))
+            bad.sort()
+        result.values.extend(array(self.spec.typecode, converted))
+        for index, reason in bad:
+            self._reject(first_line + index, lines[index], reason)
+
+    def _reject(self, line: int, raw: bytes, reason: str):
+        result = self.result
+        result.rejected += 1
+        text = raw.rstrip(b"\r").decode("utf-8", "replace")
+        if len(result.rejects) < MAX_KEPT_REJECTS:
+            result.rejects.append(Reject(line, text, reason))
+        if self.reject_file is not None:
+            self.reject_file.write(f"{line}\t{reason}\t{text}\n".encode("utf-8"))
+
+
+def _chunks(buffer, chunk_size: int) -> Iterator[bytes]:
+    """Runs of whole lines from a bytes-like buffer, cut at newlines near chunk_size"""
+    size = len(buffer)
+    start = 0
+    while start < size:
+        end = buffer.find(b"\n", min(start + chunk_size, size) - 1)
+        end = size if end < 0 else end + 1
+        yield buffer[start:end]
+        start = end
+
+
+def _run(parser: _Parser, chunks: Iterator[bytes]) -> ParseResult:
+    line = 1
+    for chunk in chunks:
+        line += parser.feed(chunk, line)
+    return parser.result
+
+
+def parse_buffer(buffer, spec: NumericSpec = ANY_INT, reject_file: Optional[BinaryIO] = None,
+                 chunk_size: int = CHUNK_SIZE, use_numpy: Optional[bool] = None) -> ParseResult:
+    """Parse one value per line from bytes, a bytearray or an mmap"""
+    return _run(_Parser(spec, reject_file, use_numpy), _chunks(buffer, chunk_size))
+
+
+def parse_file(path: str, spec: NumericSpec = ANY_INT, reject_path: Optional[str] = None,
+               chunk_size: int = CHUNK_SIZE, use_numpy: Optional[bool] = None) -> ParseResult:
+    """Parse a file through a read-only memory map, chunk by chunk"""
+    reject_file = open(reject_path, "wb") if reject_path else None
+    try:
+        with open(path, "rb") as f:
+            try:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped
+                return parse_buffer(b"", spec, reject_file, chunk_size, use_numpy)
+            with buffer:
+                return parse_buffer(buffer, spec, reject_file, chunk_size, use_numpy)
+    finally:
+        if reject_file is not None:
+            reject_file.close()
+
+
+def parse_stream(stream: BinaryIO, spec: NumericSpec = ANY_INT, reject_file: Optional[BinaryIO] = None,
+                 chunk_size: int = CHUNK_SIZE, use_numpy: Optional[bool] = None) -> ParseResult:
+    """Parse a binary stream (a pipe, socket or sys.stdin.buffer) that cannot be mapped"""
+    def chunks():
+        tail = b""
+        for block in iter(lambda: stream.read(chunk_size), b""):
+            block = tail + block
+            cut = block.rfind(b"\n") + 1
+            tail = block[cut:]
+            if cut:
+                yield block[:cut]
+        if tail:
+            yield tail
+    return _run(_Parser(spec, reject_file, use_numpy), chunks())
+
+
+def benchmark(lines: int = 5_000_000, path: str = "numeric_bench.txt"):
+    """parse_file against a per-line try/except loop and a plain read"""
+    import os
+    import random
+    random.seed(49)
+    with open(path, "w") as f:
+        for start in range(0, lines, 100_000):
+            rows = [str(random.randint(0, 120)) for _ in range(min(100_000, lines - start))]
+            for _ in range(len(rows) // 1000):
+                rows[random.randrange(len(rows))] = random.choice(["", "abc", "12x", "1e5", "-3", "999999"])
+            f.write("\n".join(rows) + "\n")
+    try:
+        start = time.perf_counter()
+        with open(path, "rb") as f:
+            f.read().split(b"\n")
+        print(f"read + split          {time.perf_counter() - start:7.2f}s")
+
+        # The lesson pattern, keeping values and rejects like parse_file does
+        start = time.perf_counter()
+        values = array("q")
+        rejects = []
+        with open(path, "rb") as f:
+            for line, raw in enumerate(f, 1):
+                try:
+                    value = int(raw)
+                except ValueError:
+                    rejects.append((line, raw))
+                    continue
+                if 0 <= value <= 150:
+                    values.append(value)
+                else:
+                    rejects.append((line, raw))
+        print(f"try/except per line   {time.perf_counter() - start:7.2f}s   {len(values):,} accepted")
+
+        for label, use_numpy in (("parse_file", None), ("parse_file (no numpy)", False)):
+            if use_numpy is None and not NUMPY_AVAILABLE:
+                continue
+            start = time.perf_counter()
+            result = parse_file(path, AGE, reject_path=path + ".rejects", use_numpy=use_numpy)
+            print(f"{label:<21} {time.perf_counter() - start:7.2f}s   {result.accepted:,} accepted, "
+                  f"{result.rejected:,} rejected")
+    finally:
+        for leftover in (path, path + ".rejects"):
+            if os.path.exists(leftover):
+                os.remove(leftover)
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Bulk validated numeric input")
+    parser.add_argument("path", nargs="?", help="File with one value per line ('-' for stdin)")
+    parser.add_argument("--kind", choices=["int", "float"], default="int")
+    parser.add_argument("--min", type=float, dest="minimum")
+    parser.add_argument("--max", type=float, dest="maximum")
+    parser.add_argument("--rejects", help="Write rejected rows to this file")
+    parser.add_argument("--benchmark", type=int, metavar="LINES", help="Run the benchmark")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.benchmark)
+        return
+    if not args.path:
+        parser.error("path is required")
+    spec = NumericSpec(args.kind, args.minimum, args.maximum)
+    if args.path == "-":
+        rejects = open(args.rejects, "wb") if args.rejects else None
+        try:
+            result = parse_stream(sys.stdin.buffer, spec, rejects)
+        finally:
+            if rejects is not None:
+                rejects.close()
+    else:
+        result = parse_file(args.path, spec, args.rejects)
+    print(result.report())
+
+
+if __name__ == "__main__":
+    main()
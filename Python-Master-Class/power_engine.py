@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Power Engine for the Python18 exponent lesson
+Modular exponentiation, size limits before huge results are built, streaming
+decimal output for very large powers and a batch mode over (base, exp, mod).
+"""
+
+import math
+import time
+import argparse
+from functools import lru_cache
+from typing import Iterator, List, Optional, Sequence
+
+# Third-party imports with graceful fallbacks
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+DEFAULT_MAX_DIGITS = 1_000_000
+DIGIT_CHUNK = 1000  # str() of this many digits stays well under the int->str limit
+
+
+class PowerLimitError(ValueError):
+    """Raised when a power would exceed the configured size limit"""
+
+
+def estimate_digits(base: int, exp: int) -> int:
+    """Number of decimal digits in base**exp, without computing it"""
+    if exp < 0:
+        raise ValueError("estimate_digits needs a non-negative exponent")
+    base = abs(base)
+    if exp == 0 or base == 1:
+        return 1
+    if base == 0:
+        return 1
+    return math.floor(exp * math.log10(base)) + 1
+
+
+def power(base: int, exp: int, mod: Optional[int] = None,
+          max_digits: Optional[int] = DEFAULT_MAX_DIGITS) -> int:
+    """base**exp, or base**exp % mod, refusing results larger than max_digits
+
+    Without a mod a negative exponent gives a float, as base ** exp does.
+    """
+    if mod is not None:
+        if mod == 0:
+            raise ValueError("mod must be non-zero")
+        # pow() handles negative exponents through the modular inverse
+        return pow(base, exp, mod)
+    if exp < 0:
+        # A float like plain **; it is never bigger than base itself
+        return base ** exp
+    if max_digits is not None and estimate_digits(base, exp) > max_digits:
+        raise PowerLimitError(
+            f"{base}**{exp} has about {estimate_digits(base, exp):,} digits, limit is {max_digits:,}")
+    return base ** exp
+
+
+@lru_cache(maxsize=64)
+def _power_of_ten(exp: int) -> int:
+    return 10 ** exp
+
+
+def iter_digits(value: int, chunk: int = DIGIT_CHUNK) -> Iterator[str]:
+    """Yield the decimal digits of a huge int in order, in chunks of text"""
+    if value < 0:
+        yield "-"
+        value = -value
+    yield from _iter_digits(value, 0, chunk)
+
+
+def _iter_digits(value: int, width: int, chunk: int) -> Iterator[str]:
+    # Split value = high * 10**k + low so each half converts independently;
+    # width is the zero-padded length this piece must fill (0 for the leading piece)
+    if value < _power_of_ten(chunk):
+        text = str(value)
+        padding = width - len(text)
+        while padding > 0:
+            yield "0" * min(padding, chunk)
+            padding -= chunk
+        yield text
+        return
+    digits = width or estimate_digits_of(value)
+    half = (digits + 1) // 2
+    k = chunk
+    while k * 2 < half:
+        k *= 2
+    high, low = divmod(value, _power_of_ten(k))
+    yield from _iter_digits(high, width - k if width else 0, chunk)
+    yield from _iter_digits(low, k, chunk)
+
+
+def estimate_digits_of(value: int) -> int:
+    """Upper bound on the decimal digits of a non-negative int"""
+    return int(value.bit_length() * 0.30103) + 1
+
+
+def stream_power(base: int, exp: int, out, max_digits: Optional[int] = None,
+                 chunk: int = DIGIT_CHUNK) -> int:
+    """Write base**exp to a text stream chunk by chunk, return digits written"""
+    written = 0
+    for piece in iter_digits(power(base, exp, max_digits=max_digits), chunk):
+        out.write(piece)
+        written += len(piece)
+    return written
+
+
+def batch_power(bases: Sequence[int], exps: Sequence[int],
+                mods: Optional[Sequence[int]] = None, use_numpy: bool = None) -> List[int]:
+    """Element-wise pow over equal-length sequences of bases, exponents and mods"""
+    if len(bases) != len(exps) or (mods is not None and len(mods) != len(bases)):
+        raise ValueError("bases, exps and mods must all have the same length")
+    if use_numpy is None:
+        use_numpy = NUMPY_AVAILABLE
+    if mods is None:
+        return [power(b, e) for b, e in zip(bases, exps)]
+    if use_numpy and NUMPY_AVAILABLE and _fits_uint32(bases, exps, mods):
+        return _batch_modpow_numpy(bases, exps, mods).tolist()
+    return [pow(b, e, m) for b, e, m in zip(bases, exps, mods)]
+
+
+def _fits_uint32(bases, exps, mods) -> bool:
+    # Products of two residues below 2**32 fit in uint64 without overflow
+    if not len(mods):
+        return False
+    return (min(mods) > 0 and max(mods) < 2 ** 32 and min(exps) >= 0
+            and min(bases) >= 0 and max(bases) < 2 ** 63 and max(exps) < 2 ** 63)
+
+
+def _batch_modpow_numpy(bases, exps, mods):
+    """Vectorized square-and-multiply over uint64 arrays"""
+    mod = np.asarray(mods, dtype=np.uint64)
+    base = np.asarray(bases, dtype=np.uint64) % mod
+    exp = np.asarray(exps, dtype=np.uint64)
+    result = np.ones_like(mod) % mod
+    while exp.any():
+        odd = (exp & np.uint64(1)).astype(bool)
+        result[odd] = (result[odd] * base[odd]) % mod[odd]
+        base = (base * base) % mod
+        exp >>= np.uint64(1)
+    return result
+
+
+def benchmark(repeat: int = 200):
+    """Time small ints through thousand-digit results, plus the batch mode"""
+    cases = [(2, 10), (7, 100), (3, 2_000), (12_345, 1_000), (10, 100_000)]
+    for base, exp in cases:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            value = power(base, exp)
+        elapsed = (time.perf_counter() - start) / repeat
+        start = time.perf_counter()
+        digits = sum(len(piece) for piece in iter_digits(value))
+        stream_elapsed = time.perf_counter() - start
+        print(f"{base}**{exp}: {digits:>7,} digits  pow {elapsed * 1e6:9.1f}us  "
+              f"to-text {stream_elapsed * 1e3:8.2f}ms")
+
+    size = 100_000
+    bases = [(i * 7919) % 1_000_003 for i in range(size)]
+    exps = [(i * 104_729) % 65_537 for i in range(size)]
+    mods = [1_000_000_007] * size
+    start = time.perf_counter()
+    batch_power(bases, exps, mods, use_numpy=False)
+    python_seconds = time.perf_counter() - start
+    print(f"batch modpow python: {size:,} in {python_seconds:.3f}s")
+    if NUMPY_AVAILABLE:
+        start = time.perf_counter()
+        batch_power(bases, exps, mods, use_numpy=True)
+        print(f"batch modpow numpy : {size:,} in {time.perf_counter() - start:.3f}s")
+
+
+def main():
+    """Main entry point"""
+    import sys
+    parser = argparse.ArgumentParser(description="Big-integer and modular power engine")
+    parser.add_argument("base", nargs="?", type=int)
+    parser.add_argument("exp", nargs="?", type=int)
+    parser.add_argument("--mod", type=int, help="Compute base**exp % mod")
+    parser.add_argument("--max-digits", type=int, default=DEFAULT_MAX_DIGITS)
+    parser.add_argument("--benchmark", action="store_true", help="Run the benchmarks")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark()
+        return
+    if args.base is None or args.exp is None:
+        parser.error("base and exp are required")
+    if args.mod is not None:
+        print(power(args.base, args.exp, args.mod))
+        return
+    stream_power(args.base, args.exp, sys.stdout, max_digits=args.max_digits)
+    print()
+
+
+if __name__ == "__main__":
+    main()
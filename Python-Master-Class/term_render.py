@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Frame-Diff Terminal Renderer for the ASCII-art lessons (Python02, Python04)
+Art is parsed once into cached, fixed-size frames. Each new frame is diffed
+against the one on screen cell by cell, and only the changed runs are sent,
+joined by relative ANSI cursor moves, in one buffered write per frame. The
+renderer draws in place below the current line, so lesson output around it
+is left alone.
+"""
+
+import sys
+import time
+import argparse
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Optional, Sequence, TextIO, Tuple
+
+HIDE_CURSOR = "\x1b[?25l"
+SHOW_CURSOR = "\x1b[?25h"
+MERGE_GAP = 2   # rewriting this many unchanged cells is cheaper than a cursor move
+BLANK = " "
+
+
+@dataclass(frozen=True)
+class Frame:
+    """A width x height grid of single-cell characters"""
+    rows: Tuple[str, ...]
+    width: int
+
+    @property
+    def height(self) -> int:
+        return len(self.rows)
+
+    @property
+    def full_size(self) -> int:
+        """Bytes a full redraw of this frame costs"""
+        return _full_size(self)
+
+    def text(self) -> str:
+        return "\n".join(self.rows)
+
+
+@lru_cache(maxsize=512)
+def frame(text: str, width: Optional[int] = None, height: Optional[int] = None) -> Frame:
+    """Frame for a block of text, padded with blanks to width x height (cached)"""
+    lines = text.split("\n")
+    width = max(map(len, lines)) if width is None else width
+    height = len(lines) if height is None else height
+    rows = tuple(line[:width].ljust(width) for line in lines[:height])
+    rows += (BLANK * width,) * (height - len(rows))
+    return Frame(rows, width)
+
+
+@lru_cache(maxsize=512)
+def _full_size(item: Frame) -> int:
+    return len(item.text().encode())
+
+
+@lru_cache(maxsize=4096)
+def diff_runs(before: Frame, after: Frame) -> Tuple[Tuple[int, int, str], ...]:
+    """(row, col, text) runs that turn before into after (cached per frame pair)"""
+    if before.width != after.width or before.height != after.height:
+        raise ValueError("frames must have the same size")
+    runs: List[Tuple[int, int, str]] = []
+    for row, (old, new) in enumerate(zip(before.rows, after.rows)):
+        if old == new:
+            continue
+        start = end = -1
+        for col, (a, b) in enumerate(zip(old, new)):
+            if a == b:
+                continue
+            if start < 0:
+                start = col
+            elif col - end > MERGE_GAP + 1:
+                runs.append((row, start, new[start:end + 1]))
+                start = col
+            end = col
+        runs.append((row, start, new[start:end + 1]))
+    return tuple(runs)
+
+
+def _move(row: int, col: int, to_row: int, to_col: int) -> str:
+    """Shortest relative cursor move between two cells"""
+    out = ""
+    if to_row < row:
+        out += f"\x1b[{row - to_row}A"
+    elif to_row > row:
+        out += f"\x1b[{to_row - row}B"
+    if to_col != col:
+        if to_col == 0:
+            out += "\r"
+        elif to_col > col:
+            out += f"\x1b[{to_col - col}C"
+        else:
+            out += f"\x1b[{col - to_col}D"
+    return out
+
+
+@dataclass
+class RenderStats:
+    """Bytes written against what full redraws would have cost"""
+    frames: int = 0
+    bytes_written: int = 0
+    full_redraw_bytes: int = 0
+    late_frames: int = 0
+
+    @property
+    def ratio(self) -> float:
+        return self.bytes_written / self.full_redraw_bytes if self.full_redraw_bytes else 0.0
+
+    def __str__(self) -> str:
+        return (f"{self.frames:,} frames  {self.bytes_written:,} bytes "
+                f"({self.ratio:.1%} of {self.full_redraw_bytes:,} for full redraws)  "
+                f"late {self.late_frames:,}")
+
+
+class Renderer:
+    """Draws frames in place, sending only what changed since the last one"""
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        self.stream = stream or sys.stdout
+        self.current: Optional[Frame] = None
+        self.row = self.col = 0     # cursor position inside the frame
+        self.stats = RenderStats()
+
+    def encode(self, item: Frame) -> str:
+        """Escape sequence that brings the screen from the current frame to item"""
+        if self.current is None:
+            return item.text()
+        if (item.width, item.height) != (self.current.width, self.current.height):
+            # Size changed: go back to the top and overwrite everything
+            return _move(self.row, self.col, 0, 0) + item.text()
+        parts = []
+        row, col = self.row, self.col
+        for run_row, run_col, text in diff_runs(self.current, item):
+            parts.append(_move(row, col, run_row, run_col))
+            parts.append(text)
+            row, col = run_row, run_col + len(text)
+        return "".join(parts)
+
+    def draw(self, item: Frame):
+        """Update the screen to item with one write"""
+        out = self.encode(item)
+        if out:
+            self.stream.write(out)
+            self.stream.flush()
+        if self.current is None or (item.width, item.height) != (self.current.width, self.current.height):
+            self.row, self.col = item.height - 1, item.width
+        elif out:
+            last_row, last_col, text = diff_runs(self.current, item)[-1]
+            self.row, self.col = last_row, last_col + len(text)
+        self.current = item
+        self.stats.frames += 1
+        self.stats.bytes_written += len(out.encode())
+        self.stats.full_redraw_bytes += item.full_size + len(_move(item.height - 1, 0, 0, 0))
+
+    def play(self, frames: Sequence[Frame], fps: float = 24.0, loops: int = 1) -> RenderStats:
+        """Draw frames at a steady rate; a late frame never makes the next ones rush"""
+        period = 1.0 / fps
+        self.stream.write(HIDE_CURSOR)
+        try:
+            deadline = time.perf_counter()
+            for _ in range(loops):
+                for item in frames:
+                    self.draw(item)
+                    deadline += period
+                    delay = deadline - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                    else:
+                        self.stats.late_frames += 1
+                        deadline = time.perf_counter()
+        finally:
+            self.finish()
+        return self.stats
+
+    def finish(self):
+        """Leave the cursor on the line below the frame"""
+        if self.current is not None:
+            self.stream.write(_move(self.row, self.col, self.current.height - 1, 0) + "\n")
+        self.stream.write(SHOW_CURSOR)
+        self.stream.flush()
+        self.current = None
+
+
+# Animations built from a piece of art
+def wipe(art: str, steps: int = 24) -> List[Frame]:
+    """Reveal art left to right in steps frames"""
+    full = frame(art)
+    return [frame("\n".join(row[:full.width * step // steps] for row in full.rows), full.width, full.height)
+            for step in range(1, steps + 1)]
+
+
+def marquee(art: str, width: Optional[int] = None, step: int = 1) -> List[Frame]:
+    """One full loop of art scrolling right to left through a window"""
+    full = frame(art)
+    width = width or full.width
+    rows = [row + BLANK * width for row in full.rows]
+    span = len(rows[0])
+    return [frame("\n".join((row + row)[offset:offset + width] for row in rows), width, full.height)
+            for offset in range(0, span, step)]
+
+
+def animate(frames: Sequence[Frame], fps: float = 24.0, loops: int = 1,
+            stream: Optional[TextIO] = None) -> Optional[RenderStats]:
+    """Play frames on a terminal; anywhere else just print the last one"""
+    stream = stream or sys.stdout
+    if not frames:
+        return None
+    if not (hasattr(stream, "isatty") and stream.isatty()):
+        stream.write("\n".join(row.rstrip() for row in frames[-1].rows) + "\n")
+        return None
+    return Renderer(stream).play(frames, fps, loops)
+
+
+def benchmark(loops: int = 20):
+    """Diffed frames against full redraws of the lesson art, into a buffer"""
+    import io
+    art = "\n".join("⠀⠀⢀⣴⣾⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⣿⠀⠀⠀⣿⣿⣿⡿⠋⠀" for _ in range(12))
+    for name, frames in (("wipe", wipe(art, 30)), ("marquee", marquee(art, 40))):
+        full = io.StringIO()
+        start = time.perf_counter()
+        for _ in range(loops):
+            for item in frames:
+                full.write(_move(item.height - 1, 0, 0, 0) + item.text())
+        redraw = time.perf_counter() - start
+
+        buffer = io.StringIO()
+        renderer = Renderer(buffer)
+        start = time.perf_counter()
+        for _ in range(loops):
+            for item in frames:
+                renderer.draw(item)
+        diffed = time.perf_counter() - start
+        count = loops * len(frames)
+        print(f"{name:<8} full redraw {len(full.getvalue().encode()):>9,} bytes {redraw / count * 1e6:6.1f}us/frame   "
+              f"diff {renderer.stats.bytes_written:>9,} bytes {diffed / count * 1e6:6.1f}us/frame "
+              f"({renderer.stats.ratio:.1%})")
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Frame-diff terminal renderer")
+    parser.add_argument("art", nargs="?", help="Text file with the art to animate")
+    parser.add_argument("--effect", choices=["wipe", "marquee"], default="wipe")
+    parser.add_argument("--fps", type=float, default=24.0)
+    parser.add_argument("--loops", type=int, default=1)
+    parser.add_argument("--benchmark", action="store_true", help="Run the benchmark")
+    args = parser.parse_args()
+
+    if args.benchmark or not args.art:
+        benchmark()
+        return
+    with open(args.art, encoding="utf-8") as f:
+        art = f.read().rstrip("\n")
+    frames = wipe(art) if args.effect == "wipe" else marquee(art)
+    stats = animate(frames, args.fps, args.loops)
+    if stats:
+        print(stats)
+
+
+if __name__ == "__main__":
+    main()
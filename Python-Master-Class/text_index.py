@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Full-text Index for text files like Python20.txt
+Tokenizes files or whole directories into an on-disk inverted index (SQLite,
+from the standard library) holding term frequencies and word positions.
+Re-indexing only touches files whose mtime or size changed. Supports boolean
+queries (AND by default, OR, -NOT), quoted phrase queries and word-frequency
+reports without rescanning the text.
+"""
+
+import os
+import re
+import sqlite3
+import sys
+import time
+import argparse
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+PathLike = Union[str, os.PathLike]
+DEFAULT_SUFFIXES = (".txt", ".md", ".py", ".csv", ".log")
+
+_WORD = re.compile(r"\w+")
+_QUERY_TOKEN = re.compile(r'(-?)"([^"]*)"|(\S+)')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    words INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    doc_id INTEGER NOT NULL REFERENCES docs(id),
+    tf INTEGER NOT NULL,
+    positions BLOB NOT NULL,
+    PRIMARY KEY (term, doc_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_doc ON postings(doc_id);
+"""
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens"""
+    return _WORD.findall(text.lower())
+
+
+def _file_terms(path: Path, encoding: str) -> Tuple[Dict[str, array], int]:
+    """Term -> positions for one file, read line by line"""
+    positions: Dict[str, array] = {}
+    position = 0
+    with open(path, "r", encoding=encoding, errors="replace") as f:
+        for line in f:
+            for term in _WORD.findall(line.lower()):
+                found = positions.get(term)
+                if found is None:
+                    positions[term] = found = array("I")
+                found.append(position)
+                position += 1
+    return positions, position
+
+
+def _pack(positions: array) -> bytes:
+    if sys.byteorder != "little":
+        positions = array("I", positions)
+        positions.byteswap()
+    return positions.tobytes()
+
+
+def _unpack(blob: bytes) -> array:
+    positions = array("I")
+    positions.frombytes(blob)
+    if sys.byteorder != "little":
+        positions.byteswap()
+    return positions
+
+
+class TextIndex:
+    """Inverted index stored in a SQLite file (or ":memory:")"""
+
+    def __init__(self, index_path: PathLike = "text_index.db", encoding: str = "utf-8"):
+        self.index_path = str(index_path)
+        self.encoding = encoding
+        self.db = sqlite3.connect(self.index_path)
+        self.db.execute("PRAGMA journal_mode=WAL" if self.index_path != ":memory:" else "PRAGMA journal_mode=MEMORY")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute("PRAGMA cache_size=-65536")  # 64 MiB keeps the postings B-tree hot
+        self.db.executescript(_SCHEMA)
+
+    # Indexing
+    def _files(self, paths: Iterable[PathLike], suffixes: Tuple[str, ...]) -> Iterator[Path]:
+        for path in paths:
+            path = Path(path)
+            if path.is_dir():
+                for root, _, names in os.walk(path):
+                    for name in sorted(names):
+                        if name.endswith(suffixes):
+                            yield Path(root, name).resolve()
+            elif path.is_file():
+                yield path.resolve()
+
+    def add(self, paths: Iterable[PathLike], suffixes: Tuple[str, ...] = DEFAULT_SUFFIXES,
+            prune: bool = True) -> Dict[str, int]:
+        """Index new or changed files; prune drops indexed files that were deleted
+
+        Returns counts of added, updated, unchanged and removed files.
+        """
+        stats = {"added": 0, "updated": 0, "unchanged": 0, "removed": 0}
+        known = {path: (doc_id, mtime, size) for doc_id, path, mtime, size
+                 in self.db.execute("SELECT id, path, mtime_ns, size FROM docs")}
+        seen: Set[str] = set()
+        roots = [Path(p).resolve() for p in paths]
+        with self.db:
+            for path in self._files(roots, suffixes):
+                key = str(path)
+                seen.add(key)
+                info = path.stat()
+                existing = known.get(key)
+                if existing and existing[1] == info.st_mtime_ns and existing[2] == info.st_size:
+                    stats["unchanged"] += 1
+                    continue
+                if existing:
+                    self._remove_doc(existing[0])
+                self._index_file(path, info)
+                stats["updated" if existing else "added"] += 1
+            if prune:
+                for key, (doc_id, _, _) in known.items():
+                    if key not in seen and any(_is_within(key, root) for root in roots) and not os.path.exists(key):
+                        self._remove_doc(doc_id)
+                        stats["removed"] += 1
+        return stats
+
+    def _index_file(self, path: Path, info: os.stat_result):
+        positions, words = _file_terms(path, self.encoding)
+        cursor = self.db.execute("INSERT INTO docs (path, mtime_ns, size, words) VALUES (?, ?, ?, ?)",
+                                 (str(path), info.st_mtime_ns, info.st_size, words))
+        doc_id = cursor.lastrowid
+        self.db.executemany("INSERT INTO postings (term, doc_id, tf, positions) VALUES (?, ?, ?, ?)",
+                            ((term, doc_id, len(found), _pack(found)) for term, found in sorted(positions.items())))
+
+    def _remove_doc(self, doc_id: int):
+        self.db.execute("DELETE FROM postings WHERE doc_id = ?", (doc_id,))
+        self.db.execute("DELETE FROM docs WHERE id = ?", (doc_id,))
+
+    # Queries
+    def _docs_with(self, term: str) -> Dict[int, int]:
+        return dict(self.db.execute("SELECT doc_id, tf FROM postings WHERE term = ?", (term,)))
+
+    def _phrase_docs(self, words: List[str]) -> Dict[int, int]:
+        """Docs containing the words consecutively, with the phrase count"""
+        if not words:
+            return {}
+        if len(words) == 1:
+            return self._docs_with(words[0])
+        candidates: Optional[Set[int]] = None
+        for word in words:
+            docs = set(self._docs_with(word))
+            candidates = docs if candidates is None else candidates & docs
+            if not candidates:
+                return {}
+        result = {}
+        for doc_id in candidates:
+            starts = None
+            for offset, word in enumerate(words):
+                blob = self.db.execute("SELECT positions FROM postings WHERE term = ? AND doc_id = ?",
+                                       (word, doc_id)).fetchone()[0]
+                shifted = {p - offset for p in _unpack(blob)}
+                starts = shifted if starts is None else starts & shifted
+                if not starts:
+                    break
+            if starts:
+                result[doc_id] = len(starts)
+        return result
+
+    def search(self, query: str, limit: Optional[int] = 20) -> List[Tuple[str, int]]:
+        """(path, score) for docs matching query, best first
+
+        Words are ANDed, OR separates alternatives, a leading - excludes,
+        and "quoted words" must appear as a phrase.
+        """
+        alternatives: List[List[Tuple[bool, List[str]]]] = [[]]
+        for negated_phrase, phrase, word in _QUERY_TOKEN.findall(query):
+            if word == "OR":
+                alternatives.append([])
+                continue
+            if phrase or negated_phrase:
+                alternatives[-1].append((bool(negated_phrase), tokenize(phrase)))
+            else:
+                negated = word.startswith("-") and len(word) > 1
+                alternatives[-1].append((negated, tokenize(word[1:] if negated else word)))
+
+        scores: Dict[int, int] = {}
+        for clauses in alternatives:
+            positive = [words for negated, words in clauses if not negated and words]
+            negative = [words for negated, words in clauses if negated and words]
+            if not positive:
+                continue
+            matched: Optional[Dict[int, int]] = None
+            for words in positive:
+                docs = self._phrase_docs(words)
+                if matched is None:
+                    matched = docs
+                else:
+                    matched = {d: matched[d] + tf for d, tf in docs.items() if d in matched}
+                if not matched:
+                    break
+            for words in negative:
+                for doc_id in self._phrase_docs(words):
+                    matched.pop(doc_id, None)
+            for doc_id, score in (matched or {}).items():
+                scores[doc_id] = scores.get(doc_id, 0) + score
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        if limit is not None:
+            ranked = ranked[:limit]
+        path_of = "SELECT path FROM docs WHERE id = ?"
+        return [(self.db.execute(path_of, (doc_id,)).fetchone()[0], score) for doc_id, score in ranked]
+
+    def word_frequencies(self, limit: int = 20, path: Optional[PathLike] = None) -> List[Tuple[str, int]]:
+        """Most frequent words over the whole index or one indexed file"""
+        if path is None:
+            rows = self.db.execute("SELECT term, SUM(tf) AS total FROM postings GROUP BY term "
+                                   "ORDER BY total DESC, term LIMIT ?", (limit,))
+        else:
+            rows = self.db.execute("SELECT term, tf FROM postings JOIN docs ON docs.id = postings.doc_id "
+                                   "WHERE docs.path = ? ORDER BY tf DESC, term LIMIT ?",
+                                   (str(Path(path).resolve()), limit))
+        return rows.fetchall()
+
+    def stats(self) -> Dict[str, int]:
+        """Document, word and distinct-term counts"""
+        docs, words = self.db.execute("SELECT COUNT(*), COALESCE(SUM(words), 0) FROM docs").fetchone()
+        terms = self.db.execute("SELECT COUNT(DISTINCT term) FROM postings").fetchone()[0]
+        return {"docs": docs, "words": words, "terms": terms}
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def _is_within(path: str, root: Path) -> bool:
+    return path == str(root) or path.startswith(str(root) + os.sep)
+
+
+def benchmark(files: int = 100, words_per_file: int = 50_000, folder: str = "text_index_bench"):
+    """Index a synthetic corpus, then compare queries with a full rescan"""
+    import random
+    import shutil
+    random.seed(8)
+    vocabulary = [f"w{i}" for i in range(20_000)] + ["python", "file", "hello", "world"]
+    os.makedirs(folder, exist_ok=True)
+    index_path = folder + ".db"
+    try:
+        for n in range(files):
+            words = random.choices(vocabulary, k=words_per_file)
+            with open(os.path.join(folder, f"doc{n}.txt"), "w") as f:
+                for i in range(0, len(words), 12):
+                    f.write(" ".join(words[i:i + 12]) + "\n")
+        with TextIndex(index_path) as index:
+            start = time.perf_counter()
+            index.add([folder])
+            print(f"index   : {files * words_per_file:,} words in {time.perf_counter() - start:.2f}s")
+            start = time.perf_counter()
+            print(f"reindex : {index.add([folder])} in {time.perf_counter() - start:.3f}s")
+            for query in ("python", "python hello", "python OR hello -world", '"hello world"'):
+                start = time.perf_counter()
+                hits = index.search(query, limit=None)
+                print(f"query   : {query!r:<28} {len(hits):>4} docs in {(time.perf_counter() - start) * 1e3:.1f}ms")
+        start = time.perf_counter()
+        hits = 0
+        for name in os.listdir(folder):
+            with open(os.path.join(folder, name)) as f:
+                hits += "python" in tokenize(f.read())
+        print(f"rescan  : 'python' {hits:>4} docs in {(time.perf_counter() - start) * 1e3:.1f}ms")
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(index_path + suffix):
+                os.remove(index_path + suffix)
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Inverted-index full-text search")
+    parser.add_argument("--index", default="text_index.db", help="Index database file")
+    parser.add_argument("--add", nargs="+", metavar="PATH", help="Index files or directories")
+    parser.add_argument("--search", help='Query, e.g. python "reading files" -java')
+    parser.add_argument("--top-words", type=int, metavar="N", help="Print the N most frequent words")
+    parser.add_argument("--benchmark", action="store_true", help="Run the benchmark")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark()
+        return
+    with TextIndex(args.index) as index:
+        if args.add:
+            print(index.add(args.add))
+        if args.search:
+            for path, score in index.search(args.search):
+                print(f"{score:>6}  {path}")
+        if args.top_words:
+            for term, count in index.word_frequencies(args.top_words):
+                print(f"{count:>8}  {term}")
+        if not (args.add or args.search or args.top_words):
+            print(index.stats())
+
+
+if __name__ == "__main__":
+    main()
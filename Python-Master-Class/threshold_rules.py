@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Threshold Rule Tables for the Python12 age-gating lesson
+Declarative [low, high) ranges mapped to labels instead of if/elif chains.
+A table is checked for overlaps and gaps when built and compiled to sorted
+edges, so a lookup is one bisect (or np.digitize over whole arrays).
+"""
+
+import time
+import argparse
+from bisect import bisect_right
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence
+
+# Third-party imports with graceful fallbacks
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+CHUNK_SIZE = 1 << 20
+
+
+class RuleTableError(ValueError):
+    """Raised for rule tables with empty, overlapping or missing ranges"""
+
+
+class Rule(NamedTuple):
+    """Values in [low, high) get label; None means unbounded"""
+    label: Any
+    low: Optional[float] = None
+    high: Optional[float] = None
+
+
+def _describe(rule: Rule) -> str:
+    low = "-inf" if rule.low is None else rule.low
+    high = "inf" if rule.high is None else rule.high
+    return f"{rule.label!r} [{low}, {high})"
+
+
+class RuleTable:
+    """Non-overlapping ranges compiled for O(log n) classification
+
+    Values outside every rule get `default`. Without a default, gaps between
+    rules are rejected, and so are values outside the covered range.
+    """
+
+    def __init__(self, rules: Iterable[Rule], default: Any = None, allow_gaps: bool = False):
+        self.rules = sorted((Rule(*rule) for rule in rules),
+                            key=lambda rule: float("-inf") if rule.low is None else rule.low)
+        if not self.rules:
+            raise RuleTableError("A rule table needs at least one rule")
+        self.default = default
+        self._validate(allow_gaps or default is not None)
+        self._compile()
+
+    def _validate(self, allow_gaps: bool):
+        for rule in self.rules:
+            if rule.low is not None and rule.high is not None and rule.low >= rule.high:
+                raise RuleTableError(f"Empty range {_describe(rule)}")
+        for before, after in zip(self.rules, self.rules[1:]):
+            if before.high is None or after.low is None or before.high > after.low:
+                raise RuleTableError(f"{_describe(before)} overlaps {_describe(after)}")
+            if before.high < after.low and not allow_gaps:
+                raise RuleTableError(f"Gap [{before.high}, {after.low}) between "
+                                     f"{_describe(before)} and {_describe(after)}")
+
+    def _compile(self):
+        # edges[i] starts interval i + 1; labels[0] covers everything below edges[0]
+        edges: List[float] = []
+        labels: List[Any] = []
+        first = self.rules[0]
+        labels.append(first.label if first.low is None else self.default)
+        for rule in self.rules:
+            if rule.low is not None:
+                if edges and edges[-1] == rule.low:
+                    labels[-1] = rule.label
+                else:
+                    edges.append(rule.low)
+                    labels.append(rule.label)
+            if rule.high is not None:
+                edges.append(rule.high)
+                labels.append(self.default)
+        self.edges = edges
+        self.labels = labels
+        self._missing = {i for i, label in enumerate(labels) if label is None}
+        self._np_edges = self._np_int_edges = None
+        if NUMPY_AVAILABLE:
+            self._np_edges = np.asarray(edges, dtype=np.float64)
+            # Integer inputs against integer edges skip a float copy of the whole array
+            if all(float(edge).is_integer() for edge in edges):
+                self._np_int_edges = np.asarray(edges, dtype=np.int64)
+
+    def code(self, value) -> int:
+        """Index into self.labels for one value"""
+        return bisect_right(self.edges, value)
+
+    def classify(self, value) -> Any:
+        """Label for one value"""
+        index = bisect_right(self.edges, value)
+        if index in self._missing:
+            raise RuleTableError(f"No rule covers {value!r}")
+        return self.labels[index]
+
+    def __call__(self, value) -> Any:
+        return self.classify(value)
+
+    def codes(self, values: Sequence, use_numpy: Optional[bool] = None):
+        """Label indices for many values (an int array with NumPy, else a list)"""
+        if use_numpy is None:
+            use_numpy = NUMPY_AVAILABLE
+        if use_numpy:
+            array = np.asarray(values)
+            if array.dtype.kind in "iub" and self._np_int_edges is not None:
+                codes = np.digitize(array, self._np_int_edges, right=False)
+            else:
+                codes = np.digitize(array.astype(np.float64, copy=False), self._np_edges, right=False)
+            if self._missing and np.isin(codes, list(self._missing)).any():
+                bad = array[np.isin(codes, list(self._missing))][0]
+                raise RuleTableError(f"No rule covers {bad!r}")
+            return codes
+        edges = self.edges
+        codes = [bisect_right(edges, value) for value in values]
+        if self._missing and not self._missing.isdisjoint(codes):
+            bad = next(v for v, c in zip(values, codes) if c in self._missing)
+            raise RuleTableError(f"No rule covers {bad!r}")
+        return codes
+
+    def classify_many(self, values: Sequence, use_numpy: Optional[bool] = None) -> List[Any]:
+        """Labels for many values"""
+        labels = self.labels
+        return [labels[code] for code in self.codes(values, use_numpy)]
+
+    def classify_stream(self, values: Iterable, chunk_size: int = CHUNK_SIZE) -> Iterator[Any]:
+        """Labels for an unbounded stream, classified a chunk at a time"""
+        values = iter(values)
+        while True:
+            chunk = list(islice(values, chunk_size))
+            if not chunk:
+                return
+            yield from self.classify_many(chunk)
+
+    def counts(self, values: Sequence, use_numpy: Optional[bool] = None) -> Dict[Any, int]:
+        """How many values fall under each label"""
+        if use_numpy is None:
+            use_numpy = NUMPY_AVAILABLE
+        codes = self.codes(values, use_numpy)
+        if use_numpy:
+            per_code = np.bincount(codes, minlength=len(self.labels)).tolist()
+        else:
+            per_code = [0] * len(self.labels)
+            for code in codes:
+                per_code[code] += 1
+        result: Dict[Any, int] = {}
+        for label, count in zip(self.labels, per_code):
+            if count:
+                result[label] = result.get(label, 0) + count
+        return result
+
+
+DRIVING_RULES = RuleTable([
+    Rule("\n\nAre you mentel kid\n\n", 0, 14),
+    Rule("\n\nYou cant not drive fucking kid\n\n", 14, 17),
+    Rule("\n\nWait 1year fucking teenager\n\n", 17, 18),
+    Rule("\n\nYou can drive\n\n", 18, None),
+], default="\n\nEror enter Rigth Value again\n\n")
+
+
+def _if_chain(age):
+    """The hand-written chain DRIVING_RULES replaces, for the benchmark"""
+    if age >= 18:
+        return 3
+    elif age >= 17:
+        return 2
+    elif age >= 14:
+        return 1
+    elif age >= 0:
+        return 0
+    return 4
+
+
+def benchmark(records: int = 10_000_000, repeat: int = 3):
+    """Throughput of the compiled table against an if/elif chain (best of repeat)"""
+    import random
+    random.seed(12)
+    ages = [random.randint(-5, 100) for _ in range(records)]
+
+    def best(func) -> float:
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        return records / min(timings) / 1e6
+
+    print(f"if/elif chain    {best(lambda: [_if_chain(age) for age in ages]):8.2f} M records/s")
+    print(f"bisect           {best(lambda: DRIVING_RULES.codes(ages, use_numpy=False)):8.2f} M records/s")
+    if NUMPY_AVAILABLE:
+        array = np.asarray(ages, dtype=np.int64)
+        print(f"np.digitize      {best(lambda: DRIVING_RULES.counts(array)):8.2f} M records/s")
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Compiled threshold rule tables")
+    parser.add_argument("ages", nargs="*", type=float, help="Ages to classify with the driving rules")
+    parser.add_argument("--benchmark", type=int, metavar="RECORDS", help="Run the benchmark")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.benchmark)
+        return
+    for age, label in zip(args.ages, DRIVING_RULES.classify_many(args.ages)):
+        print(f"{age:g}: {label.strip()}")
+
+
+if __name__ == "__main__":
+    main()
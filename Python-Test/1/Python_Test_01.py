@@ -1,11 +1,14 @@
 # Print your name and age in one line.
+import sys
 import time
+from number_input import NumericInputError, parse_int
 time.sleep(0.06)
 try:
     name = str(input("Enter Your Name : "))
-    fav = int(input("Enter Your fav number : "))
-except:
-    print("Invalid Input: Try Again")
+    fav = parse_int(input("Enter Your fav number : "))
+except NumericInputError as error:
+    print(f"Invalid Input ({error}) : Try Again")
+    sys.exit(1)
 
 
 print(f"Hello {name} Your Fav Number is : {fav}")
\ No newline at end of file
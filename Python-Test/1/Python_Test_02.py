@@ -1,11 +1,14 @@
 # Write a program to check if a number is even or odd
+import sys
 import time
+from number_input import NumericInputError, parse_int
 
 
 try:
-    num = int(input("Enter Your Number To Check Its Even : "))
-except:
-    print("Invalid Input : Try Again")
+    num = parse_int(input("Enter Your Number To Check Its Even : "))
+except NumericInputError as error:
+    print(f"Invalid Input ({error}) : Try Again")
+    sys.exit(1)
 
 m = num%2
 
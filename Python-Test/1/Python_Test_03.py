@@ -1,15 +1,13 @@
 # Write a program to check if someone is eligible to vote (age >= 18).
+import sys
 import time
+from voting_rules import classify
 
 try:
     age = int(input("Enter Your Age : "))
-except:
+except ValueError:
     print("Your Value Is Invalid : Try Again")
+    sys.exit(1)
 
 time.sleep(0.4)
-if(age >= 18):
-    print("\nYou can Vote\n")
-elif(age == 17):
-    print("\nWaite One Year To Vote\n")
-else:
-    print("\nYou Cant Vote Rigth Now Until 18\n")
\ No newline at end of file
+print(classify(age))
\ No newline at end of file
@@ -2,8 +2,14 @@
 import time
 import subprocess
 import os
+from reverse_engine import reverse_file
 os.system("cls")
-word = str(input("Enter Your WORD To Reverse : "))
+word = str(input("Enter Your WORD (or a file path) To Reverse : "))
 time.sleep(0.2)
 
-print("\n\n",word[::-1],"\n\n")
\ No newline at end of file
+if os.path.isfile(word):
+    # Big files are reversed chunk by chunk into a new file
+    reverse_file(word, word + ".reversed", "chars")
+    print("\n\n", f"Reversed file saved to {word}.reversed", "\n\n")
+else:
+    print("\n\n",word[::-1],"\n\n")
\ No newline at end of file
@@ -1,11 +1,11 @@
 # Write a function is_prime(n) that returns True if a number is prime, else False.
 import subprocess
 import time
-from sympy import *
+from prime_engine import is_prime
 
-g1 = isprime(30)
-g2 = isprime(13)
-g3 = isprime(2)
+g1 = is_prime(30)
+g2 = is_prime(13)
+g3 = is_prime(2)
 
 print(g1) 
 print(g2) 
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+Validated Number Input for Python_Test_01 and Python_Test_02
+One typed-in integer, checked with a reason instead of a bare except.
+Python-Master-Class/numeric_input.py is the full parser (floats, files and
+streams in bulk, reject files) behind the Python19 lesson.
+"""
+
+from typing import Optional
+
+
+class NumericInputError(ValueError):
+    """Raised by parse_int for input that is not an acceptable integer"""
+
+
+def parse_int(text: str, minimum: Optional[int] = None, maximum: Optional[int] = None) -> int:
+    """An int from text, or NumericInputError saying what is wrong"""
+    if not text.strip():
+        raise NumericInputError(f"empty: {text!r}")
+    try:
+        value = int(text)
+    except ValueError:
+        raise NumericInputError(f"not an integer: {text!r}") from None
+    if minimum is not None and value < minimum:
+        raise NumericInputError(f"below minimum {minimum}: {text!r}")
+    if maximum is not None and value > maximum:
+        raise NumericInputError(f"above maximum {maximum}: {text!r}")
+    return value
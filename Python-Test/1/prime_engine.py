@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Prime Engine for Python_Test_08
+Dependency-free primality testing and sieving: deterministic Miller-Rabin,
+a memoized small-prime table and a segmented odd-only sieve that counts or
+lists primes over large ranges in bounded memory, optionally across processes.
+"""
+
+import math
+import operator
+import time
+import argparse
+from bisect import bisect_right
+from functools import lru_cache
+from multiprocessing import Pool, cpu_count
+from typing import Iterator, List, Optional, Tuple
+
+SEGMENT_SIZE = 1 << 20  # odd numbers per segment, i.e. 1 MiB of sieve per worker
+SMALL_PRIME_LIMIT = 1000
+
+# These bases make Miller-Rabin exact for every n < 3.3 * 10**24,
+# which covers all 64-bit inputs
+_MR_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+
+@lru_cache(maxsize=32)
+def small_primes(limit: int = SMALL_PRIME_LIMIT) -> Tuple[int, ...]:
+    """All primes <= limit from a simple sieve, memoized per limit"""
+    if limit < 2:
+        return ()
+    sieve = bytearray([1]) * (limit + 1)
+    sieve[0] = sieve[1] = 0
+    for p in range(2, math.isqrt(limit) + 1):
+        if sieve[p]:
+            sieve[p * p::p] = bytes(len(range(p * p, limit + 1, p)))
+    return tuple(i for i, flag in enumerate(sieve) if flag)
+
+
+def is_prime(n: int) -> bool:
+    """Primality test, deterministic for n < 3.3 * 10**24"""
+    n = operator.index(n)  # TypeError for 2.5 or "7" instead of a wrong answer
+    if n < 2:
+        return False
+    for p in small_primes():
+        if n % p == 0:
+            return n == p
+    if n < SMALL_PRIME_LIMIT * SMALL_PRIME_LIMIT:
+        return True
+
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in _MR_BASES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _base_primes(high: int) -> Tuple[int, ...]:
+    """Odd primes up to sqrt(high - 1), enough to sieve everything below high"""
+    return small_primes(math.isqrt(max(high - 1, 0)))[1:]
+
+
+def _sieve_segment(low: int, high: int, base_primes: Tuple[int, ...]) -> bytearray:
+    """Flags for the odd numbers low, low+2, ... below high (low must be odd)
+
+    base_primes comes from _base_primes() for the whole range and is sliced
+    to the primes this segment needs.
+    """
+    size = (high - low + 1) // 2
+    segment = bytearray([1]) * size
+    for p in base_primes[:bisect_right(base_primes, math.isqrt(high - 1))]:
+        start = p * p
+        if start < low:
+            # First odd multiple of p that is >= low
+            start = ((low + p - 1) // p) * p
+            if start % 2 == 0:
+                start += p
+        first = (start - low) // 2
+        if first < size:
+            segment[first::p] = bytes(len(range(first, size, p)))
+    return segment
+
+
+def _segments(low: int, high: int, segment_size: int) -> Iterator[Tuple[int, int]]:
+    """Split [low, high) into odd-aligned segments"""
+    low = max(low, 3)
+    if low % 2 == 0:
+        low += 1
+    while low < high:
+        end = min(low + 2 * segment_size, high)
+        yield low, end
+        low = end if end % 2 else end + 1
+
+
+def primes_in_range(low: int, high: int, segment_size: int = SEGMENT_SIZE) -> Iterator[int]:
+    """Yield primes p with low <= p < high, one segment in memory at a time"""
+    if low <= 2 < high:
+        yield 2
+    base_primes = _base_primes(high)
+    for seg_low, seg_high in _segments(low, high, segment_size):
+        segment = _sieve_segment(seg_low, seg_high, base_primes)
+        for index in _flag_positions(segment):
+            yield seg_low + 2 * index
+
+
+def _flag_positions(segment: bytearray) -> Iterator[int]:
+    index = segment.find(1)
+    while index != -1:
+        yield index
+        index = segment.find(1, index + 1)
+
+
+_worker_base_primes: Tuple[int, ...] = ()  # set once per worker process
+
+
+def _init_worker(base_primes: Tuple[int, ...]):
+    global _worker_base_primes
+    _worker_base_primes = base_primes
+
+
+def _count_segment(bounds: Tuple[int, int]) -> int:
+    low, high = bounds
+    return _sieve_segment(low, high, _worker_base_primes).count(1)
+
+
+def count_primes(low: int, high: int, processes: Optional[int] = None,
+                 segment_size: int = SEGMENT_SIZE) -> int:
+    """Number of primes in [low, high); processes > 1 sieves segments in parallel"""
+    if high <= low:
+        return 0
+    total = 1 if low <= 2 < high else 0
+    segments = list(_segments(low, high, segment_size))
+    if processes is None:
+        processes = cpu_count() if len(segments) > 4 else 1
+    # Sieved once here; each worker gets them once through the initializer
+    base_primes = _base_primes(high)
+    if processes > 1 and len(segments) > 1:
+        with Pool(processes, initializer=_init_worker, initargs=(base_primes,)) as pool:
+            return total + sum(pool.imap_unordered(_count_segment, segments, chunksize=4))
+    return total + sum(_sieve_segment(seg_low, seg_high, base_primes).count(1)
+                       for seg_low, seg_high in segments)
+
+
+def list_primes(low: int, high: int) -> List[int]:
+    """List form of primes_in_range"""
+    return list(primes_in_range(low, high))
+
+
+def benchmark(limit: int = 10 ** 8):
+    """Time startup-free primality tests and the segmented sieve"""
+    start = time.perf_counter()
+    results = [is_prime(n) for n in (30, 13, 2, 2 ** 61 - 1, 2 ** 64 - 59, 10 ** 18 + 9)]
+    print(f"is_prime x{len(results)}: {(time.perf_counter() - start) * 1e3:.2f}ms {results}")
+
+    for processes in (1, cpu_count()):
+        start = time.perf_counter()
+        count = count_primes(0, limit, processes=processes)
+        print(f"count_primes(0, {limit:,}) = {count:,} with {processes} process(es) "
+              f"in {time.perf_counter() - start:.2f}s")
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Dependency-free prime engine")
+    parser.add_argument("numbers", nargs="*", type=int, help="Numbers to test")
+    parser.add_argument("--count", nargs=2, type=int, metavar=("LOW", "HIGH"),
+                        help="Count primes in [LOW, HIGH)")
+    parser.add_argument("--list", nargs=2, type=int, metavar=("LOW", "HIGH"),
+                        help="Print primes in [LOW, HIGH)")
+    parser.add_argument("--processes", type=int, help="Worker processes for --count")
+    parser.add_argument("--benchmark", type=int, metavar="LIMIT", help="Run the benchmark")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.benchmark)
+    if args.count:
+        print(count_primes(*args.count, processes=args.processes))
+    if args.list:
+        for p in primes_in_range(*args.list):
+            print(p)
+    for n in args.numbers:
+        print(f"{n}: {is_prime(n)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+File Reversal Tool built on Python_Test_07
+Reverses the characters, words or lines (like tac) of arbitrarily large files
+by reading a memory map backwards in chunks. Every chunk starts on a UTF-8
+character, word or line boundary, so memory stays bounded by the chunk size
+(or by the longest line/word when one is bigger than a chunk).
+"""
+
+import mmap
+import os
+import re
+import time
+import argparse
+from typing import Callable, Iterator
+
+MODES = ("chars", "words", "lines")
+CHUNK_BYTES = 4 * 1024 * 1024
+
+_WORD_START = re.compile(rb"\s(?=\S)")
+_TOKENS = re.compile(rb"(\s+)")
+
+
+def _char_boundary(data, start: int, end: int) -> int:
+    """First UTF-8 lead byte at or after start"""
+    while start < end and data[start] & 0xC0 == 0x80:
+        start += 1
+    return start
+
+
+def _line_boundary(data, start: int, end: int) -> int:
+    """First line start at or after start"""
+    if start == 0 or data[start - 1] == 0x0A:
+        return start
+    newline = data.find(b"\n", start, end)
+    return end if newline == -1 else newline + 1
+
+
+def _word_boundary(data, start: int, end: int) -> int:
+    """First word start at or after start"""
+    if start == 0 or (data[start - 1:start].isspace() and not data[start:start + 1].isspace()):
+        return start
+    match = _WORD_START.search(data, start, end)
+    return end if match is None else match.start() + 1
+
+
+_BOUNDARIES = {"chars": _char_boundary, "words": _word_boundary, "lines": _line_boundary}
+
+
+def _backward_chunks(data, chunk_bytes: int, boundary: Callable) -> Iterator[bytes]:
+    """Slices of data from the end to the start, each beginning on a boundary"""
+    end = len(data)
+    while end > 0:
+        tentative = max(0, end - chunk_bytes)
+        start = boundary(data, tentative, end)
+        # No boundary inside this window (a very long line or word): widen it
+        while start == end and tentative > 0:
+            tentative = max(0, tentative - chunk_bytes)
+            start = boundary(data, tentative, end)
+        yield data[start:end]
+        end = start
+
+
+def _reverse_chunk(chunk: bytes, mode: str) -> bytes:
+    if mode == "chars":
+        return chunk.decode("utf-8", errors="surrogateescape")[::-1].encode("utf-8", errors="surrogateescape")
+    if mode == "words":
+        return b"".join(reversed(_TOKENS.split(chunk)))
+    lines = chunk.split(b"\n")
+    if lines[-1] == b"":
+        lines.pop()
+    return b"\n".join(reversed(lines)) + b"\n"
+
+
+def iter_reversed(path: str, mode: str = "lines", chunk_bytes: int = CHUNK_BYTES) -> Iterator[bytes]:
+    """Yield the reversed file as byte chunks
+
+    chars reverses code points, words reverses the order of words and the
+    whitespace runs between them, lines reverses line order and always ends
+    lines with a newline.
+    """
+    if mode not in MODES:
+        raise ValueError(f"mode must be one of {MODES}")
+    if os.path.getsize(path) == 0:
+        return
+    boundary = _BOUNDARIES[mode]
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        for chunk in _backward_chunks(data, chunk_bytes, boundary):
+            yield _reverse_chunk(chunk, mode)
+
+
+def reverse_file(src: str, dst: str, mode: str = "lines", chunk_bytes: int = CHUNK_BYTES) -> int:
+    """Write the reversed src to dst, return bytes written"""
+    written = 0
+    with open(dst, "wb") as out:
+        for piece in iter_reversed(src, mode, chunk_bytes):
+            out.write(piece)
+            written += len(piece)
+    return written
+
+
+def reverse_naive(src: str, dst: str, mode: str = "lines"):
+    """Read-all-and-slice reference implementation"""
+    with open(src, "rb") as f:
+        data = f.read()
+    if mode == "chars":
+        result = data.decode("utf-8", errors="surrogateescape")[::-1].encode("utf-8", errors="surrogateescape")
+    elif mode == "words":
+        result = b"".join(reversed(_TOKENS.split(data)))
+    else:
+        lines = data.split(b"\n")
+        if lines[-1] == b"":
+            lines.pop()
+        result = b"".join(line + b"\n" for line in reversed(lines))
+    with open(dst, "wb") as out:
+        out.write(result)
+
+
+def benchmark(megabytes: int = 64, path: str = "reverse_bench.txt"):
+    """Throughput of the chunked reverser against read-all-and-slice"""
+    import random
+    random.seed(7)
+    words = ["hello", "world", "नमस्ते", "python", "ünïcode", "mmap", "reverse", "🙂"]
+    with open(path, "w", encoding="utf-8") as f:
+        line = 0
+        while f.tell() < megabytes * 1024 * 1024:
+            f.write(" ".join(random.choices(words, k=12)) + f" {line}\n")
+            line += 1
+    size = os.path.getsize(path)
+    try:
+        for mode in MODES:
+            for name, func in (("chunked", reverse_file), ("naive", reverse_naive)):
+                start = time.perf_counter()
+                func(path, path + ".out", mode)
+                elapsed = time.perf_counter() - start
+                print(f"{mode:<5} {name:<8} {size / elapsed / 1e6:8.1f} MB/s")
+    finally:
+        for leftover in (path, path + ".out"):
+            if os.path.exists(leftover):
+                os.remove(leftover)
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Reverse characters, words or lines of large files")
+    parser.add_argument("src", nargs="?", help="Input file")
+    parser.add_argument("dst", nargs="?", help="Output file")
+    parser.add_argument("--mode", choices=MODES, default="lines")
+    parser.add_argument("--benchmark", type=int, metavar="MB", help="Run the benchmark on a file of MB megabytes")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.benchmark)
+        return
+    if not args.src or not args.dst:
+        parser.error("src and dst are required")
+    reverse_file(args.src, args.dst, args.mode)
+
+
+if __name__ == "__main__":
+    main()
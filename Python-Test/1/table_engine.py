@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Multiplication Table Engine for Python_Test_05
+Builds N x M tables as a NumPy outer product (pure-Python fallback) and
+streams them as text, CSV or binary in row chunks, so a huge table never
+has to exist in memory all at once. Binary output is little-endian int64
+cells in row-major order.
+"""
+
+import sys
+import time
+import argparse
+from array import array
+from typing import BinaryIO, Iterator, Sequence, TextIO, Union
+
+# Third-party imports with graceful fallbacks
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+FORMATS = ("text", "csv", "binary")
+CHUNK_CELLS = 1 << 18  # cells built per chunk before it is written out
+_INT64_MAX = 2 ** 63 - 1
+
+
+def _fits_int64(numbers: Sequence[int], multipliers: Sequence[int]) -> bool:
+    if not len(numbers) or not len(multipliers):
+        return True
+    largest = max(abs(min(numbers)), abs(max(numbers))) * max(abs(min(multipliers)), abs(max(multipliers)))
+    return largest <= _INT64_MAX
+
+
+def build_table(numbers: Sequence[int], multipliers: Sequence[int] = range(1, 11),
+                use_numpy: bool = None):
+    """Full table with one row per number and one column per multiplier"""
+    if use_numpy is None:
+        use_numpy = NUMPY_AVAILABLE
+    if use_numpy and NUMPY_AVAILABLE and _fits_int64(numbers, multipliers):
+        return np.outer(np.asarray(numbers, dtype=np.int64), np.asarray(multipliers, dtype=np.int64))
+    return [[n * m for m in multipliers] for n in numbers]
+
+
+def iter_table_chunks(numbers: Sequence[int], multipliers: Sequence[int] = range(1, 11),
+                      chunk_cells: int = CHUNK_CELLS, use_numpy: bool = None) -> Iterator:
+    """Yield (row_numbers, block) pairs covering the table a few rows at a time"""
+    rows_per_chunk = max(1, chunk_cells // max(1, len(multipliers)))
+    for start in range(0, len(numbers), rows_per_chunk):
+        rows = numbers[start:start + rows_per_chunk]
+        yield rows, build_table(rows, multipliers, use_numpy)
+
+
+def _format_text(rows, multipliers, block) -> str:
+    lines = []
+    if NUMPY_AVAILABLE and isinstance(block, np.ndarray):
+        block = block.tolist()
+    # Same lines as Python_Test_05's print(f"{n}X{m} = ", value), two spaces included
+    for n, values in zip(rows, block):
+        lines.extend([f"{n}X{m} =  {value}" for m, value in zip(multipliers, values)])
+    return "\n".join(lines) + "\n"
+
+
+def _format_csv(rows, block) -> str:
+    if NUMPY_AVAILABLE and isinstance(block, np.ndarray):
+        block = block.tolist()
+    return "".join(f"{n}," + ",".join(map(str, values)) + "\n" for n, values in zip(rows, block))
+
+
+def _format_binary(block) -> bytes:
+    if NUMPY_AVAILABLE and isinstance(block, np.ndarray):
+        return block.astype("<i8", copy=False).tobytes()
+    packed = array("q")
+    for values in block:
+        packed.extend(values)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def write_table(out: Union[TextIO, BinaryIO], numbers: Sequence[int],
+                multipliers: Sequence[int] = range(1, 11), fmt: str = "text",
+                chunk_cells: int = CHUNK_CELLS, use_numpy: bool = None) -> int:
+    """Stream the table to out in the given format, return cells written"""
+    if fmt not in FORMATS:
+        raise ValueError(f"fmt must be one of {FORMATS}")
+    if fmt == "binary" and not _fits_int64(numbers, multipliers):
+        raise OverflowError("binary output needs every cell to fit in int64")
+
+    if fmt == "csv":
+        out.write("n," + ",".join(map(str, multipliers)) + "\n")
+    cells = 0
+    for rows, block in iter_table_chunks(numbers, multipliers, chunk_cells, use_numpy):
+        if fmt == "text":
+            out.write(_format_text(rows, multipliers, block))
+        elif fmt == "csv":
+            out.write(_format_csv(rows, block))
+        else:
+            out.write(_format_binary(block))
+        cells += len(rows) * len(multipliers)
+    return cells
+
+
+def benchmark(rows: int = 100_000, columns: int = 10):
+    """Time build and write of a rows x columns table for each format"""
+    import os
+    numbers = range(1, rows + 1)
+    multipliers = range(1, columns + 1)
+    modes = [False, True] if NUMPY_AVAILABLE else [False]
+    for use_numpy in modes:
+        label = "numpy " if use_numpy else "python"
+        start = time.perf_counter()
+        for _ in iter_table_chunks(numbers, multipliers, use_numpy=use_numpy):
+            pass
+        print(f"{label} build : {rows * columns:>11,} cells in {time.perf_counter() - start:.3f}s")
+        for fmt in FORMATS:
+            with open(os.devnull, "wb" if fmt == "binary" else "w") as sink:
+                start = time.perf_counter()
+                write_table(sink, numbers, multipliers, fmt, use_numpy=use_numpy)
+                print(f"{label} {fmt:<6}: {rows * columns:>11,} cells in {time.perf_counter() - start:.3f}s")
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Multiplication table generator")
+    parser.add_argument("start", nargs="?", type=int, default=1, help="First number")
+    parser.add_argument("stop", nargs="?", type=int, help="Last number (default: start)")
+    parser.add_argument("--upto", type=int, default=10, help="Multiply up to this value")
+    parser.add_argument("--format", choices=FORMATS, default="text")
+    parser.add_argument("--output", help="Output file (default: stdout)")
+    parser.add_argument("--benchmark", action="store_true", help="Run the benchmark")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark()
+        return
+    numbers = range(args.start, (args.stop if args.stop is not None else args.start) + 1)
+    multipliers = range(1, args.upto + 1)
+    binary = args.format == "binary"
+    if args.output:
+        with open(args.output, "wb" if binary else "w", newline=None if binary else "") as out:
+            write_table(out, numbers, multipliers, args.format)
+    else:
+        write_table(sys.stdout.buffer if binary else sys.stdout, numbers, multipliers, args.format)
+
+
+if __name__ == "__main__":
+    main()
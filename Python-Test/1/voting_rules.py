@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+Voting Age Rules for Python_Test_03
+The voting thresholds as sorted edges, so a lookup is one bisect instead of
+an if/elif chain. Python-Master-Class/threshold_rules.py is the full engine
+(validated rule tables, NumPy arrays, streams) for bigger tables.
+"""
+
+from bisect import bisect_right
+
+# EDGES[i] is the first age of LABELS[i + 1]; LABELS[0] is below every edge
+EDGES = (0, 17, 18)
+LABELS = (
+    "\nYour Value Is Invalid : Try Again\n",
+    "\nYou Cant Vote Rigth Now Until 18\n",
+    "\nWaite One Year To Vote\n",
+    "\nYou can Vote\n",
+)
+
+
+def classify(age: int) -> str:
+    """Message for one age"""
+    return LABELS[bisect_right(EDGES, age)]
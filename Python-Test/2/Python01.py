@@ -1,25 +1,28 @@
 # Level 1 – File Handling
-# Write a program that asks the user for a sentence and saves it into a file notes.txt.
+# Write a program that asks the user for a sentence and saves it into a file Notes.log.
 # Then, read back the file and print the contents.
 # Add a feature that clears the file before writing new text.
 import time
 import subprocess
+from pathlib import Path
+from notes_store import NotesStore
 
 try:
-    text = input("Enter Your Any sentence to Save in Notes.txt : ")
+    text = input("Enter Your Any sentence to Save in Notes : ")
+    clear = input("Clear Old Notes First? (y/n) : ").strip().lower() == "y"
     subprocess.run("cls",shell=True)
 except ValueError:
     print("You Enter Invaild Text For Code")
 subprocess.run("cls", shell=True)
 time.sleep(0.1)
 print("\n\n")
-time.sleep(0.05)
-Notes = open(r"Python-Test\2\Notes.txt", "w")
-time.sleep(0.009)
-write = Notes.write(f"'{text}'")
-time.sleep(0.1)
-print(f"       Your Text Updated \n\n{text}\n")
-Notes.close()
+# Notes are appended to a log next to this file instead of overwriting it
+with NotesStore(Path(__file__).with_name("Notes.log")) as Notes:
+    if clear:
+        Notes.clear()
+    note_id = Notes.add(text, wait=True)
+    print(f"       Your Text Saved As Note {note_id} \n")
+    for number, note in Notes:
+        print(f"{number} : {note}")
 time.sleep(0.3)
 print("\nYour File Closed Safe and Secure 100%\n\n")
-
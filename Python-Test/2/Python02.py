@@ -3,16 +3,8 @@
 # Test it with safe_divide(10, 2) and safe_divide(5, 0).
 import time
 import subprocess
-
-
-def safe_divide(a, b):
-    if(b == 0):
-        print("Cannot Divide By Zero")
-    elif(a == 0):
-        print("Cannot Divide By Zero")
-    else:
-        time.sleep(0.5)
-        print("\n\nYour Value is ",a/b,"\n\n")
+import sys
+from safe_division import safe_divide
 
 
 try:
@@ -20,6 +12,12 @@ try:
     d = int(input("Enter Your 2th Number : "))
 except ValueError:
     print("INVAILD VALUE : TRY AGAIN!")
+    sys.exit(1)
 
 subprocess.run("cls",shell=True)
-safe_divide(c,d)
\ No newline at end of file
+time.sleep(0.5)
+result = safe_divide(c,d)
+if result is None:
+    print("\n\nCannot divide by zero\n\n")
+else:
+    print("\n\nYour Value is ",result,"\n\n")
\ No newline at end of file
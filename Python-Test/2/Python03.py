@@ -2,11 +2,11 @@
 # Print the student with the highest marks.
 import time
 import subprocess
+from gradebook import analyze_marks
 
 dicti = {"Alice": 85, "Bob": 70, "Yogesh": 90}
-if(dicti["Alice"] > dicti["Bob"] and dicti["Alice"] > dicti["Yogesh"]):
-    print("\n\nAlice : ",dicti["Alice"])
-elif(dicti["Yogesh"] > dicti["Alice"] and dicti["Yogesh"] > dicti["Bob"]):
-    print("\n\nYogesh : ",dicti["Yogesh"])
-else:
-    print("\n\nBob : ",dicti["Bob"])
\ No newline at end of file
+report = analyze_marks(dicti.items())
+names, best = report.argmax()
+# Works for any number of students, and prints everyone on a tie
+for name in names:
+    print("\n\n" + name + " : ", best)
\ No newline at end of file
@@ -2,9 +2,10 @@
 # Print their union, intersection, and difference.
 import subprocess
 import time
+from compact_set import CompactIntSet
 
-set1 = {1,2,3,4,5}
-set2 = {4,5,6,7,8}
+set1 = CompactIntSet({1,2,3,4,5})
+set2 = CompactIntSet({4,5,6,7,8})
 subprocess.run("cls", shell=True)
 time.sleep(0.2)
 print("\n\n","Union : ",set1.union(set2),"\n\n")
@@ -1,7 +1,19 @@
 # Write a program to find the factorial of a number given by the user.
 # (e.g., 5! = 120)
-import math
+from factorial_engine import factorial, factorial_digits
 
-n = 5  # Example number
-factorial_result = math.factorial(n)
-print(f"The factorial of {n} is {factorial_result}")
\ No newline at end of file
+try:
+    n = int(input("Enter Your Number To Find Factorial : "))
+except ValueError:
+    print("INVAILD VALUE : TRY AGAIN!")
+    n = None
+
+if n is None:
+    pass
+elif n < 0:
+    print("Factorial Is Not Defined For Negative Numbers")
+elif factorial_digits(n) > 4000:
+    # Too big to print nicely, just show how long it is
+    print(f"The factorial of {n} has {factorial_digits(n):,} digits")
+else:
+    print(f"The factorial of {n} is {factorial(n)}")
\ No newline at end of file
@@ -1,13 +1,12 @@
 # Write a program to check if a word is a palindrome (same forward & backward).
 import time 
 import subprocess
+from palindrome import is_palindrome
 
-a = "palindrome"
+a = input("Enter Your Word : ").strip() or "palindrome"
 
-if(a == "palindrome"):
-    print(f"WE DETECTED YOU TYPE : {a}")
-elif(a == "emordnilap"):
-    print(f"WE DETECTED YOU TYPE : {a}")
+if(is_palindrome(a, "NFC", ignore_case=True, letters_only=True)):
+    print(f"WE DETECTED A PALINDROME : {a}")
 
 else:
     print(f"This is Normal word : {a}")
\ No newline at end of file
@@ -1,31 +1,24 @@
 import random
+from guess_game import CORRECT, HINTS, GuessGame, optimal_limit
 
 # Generate a random integer between 1 and 100 (inclusive)
 random_number = random.randint(1, 100)
 
-guess = 90, 90
-guess_count = 0
-count_limit = 1, 1
-limit = 3
-
-try:
-    for i in guess and not count_limit:
+# Binary search always finds it within this many guesses
+limit = optimal_limit(1, 100)
+game = GuessGame(random_number, limit, 1, 100)
 
+while not game.over:
+    try:
         c = int(input("Enter Number Guess : "))
-        if(c == 90):
-            f"YOU WON THE GAME Real Value: {i}"
+        result = game.guess(c)
+    except ValueError as error:
+        print("Wrong Input:", error)
+        continue
+    if result != CORRECT:
+        print(HINTS[result], f"- {game.remaining} guesses left")
 
-        elif(c <= 77 or c >= 101):
-            print("Too High")
-        elif(c >= 78 or c <= 99):
-            print("Close")
-        else:
-            "Wrong Input"
-        guess_count = guess_count + 1
-        
-        if(guess_count < limit):  
-            count_limit = 1,1
-        else:
-            count_limit = True    
-except:
-    print("Limit ADD ON")
+if game.won:
+    print(f"YOU WON THE GAME Real Value: {random_number}")
+else:
+    print(f"Limit Reached, Real Value: {random_number}")
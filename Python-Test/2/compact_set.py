@@ -0,0 +1,497 @@
+#!/usr/bin/env python3
+"""
+Compact Integer Set for the Python04 set operations
+A roaring-bitmap style set of non-negative ints: values are bucketed by their
+high bits, each bucket holding either a sorted uint16 array (sparse) or a
+65536-bit bitmap (dense). Supports the builtin set API for union,
+intersection and difference, and saves to files that load back through mmap.
+"""
+
+import mmap
+import operator
+import struct
+import sys
+import time
+import argparse
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, Iterator, Union
+
+# Third-party imports with graceful fallbacks
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+ARRAY_LIMIT = 4096        # above this many values a bucket switches to a bitmap
+BUCKET_BITS = 16
+BUCKET_MASK = (1 << BUCKET_BITS) - 1
+BITMAP_BYTES = (1 << BUCKET_BITS) // 8
+
+_MAGIC = b"CISET01\0"
+_HEADER = struct.Struct("<8sI")
+_ENTRY = struct.Struct("<QBIQ")  # key, kind, cardinality, payload offset
+_KIND_ARRAY = 0
+_KIND_BITMAP = 1
+
+# Bit positions set in each byte value, for fast bitmap -> array conversion
+_BYTE_BITS = tuple(tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256))
+
+# A bucket is a sorted array('H') / uint16 memoryview, or an int used as a bitmap
+Container = Union[array, memoryview, int]
+
+
+def _cardinality(container: Container) -> int:
+    if isinstance(container, int):
+        return container.bit_count()
+    return len(container)
+
+
+def _array_to_bitmap(values) -> int:
+    bits = bytearray(BITMAP_BYTES)
+    for v in values:
+        bits[v >> 3] |= 1 << (v & 7)
+    return int.from_bytes(bits, "little")
+
+
+def _bitmap_to_array(bitmap: int) -> array:
+    data = bitmap.to_bytes(BITMAP_BYTES, "little")
+    values = array("H")
+    for index, byte in enumerate(data):
+        if byte:
+            base = index << 3
+            values.extend([base + bit for bit in _BYTE_BITS[byte]])
+    return values
+
+
+def _normalize(container: Container) -> Container:
+    """Pick the smaller representation for a bucket"""
+    if isinstance(container, int):
+        if container.bit_count() <= ARRAY_LIMIT:
+            return _bitmap_to_array(container)
+        return container
+    if len(container) > ARRAY_LIMIT:
+        return _array_to_bitmap(container)
+    return container
+
+
+def _sorted_array(values) -> array:
+    return array("H", sorted(values))
+
+
+def _array_union(a, b) -> Container:
+    if NUMPY_AVAILABLE and len(a) + len(b) > 256:
+        return _normalize(array("H", np.union1d(np.asarray(a), np.asarray(b)).astype(np.uint16).tobytes()))
+    return _normalize(_sorted_array(set(a).union(b)))
+
+
+def _array_intersection(a, b) -> Container:
+    if len(a) > len(b):
+        a, b = b, a
+    # Galloping lookup of the smaller side into the larger one
+    result = array("H")
+    low = 0
+    size = len(b)
+    for v in a:
+        low = bisect_left(b, v, low, size)
+        if low == size:
+            break
+        if b[low] == v:
+            result.append(v)
+    return result
+
+
+def _array_difference(a, b) -> Container:
+    exclude = set(b)
+    return array("H", [v for v in a if v not in exclude])
+
+
+def _filter_by_bitmap(values, bitmap: int, keep: bool) -> array:
+    data = bitmap.to_bytes(BITMAP_BYTES, "little")
+    return array("H", [v for v in values if bool(data[v >> 3] >> (v & 7) & 1) == keep])
+
+
+def _union(a: Container, b: Container) -> Container:
+    a_bits = isinstance(a, int)
+    b_bits = isinstance(b, int)
+    if a_bits and b_bits:
+        return a | b
+    if a_bits:
+        return a | _array_to_bitmap(b)
+    if b_bits:
+        return b | _array_to_bitmap(a)
+    return _array_union(a, b)
+
+
+def _intersection(a: Container, b: Container) -> Container:
+    a_bits = isinstance(a, int)
+    b_bits = isinstance(b, int)
+    if a_bits and b_bits:
+        return _normalize(a & b)
+    if a_bits:
+        return _filter_by_bitmap(b, a, True)
+    if b_bits:
+        return _filter_by_bitmap(a, b, True)
+    return _array_intersection(a, b)
+
+
+def _difference(a: Container, b: Container) -> Container:
+    a_bits = isinstance(a, int)
+    b_bits = isinstance(b, int)
+    if a_bits and b_bits:
+        return _normalize(a & ~b)
+    if a_bits:
+        return _normalize(a & ~_array_to_bitmap(b))
+    if b_bits:
+        return _filter_by_bitmap(a, b, False)
+    return _array_difference(a, b)
+
+
+class CompactIntSet:
+    """Set of non-negative ints stored as roaring-style buckets"""
+
+    __slots__ = ("_buckets", "_mmap")
+
+    def __init__(self, values: Iterable[int] = ()):
+        self._buckets: Dict[int, Container] = {}
+        self._mmap = None
+        self.update(values)
+
+    # Construction
+    @classmethod
+    def _from_buckets(cls, buckets: Dict[int, Container]) -> "CompactIntSet":
+        result = cls()
+        result._buckets = {key: c for key, c in buckets.items() if _cardinality(c)}
+        return result
+
+    def update(self, *others: Iterable[int]):
+        """Add every value from the given iterables"""
+        for values in others:
+            if isinstance(values, CompactIntSet):
+                self._buckets = (self | values)._buckets
+                continue
+            grouped = _group_values(values)
+            for key, low_values in grouped.items():
+                current = self._buckets.get(key)
+                self._buckets[key] = low_values if current is None else _union(current, low_values)
+
+    def add(self, value: int):
+        """Add one value"""
+        key, low = _split(value)
+        container = self._buckets.get(key)
+        if container is None:
+            self._buckets[key] = array("H", [low])
+        elif isinstance(container, int):
+            self._buckets[key] = container | (1 << low)
+        else:
+            index = bisect_left(container, low)
+            if index == len(container) or container[index] != low:
+                container = self._writable(key, container)
+                container.insert(index, low)
+                if len(container) > ARRAY_LIMIT:
+                    self._buckets[key] = _array_to_bitmap(container)
+
+    def discard(self, value: int):
+        """Remove a value if present"""
+        if value < 0:
+            return
+        key, low = _split(value)
+        container = self._buckets.get(key)
+        if container is None:
+            return
+        if isinstance(container, int):
+            container &= ~(1 << low)
+            self._buckets[key] = _normalize(container)
+        else:
+            index = bisect_left(container, low)
+            if index == len(container) or container[index] != low:
+                return
+            container = self._writable(key, container)
+            del container[index]
+        if not _cardinality(self._buckets[key]):
+            del self._buckets[key]
+
+    def remove(self, value: int):
+        """Remove a value, raising KeyError if it is missing"""
+        if value not in self:
+            raise KeyError(value)
+        self.discard(value)
+
+    def _writable(self, key: int, container) -> array:
+        # Buckets loaded from a file are read-only views until first written
+        if isinstance(container, memoryview):
+            container = array("H", container)
+            self._buckets[key] = container
+        return container
+
+    def copy(self) -> "CompactIntSet":
+        """Shallow copy with independent buckets"""
+        return CompactIntSet._from_buckets(
+            {key: c if isinstance(c, int) else array("H", c) for key, c in self._buckets.items()})
+
+    # Queries
+    def __contains__(self, value) -> bool:
+        if not isinstance(value, int) or value < 0:
+            return False
+        key, low = _split(value)
+        container = self._buckets.get(key)
+        if container is None:
+            return False
+        if isinstance(container, int):
+            return bool(container >> low & 1)
+        index = bisect_left(container, low)
+        return index < len(container) and container[index] == low
+
+    def __len__(self) -> int:
+        return sum(_cardinality(c) for c in self._buckets.values())
+
+    def __iter__(self) -> Iterator[int]:
+        for key in sorted(self._buckets):
+            container = self._buckets[key]
+            if isinstance(container, int):
+                container = _bitmap_to_array(container)
+            base = key << BUCKET_BITS
+            for low in container:
+                yield base | low
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, CompactIntSet):
+            if self._buckets.keys() != other._buckets.keys():
+                return False
+            return all(_as_bitmap(c) == _as_bitmap(other._buckets[k]) for k, c in self._buckets.items())
+        if isinstance(other, (set, frozenset)):
+            return len(self) == len(other) and all(v in other for v in self)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        if not self._buckets:
+            return "CompactIntSet()"
+        preview = list(_take(self, 20))
+        text = ", ".join(map(str, preview))
+        if len(self) > len(preview):
+            text += ", ..."
+        return f"CompactIntSet({{{text}}})"
+
+    def memory_usage(self) -> int:
+        """Approximate bytes held by the buckets and their index"""
+        total = sys.getsizeof(self._buckets)
+        for container in self._buckets.values():
+            if isinstance(container, memoryview):
+                total += len(container) * 2
+            else:
+                total += sys.getsizeof(container)
+        return total
+
+    # Set algebra, same names as the builtin set
+    def _combine(self, other, op, keep_left_only: bool, keep_right_only: bool) -> "CompactIntSet":
+        if not isinstance(other, CompactIntSet):
+            other = CompactIntSet(other)
+        buckets = {}
+        for key, container in self._buckets.items():
+            other_container = other._buckets.get(key)
+            if other_container is not None:
+                buckets[key] = op(container, other_container)
+            elif keep_left_only:
+                buckets[key] = _detached(container)
+        if keep_right_only:
+            for key, container in other._buckets.items():
+                if key not in self._buckets:
+                    buckets[key] = _detached(container)
+        return CompactIntSet._from_buckets(buckets)
+
+    def union(self, *others) -> "CompactIntSet":
+        """Values in this set or any of the others"""
+        result = self
+        for other in others:
+            result = result._combine(other, _union, True, True)
+        return result if others else self.copy()
+
+    def intersection(self, *others) -> "CompactIntSet":
+        """Values in this set and all of the others"""
+        result = self
+        for other in others:
+            result = result._combine(other, _intersection, False, False)
+        return result if others else self.copy()
+
+    def difference(self, *others) -> "CompactIntSet":
+        """Values in this set but in none of the others"""
+        result = self
+        for other in others:
+            result = result._combine(other, _difference, True, False)
+        return result if others else self.copy()
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+    def isdisjoint(self, other) -> bool:
+        """True if the sets share no values"""
+        return not self.intersection(other)
+
+    def issubset(self, other) -> bool:
+        """True if every value here is also in other"""
+        return not self.difference(other)
+
+    # Serialization
+    def save(self, path: str):
+        """Write the set to a file that load() can memory-map"""
+        keys = sorted(self._buckets)
+        offset = _HEADER.size + _ENTRY.size * len(keys)
+        directory_padding = bytes(-offset % 8)
+        offset += len(directory_padding)
+        entries = []
+        payloads = []
+        for key in keys:
+            container = self._buckets[key]
+            if isinstance(container, int):
+                payload = container.to_bytes(BITMAP_BYTES, "little")
+                kind = _KIND_BITMAP
+            else:
+                packed = array("H", container)
+                if sys.byteorder != "little":
+                    packed.byteswap()
+                payload = packed.tobytes()
+                kind = _KIND_ARRAY
+            entries.append(_ENTRY.pack(key, kind, _cardinality(container), offset))
+            # Keep every payload 8-byte aligned so mapped views can be cast in place
+            payload += bytes(-len(payload) % 8)
+            payloads.append(payload)
+            offset += len(payload)
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, len(keys)))
+            f.writelines(entries)
+            f.write(directory_padding)
+            f.writelines(payloads)
+
+    @classmethod
+    def load(cls, path: str, use_mmap: bool = True) -> "CompactIntSet":
+        """Read a saved set; with use_mmap, array buckets stay zero-copy views of the file"""
+        with open(path, "rb") as f:
+            if use_mmap and sys.byteorder == "little":
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                data = f.read()
+        view = memoryview(data)
+        magic, count = _HEADER.unpack_from(view, 0)
+        if magic != _MAGIC:
+            raise ValueError(f"{path} is not a CompactIntSet file")
+        buckets = {}
+        for index in range(count):
+            key, kind, cardinality, offset = _ENTRY.unpack_from(view, _HEADER.size + index * _ENTRY.size)
+            if kind == _KIND_BITMAP:
+                buckets[key] = int.from_bytes(view[offset:offset + BITMAP_BYTES], "little")
+            elif isinstance(data, mmap.mmap):
+                buckets[key] = view[offset:offset + cardinality * 2].cast("H")
+            else:
+                packed = array("H", view[offset:offset + cardinality * 2].tobytes())
+                if sys.byteorder != "little":
+                    packed.byteswap()
+                buckets[key] = packed
+        result = cls._from_buckets(buckets)
+        if isinstance(data, mmap.mmap):
+            result._mmap = data
+        return result
+
+
+def _split(value: int):
+    value = operator.index(value)
+    if value < 0:
+        raise ValueError("CompactIntSet only holds non-negative ints")
+    return value >> BUCKET_BITS, value & BUCKET_MASK
+
+
+def _detached(container: Container) -> Container:
+    """Copy mutable array buckets so two sets never share one"""
+    return array("H", container) if isinstance(container, array) else container
+
+
+def _as_bitmap(container: Container) -> int:
+    return container if isinstance(container, int) else _array_to_bitmap(container)
+
+
+def _take(values: Iterable[int], count: int) -> Iterator[int]:
+    for index, value in enumerate(values):
+        if index == count:
+            return
+        yield value
+
+
+def _group_array(values) -> Dict[int, Container]:
+    data = np.unique(values)
+    if len(data) and data[0] < 0:
+        raise ValueError("CompactIntSet only holds non-negative ints")
+    keys = data >> BUCKET_BITS
+    bounds = np.flatnonzero(np.diff(keys)) + 1
+    grouped = {}
+    for chunk in np.split(data, bounds) if len(data) else ():
+        low = (chunk & BUCKET_MASK).astype(np.uint16)
+        grouped[int(chunk[0] >> BUCKET_BITS)] = _normalize(array("H", low.tobytes()))
+    return grouped
+
+
+def _group_values(values: Iterable[int]) -> Dict[int, Container]:
+    """Bucket raw values by their high bits into normalized containers"""
+    if NUMPY_AVAILABLE:
+        if isinstance(values, np.ndarray) and values.dtype.kind == "i":
+            return _group_array(values.astype(np.int64))
+        # Accept exactly what the pure path accepts: ints only, checked before
+        # the bulk conversion so floats are not truncated nor strings parsed
+        if isinstance(values, np.ndarray):
+            values = values.tolist()
+        values = list(map(operator.index, values))
+        try:
+            return _group_array(np.array(values, dtype=np.int64))
+        except OverflowError:
+            pass  # beyond int64, bucket them in Python below
+
+    buckets: Dict[int, set] = {}
+    for value in values:
+        key, low = _split(value)
+        bucket = buckets.get(key)
+        if bucket is None:
+            buckets[key] = bucket = set()
+        bucket.add(low)
+    return {key: _normalize(_sorted_array(lows)) for key, lows in buckets.items()}
+
+
+def benchmark(size: int = 1_000_000):
+    """Compare memory and set-operation speed with the builtin set"""
+    import random
+    random.seed(4)
+    universe = size * 4
+    left_values = random.sample(range(universe), size)
+    right_values = random.sample(range(universe), size)
+
+    start = time.perf_counter()
+    left_set, right_set = set(left_values), set(right_values)
+    set_build = time.perf_counter() - start
+    start = time.perf_counter()
+    left, right = CompactIntSet(left_values), CompactIntSet(right_values)
+    compact_build = time.perf_counter() - start
+
+    set_bytes = sys.getsizeof(left_set) + sum(sys.getsizeof(v) for v in left_set)
+    print(f"{size:,} values in [0, {universe:,})")
+    print(f"memory  set {set_bytes / size:6.1f} B/value   compact {left.memory_usage() / size:6.1f} B/value")
+    print(f"build   set {set_build:.3f}s   compact {compact_build:.3f}s")
+    for name in ("union", "intersection", "difference"):
+        start = time.perf_counter()
+        getattr(left_set, name)(right_set)
+        set_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        getattr(left, name)(right)
+        compact_seconds = time.perf_counter() - start
+        print(f"{name:<12} set {set_seconds:.3f}s   compact {compact_seconds:.3f}s")
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Compact integer set")
+    parser.add_argument("--benchmark", type=int, default=1_000_000, metavar="SIZE",
+                        help="Number of values per set")
+    args = parser.parse_args()
+    benchmark(args.benchmark)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Factorial Engine for Python05
+Exact factorials through prime factorisation and balanced binary splitting,
+factorial mod m, digit counts from lgamma, a memoized table for small n and
+a multiprocessing path for n in the millions.
+"""
+
+import math
+import time
+import argparse
+from multiprocessing import Pool, cpu_count
+from typing import List, Optional, Sequence
+
+TABLE_LIMIT = 1000   # n! for n below this is kept in a memo table
+MOD_CHUNK = 1 << 16  # terms per worker task in factorial_mod
+
+_table: List[int] = [1]
+
+
+def _primes_up_to(n: int) -> List[int]:
+    """Primes <= n from a bytearray sieve"""
+    if n < 2:
+        return []
+    sieve = bytearray([1]) * (n + 1)
+    sieve[0] = sieve[1] = 0
+    for p in range(2, math.isqrt(n) + 1):
+        if sieve[p]:
+            sieve[p * p::p] = bytes(len(range(p * p, n + 1, p)))
+    return [i for i, flag in enumerate(sieve) if flag]
+
+
+def legendre_exponent(n: int, p: int) -> int:
+    """Exponent of prime p in n!"""
+    exponent = 0
+    while n:
+        n //= p
+        exponent += n
+    return exponent
+
+
+def product(values: Sequence[int]) -> int:
+    """Balanced binary-splitting product, keeping operands similar in size"""
+    if not values:
+        return 1
+    values = list(values)
+    while len(values) > 1:
+        paired = [values[i] * values[i + 1] for i in range(0, len(values) - 1, 2)]
+        if len(values) % 2:
+            paired.append(values[-1])
+        values = paired
+    return values[0]
+
+
+def _prime_powers(n: int) -> List[int]:
+    """The factors p**e whose product is n!"""
+    return [p ** legendre_exponent(n, p) for p in _primes_up_to(n)]
+
+
+def _table_factorial(n: int) -> int:
+    while len(_table) <= n:
+        _table.append(_table[-1] * len(_table))
+    return _table[n]
+
+
+def factorial(n: int, processes: Optional[int] = None) -> int:
+    """Exact n!, in parallel across processes for large n when processes > 1"""
+    if n < 0:
+        raise ValueError("factorial() not defined for negative values")
+    if n < TABLE_LIMIT:
+        return _table_factorial(n)
+    powers = _prime_powers(n)
+    if processes is None or processes <= 1:
+        return product(powers)
+    # Deal the factors out round-robin so every worker gets a mix of sizes
+    chunks = [powers[i::processes] for i in range(processes)]
+    with Pool(processes) as pool:
+        partials = pool.map(product, chunks)
+    return product(partials)
+
+
+def factorial_digits(n: int) -> int:
+    """Decimal digits of n!, from lgamma without building the number"""
+    if n < 0:
+        raise ValueError("factorial_digits() not defined for negative values")
+    if n < TABLE_LIMIT:
+        return len(str(_table_factorial(n)))
+    return math.floor(math.lgamma(n + 1) / math.log(10)) + 1
+
+
+def trailing_zeros(n: int) -> int:
+    """Number of trailing zeros in n!"""
+    return legendre_exponent(n, 5)
+
+
+def _range_product_mod(args) -> int:
+    low, high, mod = args
+    result = 1
+    for k in range(low, high):
+        result = result * k % mod
+    return result
+
+
+def _product_mod(low: int, high: int, mod: int, processes: Optional[int]) -> int:
+    """Product of low..high-1 modulo mod"""
+    tasks = [(start, min(start + MOD_CHUNK, high), mod) for start in range(low, high, MOD_CHUNK)]
+    if processes and processes > 1 and len(tasks) > 1:
+        with Pool(processes) as pool:
+            partials = pool.map(_range_product_mod, tasks)
+    else:
+        partials = [_range_product_mod(task) for task in tasks]
+    result = 1
+    for partial in partials:
+        result = result * partial % mod
+    return result
+
+
+def factorial_mod(n: int, mod: int, mod_is_prime: bool = False,
+                  processes: Optional[int] = None) -> int:
+    """n! % mod; with a prime mod, Wilson's theorem shortens n close to mod"""
+    if n < 0:
+        raise ValueError("factorial_mod() not defined for negative values")
+    if mod <= 0:
+        raise ValueError("mod must be positive")
+    if mod == 1 or n >= mod:
+        return 0
+    if mod_is_prime and n > mod // 2:
+        # (p-1)! = -1 (mod p), so n! = -1 / ((n+1) * ... * (p-1))
+        tail = _product_mod(n + 1, mod, mod, processes)
+        return (-pow(tail, -1, mod)) % mod
+    return _product_mod(2, n + 1, mod, processes)
+
+
+def benchmark(sizes: Sequence[int] = (10_000, 100_000, 1_000_000)):
+    """Compare against math.factorial for exact results and lgamma digit counts"""
+    for n in sizes:
+        start = time.perf_counter()
+        expected = math.factorial(n)
+        builtin_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        ours = factorial(n)
+        serial_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        parallel = factorial(n, processes=cpu_count())
+        parallel_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        digits = factorial_digits(n)
+        digits_seconds = time.perf_counter() - start
+
+        assert ours == expected == parallel
+        print(f"n={n:>9,}: math {builtin_seconds:7.3f}s  split {serial_seconds:7.3f}s  "
+              f"parallel({cpu_count()}) {parallel_seconds:7.3f}s  "
+              f"digits={digits:,} in {digits_seconds * 1e6:.1f}us")
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Factorial engine")
+    parser.add_argument("n", nargs="?", type=int, help="Compute n!")
+    parser.add_argument("--mod", type=int, help="Print n! % MOD instead")
+    parser.add_argument("--prime-mod", action="store_true", help="MOD is prime (enables Wilson)")
+    parser.add_argument("--digits", action="store_true", help="Only print the digit count")
+    parser.add_argument("--processes", type=int, help="Worker processes")
+    parser.add_argument("--benchmark", action="store_true", help="Run the benchmark")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark()
+        return
+    if args.n is None:
+        parser.error("n is required")
+    if args.mod:
+        print(factorial_mod(args.n, args.mod, args.prime_mod, args.processes))
+    elif args.digits:
+        print(factorial_digits(args.n))
+    else:
+        print(factorial(args.n, args.processes))
+
+
+if __name__ == "__main__":
+    main()
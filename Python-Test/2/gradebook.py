@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Gradebook Engine for Python03
+One-pass, bounded-memory statistics over student marks: argmax with ties,
+heap-based top-k and per-group count/mean/stdev/min/max. Partial results
+merge, so large CSV files are split into byte ranges and scanned in parallel.
+"""
+
+import csv
+import heapq
+import io
+import math
+import os
+import time
+import argparse
+from dataclasses import dataclass, field
+from multiprocessing import Pool, cpu_count
+from typing import Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_TOP_K = 10
+CHUNK_BYTES = 64 * 1024 * 1024  # byte range per worker task
+MAX_TIED_NAMES = 1000  # names kept for a tied top mark; top_count keeps the full count
+
+
+@dataclass
+class RunningStats:
+    """Count, mean, variance (Welford), min and max; mergeable"""
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    minimum: float = math.inf
+    maximum: float = -math.inf
+
+    def add(self, value: float):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+
+    def merge(self, other: "RunningStats"):
+        """Fold another partial result into this one (Chan et al.)"""
+        if not other.count:
+            return
+        if not self.count:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.minimum, self.maximum = other.minimum, other.maximum
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.m2 / self.count) if self.count else 0.0
+
+
+@dataclass
+class GradeReport:
+    """Partial or final analysis of a stream of (name, mark, group) rows"""
+    k: int = DEFAULT_TOP_K
+    overall: RunningStats = field(default_factory=RunningStats)
+    groups: Dict[str, RunningStats] = field(default_factory=dict)
+    top_names: List[str] = field(default_factory=list)  # names holding the max mark
+    top_count: int = 0
+    heap: List[Tuple[float, str]] = field(default_factory=list)  # min-heap of the best k
+    bad_rows: int = 0
+
+    def add(self, name: str, mark: float, group: Optional[str] = None):
+        """Account for one row"""
+        if mark > self.overall.maximum:
+            self.top_names = [name]
+            self.top_count = 1
+        elif mark == self.overall.maximum:
+            if self.top_count < MAX_TIED_NAMES:
+                self.top_names.append(name)
+            self.top_count += 1
+        self.overall.add(mark)
+
+        if group is not None:
+            stats = self.groups.get(group)
+            if stats is None:
+                self.groups[group] = stats = RunningStats()
+            stats.add(mark)
+
+        entry = (mark, name)
+        if len(self.heap) < self.k:
+            heapq.heappush(self.heap, entry)
+        elif entry > self.heap[0]:
+            heapq.heapreplace(self.heap, entry)
+
+    def merge(self, other: "GradeReport"):
+        """Fold another partial report into this one"""
+        if other.overall.maximum > self.overall.maximum:
+            self.top_names = list(other.top_names)
+            self.top_count = other.top_count
+        elif other.overall.maximum == self.overall.maximum:
+            self.top_names.extend(other.top_names[:MAX_TIED_NAMES - len(self.top_names)])
+            self.top_count += other.top_count
+        self.overall.merge(other.overall)
+        for group, stats in other.groups.items():
+            self.groups.setdefault(group, RunningStats()).merge(stats)
+        self.heap = heapq.nlargest(self.k, self.heap + other.heap)
+        heapq.heapify(self.heap)
+        self.bad_rows += other.bad_rows
+
+    def top(self) -> List[Tuple[str, float]]:
+        """The best k as (name, mark), highest first"""
+        return [(name, mark) for mark, name in sorted(self.heap, reverse=True)]
+
+    def argmax(self) -> Tuple[List[str], float]:
+        """Names sharing the highest mark (up to MAX_TIED_NAMES), and that mark"""
+        return self.top_names, self.overall.maximum
+
+
+def analyze_marks(rows: Iterable[Tuple], k: int = DEFAULT_TOP_K) -> GradeReport:
+    """Analyze (name, mark) or (name, mark, group) tuples, e.g. dict.items()"""
+    report = GradeReport(k=k)
+    for row in rows:
+        report.add(*row)
+    return report
+
+
+def _columns(header: List[str], name_column: str, mark_column: str,
+             group_column: Optional[str]) -> Tuple[int, int, Optional[int]]:
+    try:
+        name_index = header.index(name_column)
+        mark_index = header.index(mark_column)
+        group_index = header.index(group_column) if group_column else None
+    except ValueError as e:
+        raise ValueError(f"Missing column in CSV header {header}: {e}") from None
+    return name_index, mark_index, group_index
+
+
+def _analyze_range(task) -> GradeReport:
+    """Scan the rows that start inside [start, end) of a CSV file"""
+    path, start, end, at_data_start, columns, k = task
+    name_index, mark_index, group_index = columns
+    report = GradeReport(k=k)
+    with open(path, "rb") as f:
+        if at_data_start:
+            f.seek(start)
+        else:
+            # Finish the line running through start - 1; it belongs to the previous range
+            f.seek(start - 1)
+            f.readline()
+        lines = []
+        while f.tell() < end:
+            line = f.readline()
+            if not line:
+                break
+            lines.append(line)
+            if len(lines) == 65536:
+                _consume(report, lines, name_index, mark_index, group_index)
+                lines = []
+        _consume(report, lines, name_index, mark_index, group_index)
+    return report
+
+
+def _consume(report: GradeReport, lines: List[bytes], name_index: int, mark_index: int,
+             group_index: Optional[int]):
+    text = io.StringIO(b"".join(lines).decode("utf-8"))
+    add = report.add
+    for row in csv.reader(text):
+        try:
+            add(row[name_index], float(row[mark_index]),
+                row[group_index] if group_index is not None else None)
+        except (IndexError, ValueError):
+            if row:
+                report.bad_rows += 1
+
+
+def analyze_csv(path: str, k: int = DEFAULT_TOP_K, name_column: str = "name",
+                mark_column: str = "marks", group_column: Optional[str] = None,
+                processes: Optional[int] = None, chunk_bytes: int = CHUNK_BYTES) -> GradeReport:
+    """Analyze a CSV with a header row; records must not contain embedded newlines"""
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        header_line = f.readline()
+    header = next(csv.reader([header_line]))
+    columns = _columns(header, name_column, mark_column, group_column)
+
+    data_start = len(header_line.encode("utf-8"))
+    size = os.path.getsize(path)
+    tasks = [(path, start, min(start + chunk_bytes, size), start == data_start, columns, k)
+             for start in range(data_start, size, chunk_bytes)]
+
+    if processes is None:
+        processes = min(cpu_count(), len(tasks))
+    report = GradeReport(k=k)
+    if processes > 1:
+        with Pool(processes) as pool:
+            for partial in pool.imap(_analyze_range, tasks):
+                report.merge(partial)
+    else:
+        for task in tasks:
+            report.merge(_analyze_range(task))
+    return report
+
+
+def print_report(report: GradeReport):
+    """Human readable summary"""
+    names, best = report.argmax()
+    overall = report.overall
+    print(f"Students : {overall.count:,}  (bad rows: {report.bad_rows:,})")
+    if not overall.count:
+        return
+    more = f" and {report.top_count - 10:,} more" if report.top_count > 10 else ""
+    print(f"Top mark : {best:g} by {', '.join(names[:10])}{more}")
+    print(f"Mean     : {overall.mean:.2f}  stdev {overall.stdev:.2f}  "
+          f"min {overall.minimum:g}  max {overall.maximum:g}")
+    print(f"Top {report.k}:")
+    for rank, (name, mark) in enumerate(report.top(), 1):
+        print(f"  {rank:>3}. {name:<20} {mark:g}")
+    for group in sorted(report.groups):
+        stats = report.groups[group]
+        print(f"  [{group}] n={stats.count:,} mean={stats.mean:.2f} stdev={stats.stdev:.2f} "
+              f"min={stats.minimum:g} max={stats.maximum:g}")
+
+
+def benchmark(rows: int = 1_000_000, path: str = "gradebook_bench.csv"):
+    """Write a synthetic CSV and time serial and parallel analysis"""
+    import random
+    random.seed(3)
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["name", "marks", "class"])
+        for i in range(rows):
+            writer.writerow([f"student{i}", random.randint(0, 100), f"class{i % 12}"])
+    try:
+        for processes in (1, cpu_count()):
+            start = time.perf_counter()
+            report = analyze_csv(path, group_column="class", processes=processes,
+                                 chunk_bytes=max(1 << 20, os.path.getsize(path) // (4 * processes)))
+            print(f"{rows:,} rows with {processes} process(es) in {time.perf_counter() - start:.2f}s "
+                  f"(top {report.argmax()[1]:g} shared by {report.top_count:,})")
+    finally:
+        os.remove(path)
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Streaming gradebook analytics")
+    parser.add_argument("csv", nargs="?", help="CSV file with a header row")
+    parser.add_argument("-k", type=int, default=DEFAULT_TOP_K, help="How many top students")
+    parser.add_argument("--name-column", default="name")
+    parser.add_argument("--mark-column", default="marks")
+    parser.add_argument("--group-column", help="Column to group statistics by")
+    parser.add_argument("--processes", type=int, help="Worker processes")
+    parser.add_argument("--benchmark", type=int, metavar="ROWS", help="Run the benchmark")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.benchmark)
+        return
+    if not args.csv:
+        parser.error("a CSV file or --benchmark is required")
+    print_report(analyze_csv(args.csv, args.k, args.name_column, args.mark_column,
+                             args.group_column, args.processes))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Number Guessing Game for Python07
+The game part of Python-Master-Class/guess_engine.py: consistent
+higher/lower feedback, a guess limit, and the worst case of binary search
+as the fair limit. The solver and the simulator stay in the full engine.
+"""
+
+import math
+from typing import Any, List, Optional
+
+CORRECT = 0
+GO_HIGHER = 1   # the guess was too low
+GO_LOWER = -1   # the guess was too high
+HINTS = {CORRECT: "Correct", GO_HIGHER: "Too Low", GO_LOWER: "Too High"}
+
+
+class GameOverError(RuntimeError):
+    """Raised when guessing after the game has been won or lost"""
+
+
+def feedback(guess, secret) -> int:
+    """CORRECT, GO_HIGHER or GO_LOWER"""
+    if guess == secret:
+        return CORRECT
+    return GO_HIGHER if guess < secret else GO_LOWER
+
+
+def optimal_limit(low: int, high: int) -> int:
+    """Guesses binary search needs in the worst case for [low, high]"""
+    return max(1, math.ceil(math.log2(high - low + 2)))
+
+
+class GuessGame:
+    """One round: a secret in [low, high], a guess limit and the guesses so far"""
+
+    def __init__(self, secret: int, limit: Optional[int], low: int, high: int):
+        if not low <= secret <= high:
+            raise ValueError(f"secret must be within [{low}, {high}]")
+        self.secret = secret
+        self.low = low
+        self.high = high
+        self.limit = limit if limit is not None else optimal_limit(low, high)
+        self.guesses: List[Any] = []
+        self.won = False
+
+    @property
+    def remaining(self) -> int:
+        return self.limit - len(self.guesses)
+
+    @property
+    def over(self) -> bool:
+        return self.won or self.remaining <= 0
+
+    def guess(self, value: int) -> int:
+        """Record a guess and return its feedback"""
+        if self.over:
+            raise GameOverError("The game is over")
+        if not self.low <= value <= self.high:
+            raise ValueError(f"Guess must be within [{self.low}, {self.high}]")
+        self.guesses.append(value)
+        result = feedback(value, self.secret)
+        self.won = result == CORRECT
+        return result
@@ -0,0 +1,472 @@
+#!/usr/bin/env python3
+"""
+Append-only Notes Store for Python01
+Notes are appended to a log as CRC-checked records. Writes are group
+committed: queued notes go out as one write() and one fsync per batch, made
+by a waiting writer or by a background flusher every fsync_interval, so many
+writers share each fsync. An in-memory id -> offset index gives O(1)
+lookups, opening the log recovers from a torn tail, and compaction rewrites
+only live notes.
+"""
+
+import os
+import struct
+import threading
+import time
+import zlib
+import argparse
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+
+# length of payload, crc32 of (id, flags, payload), note id, flags
+_RECORD = struct.Struct("<IIQB")
+_FLAG_DELETED = 1
+
+DEFAULT_FSYNC_INTERVAL = 0.05  # seconds between group commits
+DEFAULT_BATCH_BYTES = 1 << 20  # flush early once this much is pending
+# O_BINARY keeps Windows from translating newlines inside the records
+_APPEND_FLAGS = os.O_RDWR | os.O_APPEND | getattr(os, "O_BINARY", 0)
+
+
+class NotesStoreError(RuntimeError):
+    """Raised for closed stores and corrupt records"""
+
+
+def _encode(note_id: int, flags: int, payload: bytes) -> bytes:
+    body = struct.pack("<QB", note_id, flags) + payload
+    return _RECORD.pack(len(payload), zlib.crc32(body), note_id, flags) + payload
+
+
+def _read_at(f: BinaryIO, size: int, offset: int) -> bytes:
+    """size bytes at offset; seek + read, since os.pread is Unix-only"""
+    f.seek(offset)
+    return f.read(size)
+
+
+class NotesStore:
+    """Append-only log of notes with group commit and an offset index"""
+
+    def __init__(self, path: Union[str, os.PathLike], fsync_interval: float = DEFAULT_FSYNC_INTERVAL,
+                 batch_bytes: int = DEFAULT_BATCH_BYTES):
+        self.path = Path(path)
+        self.fsync_interval = fsync_interval
+        self.batch_bytes = batch_bytes
+        self._index: Dict[int, int] = {}  # note id -> record offset
+        self._dead_bytes = 0
+        self._next_id = 1
+        self._lock = threading.Lock()
+        self._committed = threading.Condition(self._lock)
+        self._wakeup = threading.Condition(self._lock)
+        self._pending: List[Tuple[Optional[int], bytes]] = []  # (note id or None, record)
+        self._pending_notes: Dict[int, str] = {}  # queued or in-flight notes, for get()
+        self._pending_bytes = 0
+        self._last_assigned = 0
+        self._durable_id = 0
+        self._cleared_id = 0  # notes up to this id were dropped by clear() before reaching disk
+        self._flushing = False
+        self._closed = False
+
+        self.path.touch(exist_ok=True)
+        self.recovered_bytes = self._recover()
+        self._open_log()
+        self._end = os.fstat(self._fd).st_size  # bytes written to the log
+        self._tail = self._end                  # where the next queued record will land
+        self._flusher = threading.Thread(target=self._flush_loop, name="notes-flusher", daemon=True)
+        self._flusher.start()
+
+    def _open_log(self):
+        # Appends go through the descriptor; reads use their own handle, only
+        # under the lock, because Windows emulates O_APPEND by seeking the
+        # descriptor to the end before every write
+        self._fd = os.open(self.path, _APPEND_FLAGS)
+        self._reader = open(self.path, "rb", buffering=0)
+
+    def _close_log(self):
+        self._reader.close()
+        os.close(self._fd)
+
+    # Recovery
+    def _scan(self, f: BinaryIO) -> Iterator[Tuple[int, int, int, bytes]]:
+        """Yield (offset, note_id, flags, payload) for every intact record"""
+        offset = 0
+        size = os.fstat(f.fileno()).st_size
+        while offset + _RECORD.size <= size:
+            header = _read_at(f, _RECORD.size, offset)
+            length, crc, note_id, flags = _RECORD.unpack(header)
+            if offset + _RECORD.size + length > size:
+                return
+            payload = _read_at(f, length, offset + _RECORD.size)
+            if zlib.crc32(struct.pack("<QB", note_id, flags) + payload) != crc:
+                return
+            yield offset, note_id, flags, payload
+            offset += _RECORD.size + length
+
+    def _recover(self) -> int:
+        """Rebuild the index and cut off a torn or corrupt tail, return bytes dropped"""
+        with open(self.path, "r+b", buffering=0) as f:
+            good_end = 0
+            for offset, note_id, flags, payload in self._scan(f):
+                record_size = _RECORD.size + len(payload)
+                if flags & _FLAG_DELETED:
+                    if note_id in self._index:
+                        self._dead_bytes += self._record_size_at(f, self._index.pop(note_id))
+                    self._dead_bytes += record_size
+                else:
+                    if note_id in self._index:
+                        self._dead_bytes += self._record_size_at(f, self._index[note_id])
+                    self._index[note_id] = offset
+                self._next_id = max(self._next_id, note_id + 1)
+                good_end = offset + record_size
+            size = os.fstat(f.fileno()).st_size
+            if size > good_end:
+                f.truncate(good_end)
+                os.fsync(f.fileno())
+            self._durable_id = self._last_assigned = self._next_id - 1
+            return size - good_end
+
+    @staticmethod
+    def _record_size_at(f: BinaryIO, offset: int) -> int:
+        return _RECORD.size + _RECORD.unpack(_read_at(f, _RECORD.size, offset))[0]
+
+    # Group commit
+    def _flush_loop(self):
+        with self._lock:
+            while not self._closed:
+                self._wakeup.wait(self.fsync_interval)
+                self._commit_locked()
+
+    def _commit_locked(self):
+        """Write and fsync everything pending as one batch; called with the lock held
+
+        The lock is released during the write and fsync, so other writers keep
+        queueing notes for the next batch meanwhile.
+        """
+        while self._flushing:
+            self._committed.wait()
+        if not self._pending:
+            return
+        batch = self._pending
+        self._pending = []
+        self._pending_bytes = 0
+        last = self._last_assigned
+        self._flushing = True
+        self._lock.release()
+        try:
+            data = memoryview(b"".join(record for _, record in batch))
+            while data:
+                data = data[os.write(self._fd, data):]
+            os.fsync(self._fd)
+        finally:
+            self._lock.acquire()
+            self._flushing = False
+            self._committed.notify_all()
+        self._end += sum(len(record) for _, record in batch)
+        for note_id, _ in batch:
+            self._pending_notes.pop(note_id, None)
+        self._durable_id = max(self._durable_id, last)
+
+    def add(self, text: str, wait: bool = False) -> int:
+        """Queue a note and return its id; wait=True blocks until it is on disk
+
+        A waiting writer whose note is dropped by clear() first gets a
+        NotesStoreError instead.
+        """
+        payload = text.encode("utf-8")
+        with self._lock:
+            self._check_open()
+            note_id = self._next_id
+            self._next_id += 1
+            record = _encode(note_id, 0, payload)
+            self._index[note_id] = self._tail
+            self._tail += len(record)
+            self._pending.append((note_id, record))
+            self._pending_notes[note_id] = text
+            self._pending_bytes += len(record)
+            self._last_assigned = note_id
+            if self._pending_bytes >= self.batch_bytes:
+                self._wakeup.notify()
+            if wait:
+                # Whoever finds no batch in flight commits for everyone queued so far
+                while self._durable_id < note_id and not self._closed:
+                    if note_id <= self._cleared_id:
+                        raise NotesStoreError(f"note {note_id} was discarded by clear()")
+                    if self._flushing:
+                        self._committed.wait()
+                    else:
+                        self._commit_locked()
+        return note_id
+
+    def delete(self, note_id: int, wait: bool = False) -> bool:
+        """Remove a note by appending a tombstone; False if it did not exist"""
+        with self._lock:
+            self._check_open()
+            offset = self._index.get(note_id)
+            if offset is None:
+                return False
+            record = _encode(note_id, _FLAG_DELETED, b"")
+            self._dead_bytes += len(record) + self._size_of(offset, note_id)
+            del self._index[note_id]
+            self._pending_notes.pop(note_id, None)
+            self._pending.append((None, record))
+            self._pending_bytes += len(record)
+            self._tail += len(record)
+            if wait:
+                self._commit_locked()
+        return True
+
+    def _size_of(self, offset: int, note_id: int) -> int:
+        if offset >= self._end:
+            return _RECORD.size + len(self._pending_notes[note_id].encode("utf-8"))
+        return self._record_size_at(self._reader, offset)
+
+    def flush(self):
+        """Commit everything pending right now"""
+        with self._lock:
+            self._check_open()
+            self._commit_locked()
+
+    # Reads
+    def get(self, note_id: int) -> Optional[str]:
+        """Note text by id in O(1), or None"""
+        with self._lock:
+            self._check_open()
+            offset = self._index.get(note_id)
+            if offset is None:
+                return None
+            if offset >= self._end:
+                return self._pending_notes[note_id]
+            length = _RECORD.unpack(_read_at(self._reader, _RECORD.size, offset))[0]
+            return _read_at(self._reader, length, offset + _RECORD.size).decode("utf-8")
+
+    def ids(self) -> List[int]:
+        """Live note ids in insertion order"""
+        with self._lock:
+            return sorted(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __iter__(self) -> Iterator[Tuple[int, str]]:
+        for note_id in self.ids():
+            text = self.get(note_id)
+            if text is not None:
+                yield note_id, text
+
+    # Maintenance
+    def compact(self) -> int:
+        """Rewrite the log with only live notes, return bytes reclaimed"""
+        with self._lock:
+            self._check_open()
+            # The lock is let go while a batch is written, so keep committing
+            # until nothing is queued or in flight; from here on it is held
+            while self._pending or self._flushing:
+                self._commit_locked()
+            temp_path = self.path.with_name(f".{self.path.name}.compact")
+            new_index = {}
+            with open(temp_path, "wb") as out:
+                position = 0
+                for note_id in sorted(self._index):
+                    offset = self._index[note_id]
+                    length = _RECORD.unpack(_read_at(self._reader, _RECORD.size, offset))[0]
+                    record = _read_at(self._reader, _RECORD.size + length, offset)
+                    out.write(record)
+                    new_index[note_id] = position
+                    position += len(record)
+                out.flush()
+                os.fsync(out.fileno())
+            reclaimed = self._end - position
+            # Windows cannot replace a file that is still open
+            self._close_log()
+            try:
+                os.replace(temp_path, self.path)
+                _fsync_dir(self.path.parent)
+            finally:
+                self._open_log()
+            self._end = self._tail = position
+            self._index = new_index
+            self._dead_bytes = 0
+            return reclaimed
+
+    def clear(self):
+        """Drop every note, including queued ones that are not on disk yet"""
+        with self._lock:
+            self._check_open()
+            while self._flushing:
+                self._committed.wait()
+            self._pending.clear()
+            self._pending_notes.clear()
+            self._pending_bytes = 0
+            os.ftruncate(self._fd, 0)
+            os.fsync(self._fd)
+            self._end = self._tail = 0
+            self._index.clear()
+            self._dead_bytes = 0
+            # Queued notes never made it to disk: fail their waiters
+            self._cleared_id = self._last_assigned
+            self._committed.notify_all()
+
+    @property
+    def dead_bytes(self) -> int:
+        """Bytes that compact() would reclaim"""
+        return self._dead_bytes
+
+    def _check_open(self):
+        if self._closed:
+            raise NotesStoreError(f"{self.path} is closed")
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._commit_locked()
+            self._closed = True
+            self._wakeup.notify_all()
+            self._committed.notify_all()
+        self._flusher.join()
+        self._close_log()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def _fsync_dir(path: Path):
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def benchmark(notes: int = 20_000, writers: int = 8, path: str = "notes_bench.log"):
+    """Compare group commit with one fsync per note"""
+    per_writer = notes // writers
+    if os.path.exists(path):
+        os.remove(path)
+    try:
+        with NotesStore(path) as store:
+            def writer(n):
+                for i in range(per_writer):
+                    store.add(f"writer {n} note {i}", wait=True)
+            threads = [threading.Thread(target=writer, args=(n,)) for n in range(writers)]
+            start = time.perf_counter()
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            elapsed = time.perf_counter() - start
+            print(f"group commit : {per_writer * writers:,} durable notes from {writers} writers "
+                  f"in {elapsed:.2f}s ({per_writer * writers / elapsed:,.0f}/s)")
+            start = time.perf_counter()
+            for note_id in range(1, 10_001):
+                store.get(note_id)
+            print(f"lookup       : 10,000 gets in {time.perf_counter() - start:.3f}s")
+
+        os.remove(path)
+        sample = min(notes, 2_000)
+        start = time.perf_counter()
+        with open(path, "ab") as f:
+            for i in range(sample):
+                f.write(_encode(i + 1, 0, f"note {i}".encode()))
+                f.flush()
+                os.fsync(f.fileno())
+        elapsed = time.perf_counter() - start
+        print(f"fsync each   : {sample:,} notes in {elapsed:.2f}s ({sample / elapsed:,.0f}/s)")
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def stress_test(writers: int = 4, notes: int = 2_000, compactions: int = 20,
+                path: str = "notes_stress.log"):
+    """Writers add and delete while compact() runs, then check every note survived"""
+    if os.path.exists(path):
+        os.remove(path)
+    try:
+        with NotesStore(path, fsync_interval=0.001) as store:
+            added: Dict[int, str] = {}
+            deleted: List[int] = []
+            errors: List[BaseException] = []
+            done = threading.Event()
+
+            def writer(n):
+                for i in range(notes):
+                    text = f"writer {n} note {i}"
+                    note_id = store.add(text, wait=i % 7 == 0)
+                    added[note_id] = text
+                    if i % 5 == 0 and store.delete(note_id):
+                        deleted.append(note_id)
+
+            def compactor():
+                try:
+                    while not done.is_set():
+                        for _ in range(compactions):
+                            store.compact()
+                except Exception as e:
+                    errors.append(e)
+
+            threads = [threading.Thread(target=writer, args=(n,)) for n in range(writers)]
+            background = threading.Thread(target=compactor)
+            background.start()
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            done.set()
+            background.join()
+            if errors:
+                raise errors[0]
+            store.compact()
+            expected = {note_id: text for note_id, text in added.items() if note_id not in deleted}
+        with NotesStore(path) as store:
+            found = dict(store)
+        assert found == expected, f"{len(expected) - len(found)} notes lost across compaction"
+        print(f"stress test  : {len(found):,} notes intact after concurrent compaction")
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Append-only notes store")
+    parser.add_argument("log", nargs="?", default="notes.log", help="Log file")
+    parser.add_argument("--add", action="append", default=[], help="Add a note (repeatable)")
+    parser.add_argument("--get", type=int, help="Print one note by id")
+    parser.add_argument("--delete", type=int, help="Delete a note by id")
+    parser.add_argument("--compact", action="store_true", help="Compact the log")
+    parser.add_argument("--benchmark", action="store_true", help="Run the benchmark")
+    parser.add_argument("--stress-test", action="store_true", help="Check add() during compact()")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark()
+        return
+    if args.stress_test:
+        stress_test()
+        return
+    with NotesStore(args.log) as store:
+        if store.recovered_bytes:
+            print(f"Recovered: dropped {store.recovered_bytes} bytes of torn records")
+        for text in args.add:
+            print(f"added {store.add(text)}")
+        if args.delete is not None:
+            print("deleted" if store.delete(args.delete) else "no such note")
+        if args.compact:
+            print(f"reclaimed {store.compact():,} bytes")
+        if args.get is not None:
+            print(store.get(args.get))
+        elif not args.add:
+            for note_id, text in store:
+                print(f"{note_id}: {text}")
+
+
+if __name__ == "__main__":
+    main()
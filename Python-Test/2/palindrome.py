@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Palindrome Engine for Python06
+Two-pointer palindrome checks with optional Unicode normalization, the
+longest palindromic substring in O(n) with Manacher's algorithm, and bulk
+scanning of memory-mapped word lists across processes.
+"""
+
+import mmap
+import os
+import time
+import argparse
+import unicodedata
+from multiprocessing import Pool, cpu_count
+from typing import List, Optional, Tuple
+
+CHUNK_BYTES = 8 * 1024 * 1024  # byte range per worker task
+
+
+def is_palindrome(text: str, normalize: Optional[str] = None, ignore_case: bool = False,
+                  letters_only: bool = False) -> bool:
+    """True if text reads the same both ways
+
+    Without normalize the check walks two indexes inward and allocates
+    nothing. normalize ("NFC", "NFKC", ...) and ignore_case need one
+    normalized copy of the text first.
+    """
+    if normalize:
+        text = unicodedata.normalize(normalize, text)
+    if ignore_case:
+        text = text.casefold()
+    left = 0
+    right = len(text) - 1
+    while left < right:
+        a = text[left]
+        b = text[right]
+        if letters_only:
+            if not a.isalnum():
+                left += 1
+                continue
+            if not b.isalnum():
+                right -= 1
+                continue
+        if a != b:
+            return False
+        left += 1
+        right -= 1
+    return True
+
+
+def longest_palindrome(text: str) -> Tuple[int, int]:
+    """(start, end) of the longest palindromic substring, Manacher's algorithm"""
+    n = len(text)
+    if n == 0:
+        return 0, 0
+    # radius[i] over the gap-interleaved positions: even i sits on a character,
+    # odd i between two; this avoids building a "#a#b#" copy of the text
+    size = 2 * n - 1
+    radius = [0] * size
+    center = right = 0
+    best_start = best_end = 0
+    for i in range(size):
+        r = min(radius[2 * center - i], right - i) if i < right else 0
+        # Grow: positions i-r-1 and i+r+1 must both be characters that match
+        while True:
+            lo = i - r - 1
+            hi = i + r + 1
+            if lo < 0 or hi >= size:
+                break
+            if lo % 2 == 0:
+                if text[lo // 2] != text[hi // 2]:
+                    break
+            r += 1
+        radius[i] = r
+        if i + r > right:
+            center, right = i, i + r
+        # Characters covered are the even positions in [i - r, i + r]
+        start = (i - r + 1) // 2
+        end = (i + r) // 2 + 1
+        if end - start > best_end - best_start:
+            best_start, best_end = start, end
+    return best_start, best_end
+
+
+def longest_palindromic_substring(text: str) -> str:
+    """The longest palindromic substring itself"""
+    start, end = longest_palindrome(text)
+    return text[start:end]
+
+
+def _scan_range(task) -> List[str]:
+    """Palindromic words among the lines that start inside [start, end)"""
+    path, start, end, min_length, ignore_case = task
+    found = []
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        if start:
+            # The line running through start - 1 belongs to the previous range
+            newline = data.find(b"\n", start - 1)
+            start = len(data) if newline == -1 else newline + 1
+        stop = data.find(b"\n", end - 1) if end < len(data) else len(data)
+        if stop == -1:
+            stop = len(data)
+        if start >= stop:
+            return found
+        for raw in data[start:stop].split(b"\n"):
+            word = raw.strip()
+            if len(word) < min_length:
+                continue
+            if word.isascii():
+                if ignore_case:
+                    word = word.lower()
+                if word == word[::-1]:
+                    found.append(word.decode("ascii"))
+            else:
+                text = word.decode("utf-8", errors="replace")
+                if len(text) >= min_length and is_palindrome(text, "NFC", ignore_case):
+                    found.append(text)
+    return found
+
+
+def scan_wordlist(path: str, min_length: int = 2, ignore_case: bool = True,
+                  processes: Optional[int] = None, chunk_bytes: int = CHUNK_BYTES) -> List[str]:
+    """All palindromic lines of a one-word-per-line file, in file order"""
+    size = os.path.getsize(path)
+    if not size:
+        return []
+    tasks = [(path, start, min(start + chunk_bytes, size), min_length, ignore_case)
+             for start in range(0, size, chunk_bytes)]
+    if processes is None:
+        processes = min(cpu_count(), len(tasks))
+    if processes > 1:
+        with Pool(processes) as pool:
+            parts = pool.map(_scan_range, tasks)
+    else:
+        parts = [_scan_range(task) for task in tasks]
+    return [word for part in parts for word in part]
+
+
+def benchmark(words: int = 500_000, path: str = "palindrome_words.txt"):
+    """Scan a dictionary-sized word list and time Manacher on a long string"""
+    import random
+    random.seed(6)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(words):
+            word = "".join(random.choices(letters, k=random.randint(2, 10)))
+            if i % 100 == 0:
+                word = word + word[::-1]
+            f.write(word + "\n")
+    try:
+        for processes in sorted({1, cpu_count()}):
+            start = time.perf_counter()
+            found = scan_wordlist(path, processes=processes, chunk_bytes=1 << 20)
+            print(f"scan {words:,} words with {processes} process(es): {len(found):,} palindromes "
+                  f"in {time.perf_counter() - start:.3f}s")
+        start = time.perf_counter()
+        with open(path, encoding="utf-8") as f:
+            naive = [w for w in (line.strip().lower() for line in f) if len(w) >= 2 and w == w[::-1]]
+        print(f"naive line loop: {len(naive):,} palindromes in {time.perf_counter() - start:.3f}s")
+    finally:
+        os.remove(path)
+
+    text = "".join(random.choices("ab", k=200_000))
+    start = time.perf_counter()
+    begin, end = longest_palindrome(text)
+    print(f"manacher on {len(text):,} chars: length {end - begin:,} in {time.perf_counter() - start:.3f}s")
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Palindrome engine")
+    parser.add_argument("words", nargs="*", help="Words or phrases to check")
+    parser.add_argument("--longest", help="Print the longest palindromic substring of this text")
+    parser.add_argument("--scan", metavar="FILE", help="Print palindromes in a word list")
+    parser.add_argument("--min-length", type=int, default=2)
+    parser.add_argument("--processes", type=int, help="Worker processes for --scan")
+    parser.add_argument("--benchmark", action="store_true", help="Run the benchmark")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark()
+    if args.longest:
+        print(longest_palindromic_substring(args.longest))
+    if args.scan:
+        for word in scan_wordlist(args.scan, args.min_length, processes=args.processes):
+            print(word)
+    for word in args.words:
+        print(f"{word}: {is_palindrome(word, 'NFC', ignore_case=True, letters_only=True)}")
+
+
+if __name__ == "__main__":
+    main()
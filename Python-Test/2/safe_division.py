@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Safe Division for Python02
+safe_divide returns a / b, or fill (None by default) when b is zero,
+instead of printing, and divide_many does the same for whole columns: one
+masked np.divide for ints and floats, or C-level map() over Decimal or when
+NumPy is missing. Every bulk result reports which positions were masked.
+"""
+
+import operator
+import argparse
+from dataclasses import dataclass
+from decimal import Decimal
+from itertools import compress, count
+from typing import Any, List, Sequence
+
+# Third-party imports with graceful fallbacks
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+def safe_divide(a, b, fill: Any = None):
+    """a / b, or fill when b is zero; a == 0 is an ordinary numerator"""
+    if b == 0:
+        return fill
+    return a / b
+
+
+@dataclass
+class DivisionResult:
+    """Quotients plus the positions whose divisor was zero"""
+    values: Any          # ndarray (or masked array) with NumPy, else a list
+    masked: Sequence[int]
+
+    @property
+    def mask(self):
+        """Boolean per position, True where the divisor was zero"""
+        if NUMPY_AVAILABLE and isinstance(self.values, np.ndarray):
+            flags = np.zeros(len(self.values), dtype=bool)
+            flags[np.asarray(self.masked, dtype=np.intp)] = True
+            return flags
+        flags = [False] * len(self.values)
+        for position in self.masked:
+            flags[position] = True
+        return flags
+
+    def report(self, limit: int = 10) -> str:
+        shown = ", ".join(str(int(p)) for p in self.masked[:limit])
+        more = " ..." if len(self.masked) > limit else ""
+        return f"masked {len(self.masked):,} of {len(self.values):,} positions" + (f": {shown}{more}" if shown else "")
+
+
+def _numeric_array(values):
+    """values as an int/float ndarray, or None when they need exact Python arithmetic"""
+    array = np.asarray(values)
+    return array if array.dtype.kind in "iuf" else None
+
+
+def divide_many(numerators: Sequence, denominators: Sequence, fill: Any = float("nan"),
+                masked_array: bool = False, use_numpy=None) -> DivisionResult:
+    """Element-wise numerators / denominators with zero divisors replaced by fill
+
+    Ints and floats go through one np.divide(..., where=...) call. Decimal
+    columns (and everything when NumPy is missing) keep exact Python division,
+    mapped at C level; only the zero positions are touched individually.
+    masked_array=True returns a numpy.ma array with the zero positions masked.
+    """
+    if len(numerators) != len(denominators):
+        raise ValueError("numerators and denominators must have the same length")
+    if use_numpy is None:
+        use_numpy = NUMPY_AVAILABLE
+    if use_numpy:
+        nums = _numeric_array(numerators)
+        dens = _numeric_array(denominators) if nums is not None else None
+        if dens is not None:
+            zero = dens == 0
+            numeric_fill = isinstance(fill, (int, float))
+            out = np.full(len(nums), fill if numeric_fill else np.nan, dtype=np.float64)
+            np.divide(nums, dens, out=out, where=~zero)
+            if not numeric_fill:
+                out = out.astype(object)
+                out[zero] = fill
+            masked = np.flatnonzero(zero)
+            values = np.ma.MaskedArray(out, mask=zero) if masked_array else out
+            return DivisionResult(values, masked)
+
+    masked = list(compress(count(), map(operator.not_, denominators)))
+    if masked:
+        denominators = list(denominators)
+        for position in masked:
+            denominators[position] = 1
+    values: List[Any] = list(map(operator.truediv, numerators, denominators))
+    for position in masked:
+        values[position] = fill
+    if masked_array and NUMPY_AVAILABLE:
+        flags = np.zeros(len(values), dtype=bool)
+        flags[masked] = True
+        values = np.ma.MaskedArray(np.array(values, dtype=object), mask=flags)
+    return DivisionResult(values, masked)
+
+
+def benchmark(pairs: int = 10_000_000, repeat: int = 3):
+    """Bulk division against a Python loop over safe_divide (best of repeat)"""
+    import random
+    import timeit
+    random.seed(2)
+    numerators = [random.randint(-1000, 1000) for _ in range(pairs)]
+    denominators = [random.randint(0, 50) for _ in range(pairs)]
+
+    def best(func) -> float:
+        return min(timeit.repeat(func, number=1, repeat=repeat))
+
+    loop = best(lambda: [safe_divide(a, b, float("nan")) for a, b in zip(numerators, denominators)])
+    print(f"safe_divide loop   {loop:7.3f}s")
+    print(f"map fallback       {best(lambda: divide_many(numerators, denominators, use_numpy=False)):7.3f}s")
+    if NUMPY_AVAILABLE:
+        nums = np.asarray(numerators)
+        dens = np.asarray(denominators)
+        print(f"masked np.divide   {best(lambda: divide_many(nums, dens)):7.3f}s   "
+              f"{divide_many(nums, dens).report(3)}")
+
+    small = min(pairs, 1_000_000)
+    decimal_nums = [Decimal(n) / 7 for n in numerators[:small]]
+    print(f"Decimal ({small:,})  {best(lambda: divide_many(decimal_nums, denominators[:small])):7.3f}s")
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Safe division over scalars and columns")
+    parser.add_argument("--benchmark", type=int, default=10_000_000, metavar="PAIRS")
+    args = parser.parse_args()
+    benchmark(args.benchmark)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ A comprehensive Python application that generates jokes with audio output,
 featuring configuration management, logging, CLI interface, and extensibility.
 """
 
+import io
 import os
 import sys
 import time
@@ -13,6 +14,8 @@ import logging
 import argparse
 import subprocess
 import platform
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, asdict
@@ -21,6 +24,8 @@ import threading
 import queue
 import signal
 import atexit
+from near_duplicates import DEFAULT_THRESHOLD, NearDuplicateIndex, signature
+from audio_pack import AudioPack, PackError, pack_key
 
 # Third-party imports with graceful fallbacks
 try:
@@ -44,6 +49,9 @@ except ImportError:
     PYGAME_AVAILABLE = False
     print("Warning: pygame not available for advanced audio. Install with: pip install pygame")
 
+# Audio kept in the pack is referred to as "pack:<key hex>" instead of a path
+PACK_PREFIX = "pack:"
+
 # Configuration
 @dataclass
 class Config:
@@ -60,6 +68,10 @@ class Config:
     categories: List[str] = None
     output_dir: str = "jokes_output"
     config_file: str = "joke_config.json"
+    near_duplicate_threshold: float = DEFAULT_THRESHOLD
+    duplicate_retries: int = 10
+    audio_pack: bool = True
+    pack_file: str = "jokes.pack"
     
     def __post_init__(self):
         if self.categories is None:
@@ -111,14 +123,64 @@ class AudioManager:
         self.audio_queue = queue.Queue()
         self.playback_thread = None
         self.stop_event = threading.Event()
+        self._pack = None
+        self.pack_lock = threading.Lock()
+    
+    @property
+    def pack(self) -> AudioPack:
+        """The audio pack in output_dir, opened on first use"""
+        if self._pack is None:
+            Path(self.config.output_dir).mkdir(parents=True, exist_ok=True)
+            self._pack = AudioPack(Path(self.config.output_dir) / self.config.pack_file)
+        return self._pack
+    
+    def close_pack(self):
+        """Close the audio pack if it was opened"""
+        with self.pack_lock:
+            if self._pack is not None:
+                self._pack.close()
+                self._pack = None
+    
+    def synthesize(self, text: str) -> Optional[bytes]:
+        """Audio bytes for text from gTTS, or None on failure"""
+        try:
+            buffer = io.BytesIO()
+            gTTS(text=text, lang=self.config.language, slow=False).write_to_fp(buffer)
+            return buffer.getvalue()
+        except Exception as e:
+            self.logger.error(f"Error generating audio: {e}")
+            return None
         
     def text_to_speech(self, text: str, filename: str = None) -> Optional[str]:
-        """Convert text to speech and save audio file"""
+        """Convert text to speech and save audio file (or a pack clip)"""
+        packed = self.config.audio_pack and filename is None
+        if packed:
+            # Pre-rendered or earlier clips are reused, even without gTTS
+            key = pack_key(text, self.config.language)
+            try:
+                with self.pack_lock:
+                    found = key in self.pack
+            except Exception as e:
+                self.logger.error(f"Error opening audio pack: {e}")
+                return None
+            if found:
+                self.logger.debug(f"Audio already packed: {key.hex()}")
+                return PACK_PREFIX + key.hex()
+        
         if not GTTS_AVAILABLE:
             self.logger.warning("gTTS not available, skipping audio generation")
             return None
             
         try:
+            if packed:
+                clip = self.synthesize(text)
+                if clip is None:
+                    return None
+                with self.pack_lock:
+                    self.pack.put(key, clip)
+                self.logger.info(f"Audio packed: {key.hex()}")
+                return PACK_PREFIX + key.hex()
+            
             if filename is None:
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 filename = f"joke_{timestamp}.{self.config.audio_format}"
@@ -139,6 +201,9 @@ class AudioManager:
     def play_audio(self, filepath: str) -> bool:
         """Play audio file with cross-platform support"""
         try:
+            if filepath.startswith(PACK_PREFIX):
+                return self._play_packed(bytes.fromhex(filepath[len(PACK_PREFIX):]))
+            
             if not os.path.exists(filepath):
                 self.logger.error(f"Audio file not found: {filepath}")
                 return False
@@ -161,6 +226,30 @@ class AudioManager:
             self.logger.error(f"Error playing audio: {e}")
             return False
     
+    def _play_packed(self, key: bytes) -> bool:
+        """Play a clip straight out of the pack's memory map"""
+        with self.pack_lock:
+            # A CRC check costs little next to playback and never plays the wrong clip
+            clip = self.pack.get(key, verify=True)
+        if clip is None:
+            self.logger.error(f"Audio clip not in pack: {key.hex()}")
+            return False
+        
+        if platform.system() == "Linux":
+            # mpg123 reads the clip from a pipe, no temporary file needed
+            subprocess.run(["mpg123", "-q", "-"], input=clip)
+            return True
+        
+        # afplay and os.startfile need a real file
+        with tempfile.NamedTemporaryFile(suffix=f".{self.config.audio_format}", delete=False) as f:
+            f.write(clip)
+        try:
+            return self.play_audio(f.name)
+        finally:
+            # startfile returns before playback ends, so Windows keeps the file
+            if platform.system() != "Windows":
+                os.remove(f.name)
+    
     def start_background_playback(self):
         """Start background audio playback thread"""
         def playback_worker():
@@ -189,6 +278,8 @@ class JokeManager:
         self.config = config
         self.logger = JokeLogger("JokeManager").get_logger()
         self.jokes_history = []
+        self.duplicate_index = NearDuplicateIndex(config.near_duplicate_threshold)
+        self.skipped_duplicates = 0
         self.audio_manager = AudioManager(config)
         
     def install_dependencies(self):
@@ -213,18 +304,37 @@ class JokeManager:
             }
         
         try:
-            if category and category in self.config.categories:
-                joke_text = pyjokes.get_joke(category=category)
+            for _ in range(max(1, self.config.duplicate_retries)):
+                if category and category in self.config.categories:
+                    joke_text = pyjokes.get_joke(category=category)
+                else:
+                    joke_text = pyjokes.get_joke()
+                
+                # Skip jokes that are near-duplicates of ones already told
+                minhash = signature(joke_text)
+                match = self.duplicate_index.query(minhash)
+                if match is None:
+                    break
+                self.skipped_duplicates += 1
+                self.logger.debug(f"Skipping near-duplicate of joke {match[0] + 1} ({match[1]:.0%} similar)")
             else:
-                joke_text = pyjokes.get_joke()
+                # Every retry was a repeat; flag it so no audio is generated again
+                return {
+                    "text": joke_text,
+                    "category": category or "general",
+                    "timestamp": datetime.now().isoformat(),
+                    "duplicate_of": self.jokes_history[match[0]].get("id", match[0] + 1)
+                }
             
             joke_data = {
                 "text": joke_text,
                 "category": category or "general",
                 "timestamp": datetime.now().isoformat(),
-                "id": len(self.jokes_history) + 1
+                "id": len(self.jokes_history) + 1,
+                "minhash": minhash.hex()
             }
             
+            self.duplicate_index.add(minhash)
             self.jokes_history.append(joke_data)
             return joke_data
             
@@ -258,10 +368,19 @@ class JokeManager:
             if history_file.exists():
                 with open(history_file, 'r') as f:
                     self.jokes_history = json.load(f)
+                self.duplicate_index = NearDuplicateIndex(self.config.near_duplicate_threshold)
+                self.duplicate_index.extend(self._history_signatures())
                 self.logger.info(f"Loaded {len(self.jokes_history)} jokes from history")
                 
         except Exception as e:
             self.logger.error(f"Error loading jokes history: {e}")
+    
+    def _history_signatures(self):
+        """Stored MinHash signatures, computing any that older histories lack"""
+        for joke in self.jokes_history:
+            if "minhash" not in joke:
+                joke["minhash"] = signature(joke["text"]).hex()
+            yield bytes.fromhex(joke["minhash"])
 
 class JokeGeneratorApp:
     """Main application class"""
@@ -289,6 +408,7 @@ class JokeGeneratorApp:
         self.logger.info("Cleaning up resources...")
         self.joke_manager.audio_manager.stop_background_playback()
         self.joke_manager.save_jokes_history()
+        self.joke_manager.audio_manager.close_pack()
     
     def load_config(self):
         """Load configuration from file"""
@@ -339,7 +459,7 @@ class JokeGeneratorApp:
                     joke = self.joke_manager.get_joke()
                     print(f"\n🎭 {joke['text']}\n")
                     
-                    if self.config.audio_enabled:
+                    if self.config.audio_enabled and "duplicate_of" not in joke:
                         audio_file = self.joke_manager.audio_manager.text_to_speech(joke['text'])
                         if audio_file:
                             self.joke_manager.audio_manager.play_audio(audio_file)
@@ -388,12 +508,44 @@ class JokeGeneratorApp:
             joke = self.joke_manager.get_joke()
             print(f"\n{i+1}/{count}: {joke['text']}")
             
-            if self.config.audio_enabled:
+            if self.config.audio_enabled and "duplicate_of" not in joke:
                 audio_file = self.joke_manager.audio_manager.text_to_speech(joke['text'])
                 if audio_file:
                     self.joke_manager.audio_manager.play_audio(audio_file)
                     time.sleep(self.config.delay_seconds)
     
+    def prerender(self, workers: int = 4):
+        """Synthesize the whole joke corpus into the audio pack ahead of time"""
+        if not (PYJOKES_AVAILABLE and GTTS_AVAILABLE):
+            self.logger.error("Pre-rendering needs pyjokes and gTTS")
+            return
+        
+        audio_manager = self.joke_manager.audio_manager
+        corpus = []
+        for category in self.config.categories:
+            corpus.extend(pyjokes.get_jokes(language=self.config.language, category=category))
+        corpus = list(dict.fromkeys(corpus))
+        todo = [text for text in corpus if pack_key(text, self.config.language) not in audio_manager.pack]
+        self.logger.info(f"Pre-rendering {len(todo)} of {len(corpus)} jokes with {workers} workers")
+        
+        # gTTS waits on the network, so synthesize in threads and append from this one
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for done, (text, clip) in enumerate(zip(todo, pool.map(audio_manager.synthesize, todo)), 1):
+                if clip is not None:
+                    with audio_manager.pack_lock:
+                        audio_manager.pack.put(pack_key(text, self.config.language), clip)
+                if done % 100 == 0:
+                    self.logger.info(f"Pre-rendered {done}/{len(todo)}")
+        
+        self.logger.info(f"Audio pack: {audio_manager.pack.stats()}")
+    
+    def compact_audio(self):
+        """Rewrite the audio pack without replaced or discarded clips"""
+        audio_manager = self.joke_manager.audio_manager
+        with audio_manager.pack_lock:
+            reclaimed = audio_manager.pack.compact()
+            self.logger.info(f"Reclaimed {reclaimed:,} bytes, audio pack: {audio_manager.pack.stats()}")
+    
     def run_daemon(self):
         """Run as daemon/background service"""
         self.logger.info("Starting daemon mode")
@@ -406,7 +558,7 @@ class JokeGeneratorApp:
             joke = self.joke_manager.get_joke()
             self.logger.info(f"Generated joke: {joke['text']}")
             
-            if self.config.audio_enabled:
+            if self.config.audio_enabled and "duplicate_of" not in joke:
                 audio_file = self.joke_manager.audio_manager.text_to_speech(joke['text'])
                 if audio_file:
                     self.joke_manager.audio_manager.audio_queue.put(audio_file)
@@ -422,6 +574,9 @@ def main():
     parser.add_argument("--count", type=int, help="Number of jokes for batch mode")
     parser.add_argument("--install", action="store_true", help="Install dependencies")
     parser.add_argument("--no-audio", action="store_true", help="Disable audio")
+    parser.add_argument("--prerender", action="store_true", help="Synthesize the joke corpus into the audio pack")
+    parser.add_argument("--workers", type=int, default=4, help="Synthesis threads for --prerender")
+    parser.add_argument("--compact", action="store_true", help="Reclaim dead clips in the audio pack")
     
     args = parser.parse_args()
     
@@ -445,6 +600,20 @@ def main():
         app.joke_manager.install_dependencies()
         return
     
+    # Audio pack maintenance
+    if args.prerender or args.compact:
+        try:
+            if args.prerender:
+                app.prerender(args.workers)
+            if args.compact:
+                app.compact_audio()
+        except PackError as e:
+            # Usually the daemon or interactive mode still has the pack open
+            app.logger.error(f"Audio pack unavailable: {e}")
+        finally:
+            app.joke_manager.audio_manager.close_pack()
+        return
+    
     # Load jokes history
     app.joke_manager.load_jokes_history()
     
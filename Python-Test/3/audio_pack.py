@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+Packed Audio Archive for the Joke Generator
+Synthesized clips are appended to one segment file, and a fixed-size record
+per clip goes into a sibling index file, instead of one small mp3 per joke.
+Reads are zero-copy memoryview slices of an mmap of the segment. Replaced
+and discarded clips stay in the segment as dead bytes until compact()
+rewrites the pack. An open pack holds an exclusive lock, so a second
+process fails fast instead of appending over the first one's offsets.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import time
+import zlib
+import argparse
+from dataclasses import dataclass
+from typing import Dict, Iterator, Optional, Tuple
+
+# Platform-specific file locking
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+MAGIC = b"JPAK"
+INDEX_MAGIC = b"JIDX"
+VERSION = 1
+# magic, version, reserved, pack id: segment and index must carry the same id
+_HEADER = struct.Struct("<4sHH8s")
+# key, offset, length, crc32 of the clip
+_RECORD = struct.Struct("<16sQII")
+_TOMBSTONE = (1 << 64) - 1
+COMPACT_SUFFIX = ".compact"
+# compact() replaces the segment and index files, so the lock lives in a third one
+LOCK_SUFFIX = ".lock"
+
+
+class PackError(RuntimeError):
+    """Raised for packs whose segment and index do not belong together"""
+
+
+class PackLockedError(PackError):
+    """Raised when another process already has the pack open"""
+
+
+def pack_key(text: str, language: str = "en") -> bytes:
+    """16-byte key for the clip of text spoken in language"""
+    return hashlib.blake2b(f"{language}\0{text}".encode("utf-8"), digest_size=16).digest()
+
+
+@dataclass
+class PackStats:
+    """Sizes of a pack; dead bytes are what compact() would reclaim"""
+    entries: int
+    live_bytes: int
+    dead_bytes: int
+    segment_bytes: int
+
+    def __str__(self) -> str:
+        return (f"{self.entries:,} clips  live {self.live_bytes / 2**20:.1f} MiB  "
+                f"dead {self.dead_bytes / 2**20:.1f} MiB  segment {self.segment_bytes / 2**20:.1f} MiB")
+
+
+class AudioPack:
+    """Append-only clip store: path is the segment, path + ".idx" the index
+
+    put() writes the clip before its index record, so a crash can at worst
+    lose the newest clip, never point at missing bytes. Only one process
+    can have the pack open (PackLockedError otherwise); memoryviews from
+    get() stay valid until compact() or close().
+    """
+
+    def __init__(self, path: str, durable: bool = False):
+        self.path = str(path)
+        self.index_path = self.path + ".idx"
+        self.durable = durable
+        self._index: Dict[bytes, Tuple[int, int, int]] = {}
+        self._dead_bytes = 0
+        self._map: Optional[mmap.mmap] = None
+        self._lock_file = None
+        self._lock()
+        try:
+            self._open()
+        except BaseException:
+            self.close()
+            raise
+
+    # Locking
+    def _lock(self):
+        lock_file = open(self.path + LOCK_SUFFIX, "a+b")
+        try:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            lock_file.close()
+            raise PackLockedError(f"{self.path} is open in another process") from None
+        self._lock_file = lock_file
+
+    def _unlock(self):
+        if self._lock_file is None:
+            return
+        # Closing the file releases the lock on both platforms
+        self._lock_file.close()
+        self._lock_file = None
+
+    # Opening and recovery
+    def _open(self):
+        if not os.path.exists(self.path):
+            self._create(self.path, self.index_path, os.urandom(8))
+        pack_id = self._read_header(self.path, MAGIC)
+        index_id = self._read_header(self.index_path, INDEX_MAGIC)
+        if pack_id != index_id:
+            # compact() swaps the index in first; finish an interrupted swap
+            pending = self.path + COMPACT_SUFFIX
+            if os.path.exists(pending) and self._read_header(pending, MAGIC) == index_id:
+                os.replace(pending, self.path)
+            else:
+                raise PackError(f"{self.index_path} does not belong to {self.path}")
+        self._segment = open(self.path, "ab")
+        self._reader = open(self.path, "rb")    # mmap needs a readable descriptor
+        self._load_index()
+        self._log = open(self.index_path, "ab")
+
+    @staticmethod
+    def _create(path: str, index_path: str, pack_id: bytes):
+        for name, magic in ((path, MAGIC), (index_path, INDEX_MAGIC)):
+            with open(name, "wb") as f:
+                f.write(_HEADER.pack(magic, VERSION, 0, pack_id))
+
+    @staticmethod
+    def _read_header(path: str, magic: bytes) -> bytes:
+        if not os.path.exists(path):
+            raise PackError(f"{path} is missing")
+        with open(path, "rb") as f:
+            raw = f.read(_HEADER.size)
+        if len(raw) < _HEADER.size:
+            raise PackError(f"{path} is truncated")
+        found, version, _, pack_id = _HEADER.unpack(raw)
+        if found != magic or version != VERSION:
+            raise PackError(f"{path} is not a version {VERSION} audio pack")
+        return pack_id
+
+    def _load_index(self):
+        size = os.path.getsize(self.path)
+        with open(self.index_path, "rb") as f:
+            f.seek(_HEADER.size)
+            data = f.read()
+        usable = len(data) - len(data) % _RECORD.size
+        index = self._index
+        dead = 0
+        end = _HEADER.size
+        for count, (key, offset, length, crc) in enumerate(_RECORD.iter_unpack(data[:usable])):
+            if offset != _TOMBSTONE and offset + length > size:
+                # The clip never fully reached the segment: drop this record and the rest
+                usable = count * _RECORD.size
+                break
+            previous = index.pop(key, None)
+            if previous is not None:
+                dead += previous[1]
+            if offset != _TOMBSTONE:
+                index[key] = (offset, length, crc)
+                end = max(end, offset + length)
+        if usable != len(data):
+            with open(self.index_path, "r+b") as f:
+                f.truncate(_HEADER.size + usable)
+        # Bytes past the last indexed clip belong to a put() that never finished
+        self._dead_bytes = dead + max(0, size - end)
+
+    # Reading
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: bytes) -> bool:
+        return key in self._index
+
+    def keys(self) -> Iterator[bytes]:
+        return iter(self._index)
+
+    def get(self, key: bytes, verify: bool = False) -> Optional[memoryview]:
+        """Zero-copy view of a clip, or None when the pack does not have it"""
+        entry = self._index.get(key)
+        if entry is None:
+            return None
+        offset, length, crc = entry
+        if self._map is None or offset + length > len(self._map):
+            self._segment.flush()
+            # Views handed out earlier keep the old map alive until they go away
+            self._map = mmap.mmap(self._reader.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._map)[offset:offset + length]
+        if verify and zlib.crc32(view) != crc:
+            raise PackError(f"clip {key.hex()} is corrupt")
+        return view
+
+    # Writing
+    def _append_record(self, key: bytes, offset: int, length: int, crc: int):
+        self._log.write(_RECORD.pack(key, offset, length, crc))
+        self._log.flush()
+        if self.durable:
+            os.fsync(self._log.fileno())
+
+    def put(self, key: bytes, data) -> None:
+        """Append a clip (bytes-like), replacing any earlier clip for key"""
+        offset = self._segment.tell()
+        self._segment.write(data)
+        self._segment.flush()
+        if self.durable:
+            os.fsync(self._segment.fileno())
+        length = self._segment.tell() - offset
+        crc = zlib.crc32(data)
+        self._append_record(key, offset, length, crc)
+        previous = self._index.get(key)
+        if previous is not None:
+            self._dead_bytes += previous[1]
+        self._index[key] = (offset, length, crc)
+
+    def discard(self, key: bytes) -> bool:
+        """Drop a clip; its bytes are reclaimed by the next compact()"""
+        previous = self._index.pop(key, None)
+        if previous is None:
+            return False
+        self._append_record(key, _TOMBSTONE, 0, 0)
+        self._dead_bytes += previous[1]
+        return True
+
+    def stats(self) -> PackStats:
+        live = sum(length for _, length, _ in self._index.values())
+        return PackStats(len(self._index), live, self._dead_bytes, self._segment.tell())
+
+    # Compaction
+    def compact(self) -> int:
+        """Rewrite the pack with live clips only, return the bytes reclaimed"""
+        before = self._segment.tell()
+        self._segment.flush()
+        pack_id = os.urandom(8)
+        segment_tmp = self.path + COMPACT_SUFFIX
+        index_tmp = self.index_path + COMPACT_SUFFIX
+        self._create(segment_tmp, index_tmp, pack_id)
+        entries = sorted(self._index.items(), key=lambda item: item[1][0])
+        with open(self.path, "rb") as source, open(segment_tmp, "ab") as segment, \
+                open(index_tmp, "ab") as log:
+            with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as old:
+                view = memoryview(old)
+                for key, (offset, length, crc) in entries:
+                    log.write(_RECORD.pack(key, segment.tell(), length, crc))
+                    segment.write(view[offset:offset + length])
+                view.release()
+            for f in (segment, log):
+                f.flush()
+                os.fsync(f.fileno())
+        # The lock stays held, so no other process opens the pack mid-swap
+        self._close_files()
+        # Index first: if we stop between the two, _open() finishes the swap
+        os.replace(index_tmp, self.index_path)
+        os.replace(segment_tmp, self.path)
+        self._index = {}
+        self._open()
+        return before - self._segment.tell()
+
+    def close(self):
+        """Close the files and release the lock; the map goes once no views are left"""
+        self._close_files()
+        self._unlock()
+
+    def _close_files(self):
+        self._map = None
+        for f in (getattr(self, "_segment", None), getattr(self, "_reader", None), getattr(self, "_log", None)):
+            if f is not None and not f.closed:
+                f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def benchmark(clips: int = 100_000, size: int = 12_000, path: str = "pack_bench"):
+    """Pack against one file per clip: write, read every clip, list the store"""
+    import random
+    import shutil
+    random.seed(50)
+    payload = os.urandom(size * 2)
+    keys = [pack_key(f"joke {i}") for i in range(clips)]
+    blobs = [memoryview(payload)[random.randrange(size):][:random.randint(size // 2, size)] for _ in range(64)]
+    os.makedirs(path, exist_ok=True)
+    try:
+        # The pack runs first; whichever store writes second pays for the
+        # first one's writeback on a slow disk
+        start = time.perf_counter()
+        with AudioPack(os.path.join(path, "jokes.pack")) as pack:
+            for i, key in enumerate(keys):
+                pack.put(key, blobs[i % 64])
+        print(f"pack   write {time.perf_counter() - start:7.2f}s", end="")
+        start = time.perf_counter()
+        with AudioPack(os.path.join(path, "jokes.pack")) as pack:
+            opened = time.perf_counter() - start
+            start = time.perf_counter()
+            total = sum(len(pack.get(key)) for key in keys)
+            print(f"   read {time.perf_counter() - start:7.2f}s   open+index {opened:6.3f}s")
+            for key in keys[::2]:
+                pack.discard(key)
+            start = time.perf_counter()
+            reclaimed = pack.compact()
+            print(f"compact {time.perf_counter() - start:6.2f}s   reclaimed {reclaimed / 2**20:.0f} MiB   {pack.stats()}")
+        shutil.rmtree(path)
+        os.makedirs(path)
+
+        start = time.perf_counter()
+        for i, key in enumerate(keys):
+            with open(os.path.join(path, f"joke_{i}.mp3"), "wb") as f:
+                f.write(blobs[i % 64])
+        print(f"files  write {time.perf_counter() - start:7.2f}s", end="")
+        start = time.perf_counter()
+        total = 0
+        for i in range(clips):
+            with open(os.path.join(path, f"joke_{i}.mp3"), "rb") as f:
+                total += len(f.read())
+        read = time.perf_counter() - start
+        start = time.perf_counter()
+        listed = len(os.listdir(path))
+        print(f"   read {read:7.2f}s   listdir {time.perf_counter() - start:6.3f}s ({listed:,} entries)")
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Packed audio archive")
+    parser.add_argument("pack", nargs="?", help="Pack to inspect or compact")
+    parser.add_argument("--compact", action="store_true", help="Reclaim dead clips")
+    parser.add_argument("--benchmark", type=int, metavar="CLIPS", help="Run the benchmark")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.benchmark)
+        return
+    if not args.pack:
+        parser.error("pack is required")
+    with AudioPack(args.pack) as pack:
+        if args.compact:
+            print(f"reclaimed {pack.compact():,} bytes")
+        print(pack.stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicate Detection for the Joke Generator
+MinHash signatures over character shingles catch jokes that differ only in
+punctuation, casing or a few words. Signatures keep 8 bits per hash (64
+bytes per joke) and are banded into an LSH index of sorted uint64 arrays,
+so a lookup touches a handful of candidates instead of the whole history.
+"""
+
+import re
+import random
+import time
+import zlib
+import argparse
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# Third-party imports with graceful fallbacks
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+NUM_PERM = 64
+BANDS = 16                 # 4 bytes per band, read as one uint32
+SHINGLE_SIZE = 5
+DEFAULT_THRESHOLD = 0.7
+SEED = 47
+
+_MASK64 = (1 << 64) - 1
+_rng = random.Random(SEED)
+# Multiply-shift hashing: the high 32 bits of (a * x + b) mod 2**64
+_A = [_rng.getrandbits(64) | 1 for _ in range(NUM_PERM)]
+_B = [_rng.getrandbits(64) for _ in range(NUM_PERM)]
+if NUMPY_AVAILABLE:
+    _A_NP = np.array(_A, dtype=np.uint64)
+    _B_NP = np.array(_B, dtype=np.uint64)
+_PUNCTUATION = re.compile(r"[^\w\s]+")
+_SPACES = re.compile(r"\s+")
+
+
+def normalize(text: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace"""
+    return _SPACES.sub(" ", _PUNCTUATION.sub("", text.lower())).strip()
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[int]:
+    """crc32 of every character size-gram of the normalized text"""
+    text = normalize(text)
+    if len(text) <= size:
+        return {zlib.crc32(text.encode())}
+    return {zlib.crc32(text[i:i + size].encode()) for i in range(len(text) - size + 1)}
+
+
+def signature(text: str, use_numpy: Optional[bool] = None) -> bytes:
+    """64-byte b-bit MinHash signature (low 8 bits of each minimum)"""
+    hashes = shingles(text)
+    if use_numpy is None:
+        use_numpy = NUMPY_AVAILABLE
+    if use_numpy:
+        values = np.fromiter(hashes, dtype=np.uint64, count=len(hashes))
+        mixed = (values[:, None] * _A_NP + _B_NP) >> np.uint64(32)
+        return (mixed.min(axis=0) & np.uint64(0xFF)).astype(np.uint8).tobytes()
+    return bytes(min(((a * h + b) & _MASK64) >> 32 for h in hashes) & 0xFF
+                 for a, b in zip(_A, _B))
+
+
+def similarity(first: bytes, second: bytes) -> float:
+    """Estimated Jaccard similarity of two signatures
+
+    Two 8-bit minimums also agree by chance 1 time in 256, so the raw match
+    rate is corrected for that.
+    """
+    matches = sum(a == b for a, b in zip(first, second))
+    chance = 1 / 256
+    return max(0.0, (matches / NUM_PERM - chance) / (1 - chance))
+
+
+class NearDuplicateIndex:
+    """LSH index over MinHash signatures, positions numbered from 0
+
+    Each band's 4 signature bytes form a 32-bit key. Every band keeps one
+    sorted array('Q') of (key << 32 | position), 8 bytes per entry, and new
+    entries wait in a small dict until the next merge.
+    """
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD):
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold must be in (0, 1]")
+        self.threshold = threshold
+        self._signatures = bytearray()
+        self._tables = [array("Q") for _ in range(BANDS)]
+        self._pending: List[Dict[int, List[int]]] = [{} for _ in range(BANDS)]
+        self._pending_count = 0
+
+    def __len__(self) -> int:
+        return len(self._signatures) // NUM_PERM
+
+    def signature_at(self, position: int) -> bytes:
+        return bytes(self._signatures[position * NUM_PERM:(position + 1) * NUM_PERM])
+
+    @staticmethod
+    def _band_keys(sig: bytes) -> array:
+        if len(sig) != NUM_PERM:
+            raise ValueError(f"signatures must be {NUM_PERM} bytes")
+        return array("I", sig)
+
+    def _stage(self, sig: bytes) -> int:
+        keys = self._band_keys(sig)
+        position = len(self)
+        self._signatures += sig
+        for band, key in enumerate(keys):
+            self._pending[band].setdefault(key, []).append(position)
+        self._pending_count += 1
+        return position
+
+    def add(self, sig: bytes) -> int:
+        """Store a signature, return its position"""
+        position = self._stage(sig)
+        # Merging costs O(n), so wait until the backlog is a fraction of n
+        if self._pending_count >= max(1024, len(self) // 8):
+            self._merge()
+        return position
+
+    def extend(self, signatures: Iterable[bytes]):
+        """Bulk load, with one sort per band at the end"""
+        if not NUMPY_AVAILABLE:
+            for sig in signatures:
+                self._stage(sig)
+            self._merge()
+            return
+        self._merge()
+        first = len(self)
+        for sig in signatures:
+            if len(sig) != NUM_PERM:
+                raise ValueError(f"signatures must be {NUM_PERM} bytes")
+            self._signatures += sig
+        keys = np.frombuffer(self._signatures, dtype=np.uint32)[first * BANDS:].reshape(-1, BANDS)
+        positions = np.arange(first, len(self), dtype=np.uint64)
+        for band in range(BANDS):
+            merged = np.concatenate((np.frombuffer(self._tables[band], dtype=np.uint64),
+                                     keys[:, band].astype(np.uint64) << np.uint64(32) | positions))
+            merged.sort()
+            self._tables[band] = array("Q", merged.tobytes())
+
+    def _merge(self):
+        for band, pending in enumerate(self._pending):
+            if not pending:
+                continue
+            new = [key << 32 | position for key, positions in pending.items() for position in positions]
+            if NUMPY_AVAILABLE:
+                merged = np.concatenate((np.frombuffer(self._tables[band], dtype=np.uint64),
+                                         np.array(new, dtype=np.uint64)))
+                merged.sort()
+                table = array("Q", merged.tobytes())
+            else:
+                table = array("Q", sorted(self._tables[band] + array("Q", new)))
+            self._tables[band] = table
+            pending.clear()
+        self._pending_count = 0
+
+    def candidates(self, sig: bytes) -> Set[int]:
+        """Positions sharing at least one band with sig"""
+        found: Set[int] = set()
+        for band, key in enumerate(self._band_keys(sig)):
+            table = self._tables[band]
+            low = key << 32
+            index = bisect_left(table, low)
+            while index < len(table) and table[index] >> 32 == key:
+                found.add(table[index] & 0xFFFFFFFF)
+                index += 1
+            found.update(self._pending[band].get(key, ()))
+        return found
+
+    def query(self, sig: bytes) -> Optional[Tuple[int, float]]:
+        """(position, similarity) of the closest entry at or above threshold"""
+        best = None
+        for position in self.candidates(sig):
+            score = similarity(sig, self.signature_at(position))
+            if score >= self.threshold and (best is None or score > best[1]):
+                best = (position, score)
+        return best
+
+    def memory_usage(self) -> int:
+        """Bytes held by signatures and band tables (pending entries excluded)"""
+        return len(self._signatures) + sum(len(table) * table.itemsize for table in self._tables)
+
+
+def benchmark(size: int = 200_000, queries: int = 2000):
+    """Index build and lookup against a linear scan over all signatures"""
+    random.seed(SEED)
+    words = ["".join(random.choices("abcdefghijklmnopqrstuvwxyz", k=random.randint(2, 8)))
+             for _ in range(20_000)]
+    texts = [" ".join(random.choices(words, k=random.randint(8, 20))) + random.choice("?!.")
+             for _ in range(size)]
+
+    start = time.perf_counter()
+    signatures = [signature(text) for text in texts]
+    print(f"signatures   {time.perf_counter() - start:7.2f}s for {size:,} jokes")
+    index = NearDuplicateIndex()
+    start = time.perf_counter()
+    index.extend(signatures)
+    print(f"index build  {time.perf_counter() - start:7.2f}s   {index.memory_usage() / 2**20:.1f} MiB")
+
+    # Half the probes are reworded copies, half are new text
+    probes = []
+    for text in random.sample(texts, queries // 2):
+        tokens = text.split()
+        tokens[random.randrange(len(tokens))] = random.choice(words)
+        probes.append((" ".join(tokens)).upper().replace(" ", ", ", 1))
+    probes += [" ".join(random.choices(words, k=15)) for _ in range(queries - len(probes))]
+    probe_signatures = [signature(text) for text in probes]
+
+    start = time.perf_counter()
+    hits = sum(index.query(sig) is not None for sig in probe_signatures)
+    lsh = time.perf_counter() - start
+    print(f"LSH query    {lsh / queries * 1e6:7.1f}us per joke   {hits:,} near-duplicates of {queries:,}")
+
+    scanned = probe_signatures[:max(1, queries // 100)]
+    start = time.perf_counter()
+    for sig in scanned:
+        max(similarity(sig, index.signature_at(position)) for position in range(len(index)))
+    linear = (time.perf_counter() - start) / len(scanned)
+    print(f"linear scan  {linear * 1e6:7.1f}us per joke")
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="MinHash/LSH near-duplicate index")
+    parser.add_argument("--size", type=int, default=200_000)
+    parser.add_argument("--queries", type=int, default=2000)
+    args = parser.parse_args()
+    benchmark(args.size, args.queries)
+
+
+if __name__ == "__main__":
+    main()